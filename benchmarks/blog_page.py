@@ -0,0 +1,75 @@
+"""
+Cost of rendering a blog page with separate calls and with ``GET /blogs/{id}/full``.
+
+Creates a blog with comments and a like, then times the three calls a page used to
+need (content, first comment page, likers) against the single ``/full`` call, and
+counts the SQL statements each sends. The blog is deleted afterwards.
+
+Usage: ``python -m benchmarks.blog_page [--comments 150] [--size 20] [--requests 300]``
+"""
+
+import argparse
+import asyncio
+import uuid
+
+from sqlalchemy import delete, event
+
+from benchmarks.common import api_client, mean_seconds
+from database.db import async_session, engine
+from src.api.v1.blog.models.blogs import BlogModel
+
+
+async def main(comments: int, size: int, requests: int) -> None:
+    statements = 0
+
+    def on_execute(*_args) -> None:
+        nonlocal statements
+        statements += 1
+
+    async with api_client() as client:
+        response = await client.post(
+            "/blogs/",
+            json={"name": f"Benchmark {uuid.uuid4().hex}", "content": "Body " * 400},
+        )
+        response.raise_for_status()
+        blog_id = response.json()["data"]["id"]
+
+        event.listen(engine.sync_engine, "before_cursor_execute", on_execute)
+        try:
+            for i in range(comments):
+                await client.post(
+                    f"/blogs/{blog_id}/comments", json={"content": f"Comment {i} " * 10}
+                )
+            await client.post(f"/blogs/{blog_id}/like")
+
+            async def separate_calls() -> None:
+                await client.get(f"/blogs/{blog_id}/content")
+                await client.get(f"/blogs/{blog_id}/comments", params={"size": size})
+                await client.get(f"/blogs/{blog_id}/like", params={"size": size})
+
+            async def full() -> None:
+                await client.get(f"/blogs/{blog_id}/full", params={"size": size})
+
+            for name, call in (("separate calls", separate_calls), ("/full", full)):
+                for _ in range(20):
+                    await call()
+                statements = 0
+                seconds = await mean_seconds(call, requests, warmup=0)
+                print(
+                    f"{name:>14}: {seconds * 1000:.2f} ms, "
+                    f"{statements / requests:.1f} statements per page"
+                )
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", on_execute)
+            async with async_session() as session:
+                await session.execute(delete(BlogModel).where(BlogModel.id == blog_id))
+                await session.commit()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--comments", type=int, default=150)
+    parser.add_argument("--size", type=int, default=20)
+    parser.add_argument("--requests", type=int, default=300)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.comments, arguments.size, arguments.requests))
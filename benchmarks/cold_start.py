@@ -0,0 +1,68 @@
+"""
+Latency of the first requests served by a freshly started application.
+
+Starts the application, then sends waves of GETs of a blog, its comments, the blog list
+and the likers of the blog, a few at a time, and prints the p50 and p99 latency of each
+wave. Run it again with ``DATABASE_POOL_WARMUP=0`` to compare with cold pools.
+
+Usage: ``python -m benchmarks.cold_start [--waves 3] [--concurrency 4]``
+"""
+
+import argparse
+import asyncio
+import time
+
+import httpx
+from sqlalchemy import select
+
+from benchmarks.common import api_client
+from database.db import async_session
+from src.api.v1.blog.models.blogs import BlogModel
+
+
+async def timed_get(client: httpx.AsyncClient, path: str) -> float:
+    started = time.perf_counter()
+    response = await client.get(path)
+    response.raise_for_status()
+    return time.perf_counter() - started
+
+
+async def main(waves: int, concurrency: int, repeat: int) -> None:
+    async with async_session() as session:
+        blog_id = await session.scalar(
+            select(BlogModel.id).where(BlogModel.deleted_at.is_(None)).limit(1)
+        )
+    if blog_id is None:
+        raise SystemExit("The benchmark needs at least one blog.")
+
+    paths = [
+        f"/blogs/{blog_id}",
+        f"/blogs/{blog_id}/comments",
+        "/blogs/",
+        f"/blogs/{blog_id}/like",
+    ] * repeat
+
+    started = time.perf_counter()
+    async with api_client() as client:
+        print(f"startup: {(time.perf_counter() - started) * 1000:.0f} ms")
+
+        for wave in range(waves):
+            latencies: list[float] = []
+            for i in range(0, len(paths), concurrency):
+                latencies += await asyncio.gather(
+                    *(timed_get(client, path) for path in paths[i : i + concurrency])
+                )
+            latencies.sort()
+            print(
+                f"wave {wave}: p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+                f"p99 {latencies[-1] * 1000:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--waves", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.waves, arguments.concurrency, arguments.repeat))
@@ -0,0 +1,74 @@
+"""
+Helpers shared by the benchmarks.
+
+The benchmarks run the application in-process against the configured database, which
+needs at least one registered user. Run them from the project root, e.g.
+``python -m benchmarks.read_pool_hold``.
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Awaitable, Callable
+
+import httpx
+from sqlalchemy import select
+
+from database.db import async_session
+from server import create_app
+from src.api.enums import TokenTypeEnum
+from src.api.v1.user.models.user import UserModel
+from src.core.auth import create_token
+
+
+@asynccontextmanager
+async def api_client(debug: bool = False) -> AsyncIterator[httpx.AsyncClient]:
+    """
+    Start the application and open a client authenticated as the first user.
+
+    Args:
+        debug (bool): Create the application in debug mode.
+
+    Yields:
+        httpx.AsyncClient: A client of the ``/api/v1`` routes.
+    """
+    app = create_app(debug=debug)
+    async with app.router.lifespan_context(app):
+        async with async_session() as session:
+            user = await session.scalar(select(UserModel).limit(1))
+        if user is None:
+            raise SystemExit("The benchmarks need at least one registered user.")
+
+        token = create_token(
+            email=user.email,
+            token_type=TokenTypeEnum.ACCESS,
+            token_version=user.token_version,
+        )
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app),
+            base_url="http://benchmark/api/v1",
+            headers={"Authorization": f"Bearer {token}"},
+        ) as client:
+            yield client
+
+
+async def mean_seconds(
+    call: Callable[[], Awaitable[object]], repeat: int, warmup: int = 20
+) -> float:
+    """
+    Mean duration of sequential calls, after some warm-up calls.
+
+    Args:
+        call (Callable[[], Awaitable[object]]): The call to time.
+        repeat (int): Number of timed calls.
+        warmup (int): Number of calls made first and not timed.
+
+    Returns:
+        float: The mean duration in seconds.
+    """
+    for _ in range(warmup):
+        await call()
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        await call()
+    return (time.perf_counter() - started) / repeat
@@ -0,0 +1,61 @@
+"""
+How long read requests hold pooled connections.
+
+Sends concurrent requests to a read route and records, for every connection checked
+out of the primary pool meanwhile, the time until it is checked back in. The default
+route is not served from the response cache.
+
+Usage: ``python -m benchmarks.read_pool_hold [--path /blogs/cursor] [--requests 200]``
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+from sqlalchemy import event
+
+from benchmarks.common import api_client
+from database.db import engine
+
+
+async def main(path: str, requests: int, size: int) -> None:
+    holds: list[float] = []
+    checked_out: dict[int, float] = {}
+
+    def on_checkout(_dbapi_connection, record, _proxy) -> None:
+        checked_out[id(record)] = time.perf_counter()
+
+    def on_checkin(_dbapi_connection, record) -> None:
+        if id(record) in checked_out:
+            holds.append(time.perf_counter() - checked_out.pop(id(record)))
+
+    async with api_client() as client:
+        await client.get(path, params={"size": size})
+
+        event.listen(engine.sync_engine, "checkout", on_checkout)
+        event.listen(engine.sync_engine, "checkin", on_checkin)
+        started = time.perf_counter()
+        responses = await asyncio.gather(
+            *(client.get(path, params={"size": size}) for _ in range(requests))
+        )
+        elapsed = time.perf_counter() - started
+
+    if not holds:
+        raise SystemExit("No connection was checked out; is the route cached?")
+
+    holds.sort()
+    print(f"statuses: {sorted({response.status_code for response in responses})}")
+    print(f"wall time: {elapsed:.2f} s for {requests} requests")
+    print(f"checkouts: {len(holds)}")
+    print(f"mean hold: {statistics.fmean(holds) * 1000:.2f} ms")
+    print(f"p95 hold: {holds[int(len(holds) * 0.95)] * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--path", default="/blogs/cursor")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--size", type=int, default=100)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.path, arguments.requests, arguments.size))
@@ -0,0 +1,95 @@
+"""
+Cost of serializing responses with the default route class and ``SerializedRoute``.
+
+Times in-process GET requests of a route returning a page of blogs, once built from
+response models and once from ORM objects, without touching the database.
+
+Usage: ``python -m benchmarks.response_serialization [--items 100] [--requests 10000]``
+"""
+
+import argparse
+import asyncio
+import uuid
+from datetime import datetime, timezone
+
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+from fastapi_pagination import Page
+
+from benchmarks.common import mean_seconds
+from src.api.v1.blog.models.blogs import BlogModel
+from src.api.v1.blog.schemas.response import BlogResponse
+from src.core.utils.routing import SerializedRoute
+from src.core.utils.schema import BaseResponse
+
+
+def build_app(route_class: type[APIRoute], items: list) -> FastAPI:
+    router = APIRouter(route_class=route_class)
+
+    @router.get("/blogs")
+    async def blogs() -> BaseResponse[Page[BlogResponse]]:
+        return BaseResponse(
+            data=Page(items=items, total=len(items), page=1, size=len(items), pages=1)
+        )
+
+    app = FastAPI()
+    app.include_router(router)
+    return app
+
+
+async def get(app: FastAPI) -> bytes:
+    body: list[bytes] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.body":
+            body.append(message["body"])
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/blogs",
+        "headers": [],
+        "query_string": b"",
+        "root_path": "",
+        "scheme": "http",
+        "server": ("benchmark", 80),
+    }
+    await app(scope, receive, send)
+    return b"".join(body)
+
+
+async def main(items: int, requests: int) -> None:
+    now = datetime.now(timezone.utc)
+    rows = [
+        dict(
+            id=uuid.uuid4(),
+            name=f"Blog {i}",
+            author_id=uuid.uuid4(),
+            like_count=i,
+            comment_count=i,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(items)
+    ]
+    sources = {
+        "models": [BlogResponse(**row) for row in rows],
+        "orm": [BlogModel(**row) for row in rows],
+    }
+
+    for source, data in sources.items():
+        for route_class in (APIRoute, SerializedRoute):
+            app = build_app(route_class, data)
+            seconds = await mean_seconds(lambda: get(app), requests, warmup=200)
+            print(f"{source:>6} {route_class.__name__:>15}: {seconds * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=10000)
+    arguments = parser.parse_args()
+    asyncio.run(main(arguments.items, arguments.requests))
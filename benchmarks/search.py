@@ -0,0 +1,191 @@
+"""
+Latency of the full-text blog search over a large corpus.
+
+``seed`` inserts a synthetic corpus written by a dedicated benchmark user: blogs of 40
+to 80 words drawn from a 20k-word vocabulary with Zipf-like frequencies, 5% of them
+soft-deleted. ``run`` then searches terms of decreasing selectivity and prints the
+matches, the median time of the first and of the fifth page, and the time of the
+``ILIKE`` scan the search replaced. ``drop`` deletes the corpus.
+
+Seeding a million blogs takes several minutes and about 1.5 GB; point
+``DATABASE_NAME`` at a scratch database.
+
+Usage: ``python -m benchmarks.search {seed [--blogs 1000000],run,drop}``
+"""
+
+import argparse
+import asyncio
+import hashlib
+import statistics
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from sqlalchemy import delete, func, select, text
+
+from database.db import async_session, engine, primary_read_session
+from src.api.v1.blog.models import BlogModel
+from src.api.v1.blog.models.blogs import SEARCH_CONFIG
+from src.api.v1.blog.services.blog import BlogService
+from src.api.v1.user.enums import RoleEnum
+from src.api.v1.user.models import RoleModel, UserModel
+from src.core.utils.pagination import CursorParams
+
+AUTHOR_EMAIL = "search-benchmark@example.com"
+BATCH = 100_000
+
+# Word k of the vocabulary, with k drawn as exp(uniform(0, 9.9)) so small k are the
+# most frequent. Referencing g in the subquery draws new words for every blog.
+INSERT_BLOGS = text(
+    """
+    INSERT INTO blogs (id, name, content, author_id, created_at, updated_at, deleted_at)
+    SELECT gen_random_uuid(), 'Benchmark ' || g,
+        (SELECT string_agg(substr(md5(k::text), 1, 4 + k % 5) || chr(97 + k % 26), ' ')
+         FROM (SELECT 1 + floor(exp(random() * 9.9))::int AS k
+               FROM generate_series(1, 40 + g % 40) AS s WHERE s > -g) AS words),
+        :author_id, now() - make_interval(secs => g), now(),
+        CASE WHEN g % 20 = 0 THEN now() END
+    FROM generate_series(CAST(:first AS integer), CAST(:last AS integer)) AS g
+    """
+)
+
+ILIKE_SCAN = text(
+    """
+    SELECT id FROM blogs
+    WHERE deleted_at IS NULL AND (name ILIKE :pattern OR content ILIKE :pattern)
+    ORDER BY created_at DESC, id DESC LIMIT 21
+    """
+)
+
+
+def word(k: int) -> str:
+    """Word ``k`` of the vocabulary, as the seeding query builds it."""
+    return hashlib.md5(str(k).encode()).hexdigest()[: 4 + k % 5] + chr(97 + k % 26)
+
+
+async def median_ms(call: Callable[[], Awaitable[object]], repeat: int) -> float:
+    await call()
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await call()
+        durations.append((time.perf_counter() - started) * 1000)
+    return statistics.median(durations)
+
+
+async def seed(blogs: int) -> None:
+    async with async_session() as session:
+        if await session.scalar(select(UserModel.id).filter_by(email=AUTHOR_EMAIL)):
+            raise SystemExit("The corpus exists; drop it first.")
+
+        role = await session.scalar(select(RoleModel).limit(1))
+        if role is None:
+            role = RoleModel.create(name=RoleEnum.USER)
+            session.add(role)
+            await session.flush()
+        author = UserModel.create(
+            email=AUTHOR_EMAIL, password=uuid.uuid4().hex, role_id=role.id
+        )
+        session.add(author)
+        await session.commit()
+
+    started = time.perf_counter()
+    for first in range(1, blogs + 1, BATCH):
+        last = min(first + BATCH - 1, blogs)
+        async with engine.begin() as connection:
+            await connection.execute(
+                INSERT_BLOGS, {"author_id": author.id, "first": first, "last": last}
+            )
+        print(f"{last} blogs, {time.perf_counter() - started:.0f} s")
+
+    async with engine.connect() as connection:
+        connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+        await connection.execute(text("VACUUM ANALYZE blogs"))
+
+
+async def run(repeat: int) -> None:
+    # The ILIKE scan stops at the first page of matches, so it is only slow, and only
+    # timed, for selective terms.
+    terms = [
+        ("rare", word(9000), True),
+        ("two terms", f"{word(60)} {word(400)}", False),
+        ("no match", "zzzzqqq", True),
+        ("mid", word(60), False),
+        ("common", word(3), False),
+    ]
+
+    print(f"{'term':<10} {'matches':>8} {'page 1':>9} {'page 5':>9} {'ILIKE scan':>11}")
+    async with primary_read_session() as session:
+        service = BlogService(session=session, read_session=session)
+        for label, query, scan in terms:
+            matches = await session.scalar(
+                select(func.count()).where(
+                    BlogModel.deleted_at.is_(None),
+                    BlogModel.search_vector.bool_op("@@")(
+                        func.websearch_to_tsquery(SEARCH_CONFIG, query)
+                    ),
+                )
+            )
+            first_page = await median_ms(
+                lambda: service.search(query, CursorParams(size=20)), repeat
+            )
+
+            later_page = "-"
+            cursor = (await service.search(query, CursorParams(size=20))).next_cursor
+            if cursor:
+                for _ in range(3):
+                    page = await service.search(
+                        query, CursorParams(size=20, cursor=cursor)
+                    )
+                    cursor = page.next_cursor or cursor
+                params = CursorParams(size=20, cursor=cursor)
+                later_ms = await median_ms(
+                    lambda: service.search(query, params), repeat
+                )
+                later_page = f"{later_ms:.1f}ms"
+
+            scan_ms = "-"
+            if scan:
+                pattern = {"pattern": f"%{query}%"}
+                scanned = await median_ms(
+                    lambda: session.execute(ILIKE_SCAN, pattern), repeat=1
+                )
+                scan_ms = f"{scanned:.0f}ms"
+
+            print(
+                f"{label:<10} {matches:>8,} {first_page:>7.1f}ms {later_page:>9} "
+                f"{scan_ms:>11}"
+            )
+
+
+async def drop() -> None:
+    async with async_session() as session:
+        author_id = await session.scalar(
+            select(UserModel.id).filter_by(email=AUTHOR_EMAIL)
+        )
+        if author_id is None:
+            return
+        await session.execute(delete(BlogModel).where(BlogModel.author_id == author_id))
+        await session.execute(delete(UserModel).where(UserModel.id == author_id))
+        await session.commit()
+
+
+async def main(arguments: argparse.Namespace) -> None:
+    try:
+        if arguments.command == "seed":
+            await seed(arguments.blogs)
+        elif arguments.command == "run":
+            await run(arguments.repeat)
+        else:
+            await drop()
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("seed").add_argument("--blogs", type=int, default=1_000_000)
+    commands.add_parser("run").add_argument("--repeat", type=int, default=5)
+    commands.add_parser("drop")
+    asyncio.run(main(parser.parse_args()))
@@ -41,6 +41,17 @@ class DatabaseSettings(BaseSettings):
 
         return f"postgresql+asyncpg://{database_user}:{database_password}@{database_host}:{database_port}/{database_name}"
 
+    # Optional read replica. Reads use the primary when it is not set.
+    DATABASE_REPLICA_URL: str | None = None
+    # Replica lag, in seconds, beyond which reads go to the primary.
+    DATABASE_REPLICA_MAX_LAG: float = 5.0
+    DATABASE_REPLICA_LAG_CHECK_INTERVAL: float = 1.0
+    # Minimum time a client reads from the primary after its own write. The time of the
+    # write is kept in a cookie of the client.
+    DATABASE_READ_YOUR_WRITES_SECONDS: float = 2.0
+    # Connections opened and primed with the hot statements when a worker starts
+    DATABASE_POOL_WARMUP: int = 5
+
 
 class JWTSettings(BaseSettings):
     model_config = SettingsConfigDict(extra='allow', env_file='./.env', env_file_encoding='utf-8')
@@ -48,6 +59,7 @@ class JWTSettings(BaseSettings):
     JWT_ALGORITHM: str | None = None
     ACCESS_TOKEN_EXP: int | None = None
     REFRESH_TOKEN_EXP: int | None = None
+    JWT_CLAIMS_PRINCIPAL: bool = False
 
 
 class BasicAuthSettings(BaseSettings):
@@ -66,12 +78,79 @@ class AppSettings(BaseSettings):
     APP_PORT: int | None = None
     CONTAINER_PORT: int | None = None
 
+    # Production server
+    APP_WORKERS: int = 1
+    APP_LOOP: str = "uvloop"
+    APP_HTTP: str = "httptools"
+    APP_KEEPALIVE_TIMEOUT: int = 5
+    APP_BACKLOG: int = 2048
+    APP_GRACEFUL_SHUTDOWN_TIMEOUT: int = 30
+    APP_ACCESS_LOG: bool = False
+
+    # Debug mode reports statements run more than this many times in one request
+    APP_REPEATED_QUERY_THRESHOLD: int = 5
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(extra='allow', env_file='./.env', env_file_encoding='utf-8')
+
+    PRINCIPAL_CACHE_MAXSIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: int = 60
+    # Blog summaries served by GET /blogs/{blog_id}
+    BLOG_CACHE_MAXSIZE: int = 10000
+    BLOG_CACHE_TTL: int = 60
+    BLOG_CACHE_NEGATIVE_TTL: int = 2
+    # Encoded responses of the hot read routes, evicted by the writes they depend on
+    RESPONSE_CACHE_MAXSIZE: int = 10000
+    RESPONSE_CACHE_TTL: int = 60
+
+
+class HashingSettings(BaseSettings):
+    model_config = SettingsConfigDict(extra='allow', env_file='./.env', env_file_encoding='utf-8')
+
+    HASHING_EXECUTOR: str = "thread"
+    HASHING_WORKERS: int = 4
+    HASHING_MAX_QUEUE: int = 64
+
+
+class MetricsSettings(BaseSettings):
+    model_config = SettingsConfigDict(extra='allow', env_file='./.env', env_file_encoding='utf-8')
+
+    # Shared directory for the metrics of each worker, None to keep them in memory
+    METRICS_DIR: str | None = None
+    METRICS_FLUSH_INTERVAL: float = 5.0
+
+
+class LoggingSettings(BaseSettings):
+    model_config = SettingsConfigDict(extra='allow', env_file='./.env', env_file_encoding='utf-8')
 
-class Settings(DatabaseSettings, JWTSettings, BasicAuthSettings, AppSettings):
+    LOG_LEVEL: str = "INFO"
+    # Either "text" or "json"
+    LOG_FORMAT: str = "text"
+    # Fraction of the successful GET requests written to the access log
+    LOG_ACCESS_SAMPLE_RATE: float = 0.1
+    # Requests slower than this are always written to the access log
+    LOG_ACCESS_SLOW_SECONDS: float = 1.0
+
+
+class Settings(
+    DatabaseSettings,
+    JWTSettings,
+    BasicAuthSettings,
+    AppSettings,
+    CacheSettings,
+    HashingSettings,
+    MetricsSettings,
+    LoggingSettings,
+):
     pass
 
 database_settings = DatabaseSettings()
 jwt_settings = JWTSettings()
 basic_auth_settings = BasicAuthSettings()
 app_settings = AppSettings()
+cache_settings = CacheSettings()
+hashing_settings = HashingSettings()
+metrics_settings = MetricsSettings()
+logging_settings = LoggingSettings()
 settings = Settings()
@@ -1,12 +1,62 @@
-from typing import AsyncIterator
+import asyncio
+import time
+from contextlib import AsyncExitStack
+from math import ceil
+from typing import Any, AsyncIterator, Awaitable, Callable
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from config.config import database_settings
+from src.core.metrics import MetricsRegistry, labels, metrics
+from src.core.utils import core_logger
+from src.core.utils.timing import after_cursor_execute, before_cursor_execute
+
+metrics.describe(
+    "db_pool_wait_seconds",
+    "histogram",
+    "Time to get a connection from the pool, connecting included.",
+)
+metrics.describe("db_pool_size", "gauge", "Connections kept open by the pool.")
+metrics.describe("db_pool_checked_out", "gauge", "Connections in use.")
+metrics.describe("db_pool_overflow", "gauge", "Connections open beyond the pool size.")
+
+
+class MeteredQueuePool(AsyncAdaptedQueuePool):
+    """
+    Connection pool recording how long every checkout waits for a connection.
+
+    The histogram is labelled with the ``pool_logging_name`` of the engine.
+    """
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe(
+                "db_pool_wait_seconds",
+                time.perf_counter() - started,
+                labels(pool=self.logging_name),
+            )
+
 
 engine = create_async_engine(
     str(database_settings.DATABASE_URL),
+    poolclass=MeteredQueuePool,
+    pool_logging_name="primary",
     pool_pre_ping=True,
     pool_recycle=3600,
     pool_size=10,
@@ -16,10 +66,228 @@ engine = create_async_engine(
 async_session = async_sessionmaker(engine, expire_on_commit=False)
 
 
-async def db_session() -> AsyncIterator[AsyncSession]:
+class ReadOnlySession(AsyncSession):
+    """
+    Session for reads that holds a connection only while a statement runs.
+
+    Its engine runs in autocommit mode, so no BEGIN/COMMIT is issued, and the connection
+    is released back to the pool as soon as the rows of each statement are buffered,
+    instead of being held for the rest of the request. Returned objects stay usable but
+    are detached, so relationships must be loaded eagerly. It must not be used to write.
+
+    Only :meth:`execute`, :meth:`scalar`, :meth:`scalars` and :meth:`get` are meant to
+    be used. Streaming reads would need the connection while the rows are consumed, so
+    :meth:`stream` and :meth:`stream_scalars` raise.
+    """
+
+    async def execute(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().execute(*args, **kwargs)
+        finally:
+            await self.close()
+
+    async def scalar(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().scalar(*args, **kwargs)
+        finally:
+            await self.close()
+
+    async def scalars(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().scalars(*args, **kwargs)
+        finally:
+            await self.close()
+
+    async def get(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return await super().get(*args, **kwargs)
+        finally:
+            await self.close()
+
+    async def stream(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError("Read sessions buffer rows; use execute instead.")
+
+    async def stream_scalars(self, *args: Any, **kwargs: Any) -> Any:
+        raise NotImplementedError("Read sessions buffer rows; use scalars instead.")
+
+
+def read_sessionmaker(bind: AsyncEngine) -> async_sessionmaker[ReadOnlySession]:
+    """
+    Build a factory of :class:`ReadOnlySession` on an autocommit copy of the engine.
+
+    The copy shares the pool of the engine.
+
+    Args:
+        bind (AsyncEngine): The engine to read from.
+
+    Returns:
+        async_sessionmaker[ReadOnlySession]: The session factory.
+    """
+    return async_sessionmaker(
+        bind.execution_options(isolation_level="AUTOCOMMIT"),
+        class_=ReadOnlySession,
+        expire_on_commit=False,
+    )
+
+
+primary_read_session = read_sessionmaker(engine)
+
+replica_engine = (
+    create_async_engine(
+        database_settings.DATABASE_REPLICA_URL,
+        poolclass=MeteredQueuePool,
+        pool_logging_name="replica",
+        pool_pre_ping=True,
+        pool_recycle=3600,
+        pool_size=10,
+        max_overflow=20,
+    )
+    if database_settings.DATABASE_REPLICA_URL
+    else None
+)
+
+replica_read_session = read_sessionmaker(replica_engine) if replica_engine else None
+
+# Count and time the statements of every request, see ServerTimingMiddleware.
+for _engine in filter(None, (engine, replica_engine)):
+    event.listen(_engine.sync_engine, "before_cursor_execute", before_cursor_execute)
+    event.listen(_engine.sync_engine, "after_cursor_execute", after_cursor_execute)
+
+
+@metrics.collector
+def collect_pool_metrics(registry: MetricsRegistry) -> None:
+    for bind in filter(None, (engine, replica_engine)):
+        pool = bind.pool
+        label_values = labels(pool=pool.logging_name)
+        registry.set("db_pool_size", pool.size(), label_values)
+        registry.set("db_pool_checked_out", pool.checkedout(), label_values)
+        registry.set("db_pool_overflow", max(pool.overflow(), 0), label_values)
+
+
+# Seconds the replica is behind the primary. A replica that has replayed everything it
+# received is not lagging even if the primary has been idle for a while, and a server
+# that is not in recovery reports NULL for both positions.
+REPLICA_LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(
+            EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0
+        )
+    END
+    """
+)
+
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Cookie holding the time of the last write of a client, see ReadYourWritesMiddleware.
+READ_YOUR_WRITES_COOKIE = "db_written_at"
+
+
+class ReplicaRouter:
+    """
+    Decides whether a read can be served by the read replica.
+
+    Reads go to the primary when no replica is configured, when the replica cannot be
+    reached or lags more than ``max_lag`` seconds, and for clients that wrote recently.
+    A client keeps reading from the primary for ``read_your_writes_seconds`` after its
+    own write, or for the current replica lag if that is longer.
+
+    The time of a client's last write travels with its requests, in the
+    :data:`READ_YOUR_WRITES_COOKIE` cookie, so it holds whichever worker serves them.
+
+    Attributes:
+        lag (float | None): Last measured replica lag in seconds, None when unknown.
+    """
+
+    def __init__(
+        self,
+        engine: AsyncEngine | None,
+        max_lag: float,
+        lag_check_interval: float,
+        read_your_writes_seconds: float,
+    ) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            engine (AsyncEngine | None): The replica engine, if any.
+            max_lag (float): Replica lag in seconds beyond which reads use the primary.
+            lag_check_interval (float): Seconds between two lag measurements.
+            read_your_writes_seconds (float): Minimum seconds a client reads from the
+                primary after its own write.
+        """
+        self.engine = engine
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.read_your_writes_seconds = read_your_writes_seconds
+        self.lag: float | None = None
+        self._checked_at = float("-inf")
+
+    @property
+    def sticky_seconds(self) -> float:
+        """
+        Longest time a client can be kept on the primary after a write.
+        """
+        return self.read_your_writes_seconds + self.max_lag
+
+    async def replica_lag(self) -> float | None:
+        """
+        Return the replica lag, measuring it at most once per ``lag_check_interval``.
+
+        Returns:
+            float | None: The lag in seconds, or None if the replica cannot be reached.
+        """
+        now = time.monotonic()
+        if now - self._checked_at >= self.lag_check_interval:
+            self._checked_at = now
+            try:
+                async with self.engine.connect() as connection:
+                    self.lag = float(await connection.scalar(REPLICA_LAG_QUERY))
+            except (OSError, SQLAlchemyError) as error:
+                self.lag = None
+                core_logger.warning("Read replica unavailable: %s", error)
+
+        return self.lag
+
+    async def use_replica(self, written_at: float | None) -> bool:
+        """
+        Whether the reads of a client can be served by the replica.
+
+        Args:
+            written_at (float | None): Unix time of the client's last write, if known.
+
+        Returns:
+            bool: True to read from the replica, False to read from the primary.
+        """
+        if self.engine is None:
+            return False
+
+        lag = await self.replica_lag()
+        if lag is None or lag > self.max_lag:
+            return False
+
+        if written_at is not None:
+            return time.time() - written_at >= max(self.read_your_writes_seconds, lag)
+
+        return True
+
+
+replica_router = ReplicaRouter(
+    engine=replica_engine,
+    max_lag=database_settings.DATABASE_REPLICA_MAX_LAG,
+    lag_check_interval=database_settings.DATABASE_REPLICA_LAG_CHECK_INTERVAL,
+    read_your_writes_seconds=database_settings.DATABASE_READ_YOUR_WRITES_SECONDS,
+)
+
+
+async def db_session(request: Request) -> AsyncIterator[AsyncSession]:
     """
     Database Session Generator.
 
+    Once a write request commits, the client is routed to the primary for its next reads,
+    see :class:`ReadYourWritesMiddleware`.
+
     :return: A database session.
     """
     async with async_session() as session:  # type: AsyncSession
@@ -30,6 +298,145 @@ async def db_session() -> AsyncIterator[AsyncSession]:
                 await session.rollback()
                 raise
 
+    if request.method not in SAFE_METHODS and replica_router.engine is not None:
+        request.state.written_at = time.time()
+
+
+async def db_read_session(request: Request) -> AsyncIterator[AsyncSession]:
+    """
+    Read-only Database Session Generator.
+
+    The session is bound to the read replica when one is configured, it is caught up
+    enough, the client did not write recently and the request does not read from the
+    primary, see :func:`read_from_primary`; otherwise to the primary. Either way it runs
+    in autocommit mode and only holds a connection while a statement runs.
+
+    :return: A database session meant for reads only.
+    """
+    factory = (
+        replica_read_session
+        if not getattr(request.state, "read_from_primary", False)
+        and await replica_router.use_replica(written_at(request))
+        else primary_read_session
+    )
+
+    async with factory() as session:  # type: ReadOnlySession
+        yield session
+
+
+def read_from_primary(request: Request) -> None:
+    """
+    Serve the reads of a request from the primary, whatever the replica lag.
+
+    For responses shared with other clients, such as cached ones, which must not hold
+    data the replica has not caught up with yet. Call it before the dependencies of the
+    request are solved.
+
+    Args:
+        request (Request): The request.
+    """
+    request.state.read_from_primary = True
+
+
+def written_at(request: Request) -> float | None:
+    """
+    Time of the last write of the client sending a request, from its cookie.
+
+    Args:
+        request (Request): The request.
+
+    Returns:
+        float | None: The Unix time, or None when the cookie is missing or malformed.
+    """
+    try:
+        return float(request.cookies[READ_YOUR_WRITES_COOKIE])
+    except (KeyError, ValueError):
+        return None
+
+
+class ReadYourWritesMiddleware:
+    """
+    ASGI middleware handing clients the time of their last write in a cookie.
+
+    :func:`db_session` records the time once a write request commits, before the
+    response starts. The cookie expires once the client may read from the replica
+    again, and is sent back on every request, whichever worker serves it.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            state = scope.get("state") or {}
+            if message["type"] == "http.response.start" and "written_at" in state:
+                MutableHeaders(scope=message).append(
+                    "Set-Cookie",
+                    f"{READ_YOUR_WRITES_COOKIE}={state['written_at']:.6f}; "
+                    f"Max-Age={ceil(replica_router.sticky_seconds)}; Path=/; "
+                    "HttpOnly; SameSite=Lax",
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+async def warm_up_pool(
+    bind: AsyncEngine,
+    connections: int,
+    prime: Callable[[AsyncConnection], Awaitable[None]],
+) -> int:
+    """
+    Open pool connections ahead of the first requests and prime each of them.
+
+    All the connections are checked out at the same time, so they are distinct, and
+    returned to the pool afterwards. Connections that fail to open or to prime are
+    logged and skipped.
+
+    Args:
+        bind (AsyncEngine): The engine whose pool is warmed up.
+        connections (int): Number of connections to open, capped to the pool size.
+        prime (Callable[[AsyncConnection], Awaitable[None]]): Runs the statements to
+            prepare on a connection.
+
+    Returns:
+        int: The number of connections warmed up.
+    """
+    async with AsyncExitStack() as stack:
+        checked_out = await asyncio.gather(
+            *(
+                stack.enter_async_context(bind.connect())
+                for _ in range(min(connections, bind.pool.size()))
+            ),
+            return_exceptions=True,
+        )
+        opened = [
+            connection
+            for connection in checked_out
+            if isinstance(connection, AsyncConnection)
+        ]
+        primed = await asyncio.gather(
+            *(prime(connection) for connection in opened), return_exceptions=True
+        )
+
+    errors = [
+        result for result in (*checked_out, *primed) if isinstance(result, Exception)
+    ]
+    for error in errors:
+        core_logger.warning("Pool warm-up failed: %s", error)
+
+    return sum(result is None for result in primed)
+
 
 class Base(DeclarativeBase):
     """
@@ -1,10 +1,15 @@
+import asyncio
 from typing import Optional
 
+import typer
 import uvicorn
 
 from config.config import app_settings
 
+cli = typer.Typer()
 
+
+@cli.command()
 def run(
     host: Optional[str] = None,
     port: Optional[int] = None,
@@ -18,7 +23,8 @@ def run(
         port = app_settings.APP_PORT
 
     uvicorn.run(
-        "server:debug_app",
+        "server:create_debug_app",
+        factory=True,
         host=host,
         port=port,
         reload=True,
@@ -28,5 +34,58 @@ def run(
     )
 
 
+@cli.command()
+def serve(
+    host: Optional[str] = None,
+    port: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> None:
+    """
+    Run the production server.
+    """
+    from src.core.metrics import metrics
+
+    # Snapshots left by the workers of a previous run would be merged with the new ones.
+    metrics.clear_directory()
+
+    uvicorn.run(
+        "server:create_production_app",
+        factory=True,
+        host=host or app_settings.APP_HOST,
+        port=port or app_settings.APP_PORT,
+        workers=workers or app_settings.APP_WORKERS,
+        loop=app_settings.APP_LOOP,
+        http=app_settings.APP_HTTP,
+        timeout_keep_alive=app_settings.APP_KEEPALIVE_TIMEOUT,
+        backlog=app_settings.APP_BACKLOG,
+        timeout_graceful_shutdown=app_settings.APP_GRACEFUL_SHUTDOWN_TIMEOUT,
+        # Replaced by the sampled, queue-based access log of the app, see APP_ACCESS_LOG.
+        access_log=False,
+        log_level="info",
+    )
+
+
+@cli.command()
+def reconcile_counters(batch_size: int = 1000) -> None:
+    """
+    Recompute drifted like, comment and reply counters in batches.
+    """
+    from database.db import async_session, engine
+    from src.api.v1.blog.services.counter import CounterService
+
+    async def reconcile() -> dict[str, int]:
+        try:
+            async with async_session() as session:
+                return await CounterService(session).reconcile(batch_size=batch_size)
+        finally:
+            await engine.dispose()
+
+    fixed = asyncio.run(reconcile())
+    typer.echo(
+        f"Reconciled counters of {fixed['blogs']} blogs "
+        f"and {fixed['comments']} comments."
+    )
+
+
 if __name__ == "__main__":
-    run()
+    cli()
@@ -23,12 +23,19 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_object(object, name, type_, reflected, compare_to) -> bool:
+    # Indexes that reflection cannot represent are managed by hand in migrations.
+    model = compare_to if reflected else object
+    return not (model is not None and model.info.get("skip_autogenerate"))
+
+
 def do_run_migrations(connection: Connection) -> None:
     context.configure(
         connection=connection,
         target_metadata=target_metadata,
         version_table="auth_alembic_version",
         compare_type=True,
+        include_object=include_object,
     )
     with context.begin_transaction():
         context.run_migrations()
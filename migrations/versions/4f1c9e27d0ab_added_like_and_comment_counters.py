@@ -0,0 +1,74 @@
+"""Added like and comment counters
+
+Revision ID: 4f1c9e27d0ab
+Revises: 6ba89602db6d
+Create Date: 2026-10-17 11:02:45.671203
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4f1c9e27d0ab"
+down_revision = "6ba89602db6d"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "blogs",
+        sa.Column(
+            "like_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.add_column(
+        "blogs",
+        sa.Column(
+            "comment_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.add_column(
+        "comments",
+        sa.Column(
+            "like_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+    op.add_column(
+        "comments",
+        sa.Column(
+            "reply_count", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+
+    # Backfill the counters from the existing rows.
+    op.execute(
+        """
+        UPDATE blogs SET
+            like_count = (SELECT count(*) FROM likes WHERE likes.blog_id = blogs.id),
+            comment_count = (
+                SELECT count(*) FROM comments WHERE comments.blog_id = blogs.id
+            )
+        """
+    )
+    op.execute(
+        """
+        UPDATE comments SET
+            like_count = (
+                SELECT count(*) FROM comment_likes
+                WHERE comment_likes.comment_id = comments.id
+            ),
+            reply_count = (
+                SELECT count(*) FROM comments AS replies
+                WHERE replies.parent_comment_id = comments.id
+            )
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("comments", "reply_count")
+    op.drop_column("comments", "like_count")
+    op.drop_column("blogs", "comment_count")
+    op.drop_column("blogs", "like_count")
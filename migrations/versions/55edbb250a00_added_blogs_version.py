@@ -0,0 +1,55 @@
+"""Added blogs version
+
+Revision ID: 55edbb250a00
+Revises: b89ac32db929
+Create Date: 2026-10-17 05:58:13.226080
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "55edbb250a00"
+down_revision = "b89ac32db929"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(sa.schema.CreateSequence(sa.Sequence("blogs_version_seq")))
+
+    # A volatile default rewrites the table under an exclusive lock, numbering every
+    # existing blog.
+    op.add_column(
+        "blogs",
+        sa.Column(
+            "version",
+            sa.BigInteger(),
+            server_default=sa.text("nextval('blogs_version_seq')"),
+            nullable=False,
+        ),
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. A failed build
+    # leaves an INVALID index behind, which has to be dropped before retrying.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_blogs_version",
+            "blogs",
+            ["version"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_blogs_version",
+            table_name="blogs",
+            postgresql_concurrently=True,
+        )
+
+    op.drop_column("blogs", "version")
+    op.execute(sa.schema.DropSequence(sa.Sequence("blogs_version_seq")))
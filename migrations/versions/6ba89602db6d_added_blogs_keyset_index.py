@@ -0,0 +1,34 @@
+"""Added blogs keyset index
+
+Revision ID: 6ba89602db6d
+Revises: 963a87973765
+Create Date: 2026-10-17 10:04:17.218345
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "6ba89602db6d"
+down_revision = "963a87973765"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_blogs_live_created_at_id",
+        "blogs",
+        ["created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_blogs_live_created_at_id",
+        table_name="blogs",
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
@@ -0,0 +1,59 @@
+"""Added blogs search vector
+
+Revision ID: 7b6e1c827dd7
+Revises: 9c3d5e81b6f2
+Create Date: 2026-10-17 05:06:03.898588
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "7b6e1c827dd7"
+down_revision = "9c3d5e81b6f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Adding a stored generated column rewrites the table under an exclusive lock,
+    # computing the vector of every existing blog.
+    op.add_column(
+        "blogs",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', name), 'A') || "
+                "setweight(to_tsvector('english', content), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. A failed build
+    # leaves an INVALID index behind, which has to be dropped before retrying.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_blogs_live_search_vector",
+            "blogs",
+            ["search_vector"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_blogs_live_search_vector",
+            table_name="blogs",
+            postgresql_concurrently=True,
+        )
+
+    op.drop_column("blogs", "search_vector")
@@ -0,0 +1,29 @@
+"""Added user token version
+
+Revision ID: 963a87973765
+Revises: 2ba7bb0cba10
+Create Date: 2026-10-17 09:12:41.532108
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "963a87973765"
+down_revision = "2ba7bb0cba10"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "users",
+        sa.Column(
+            "token_version", sa.Integer(), server_default=sa.text("0"), nullable=False
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("users", "token_version")
@@ -0,0 +1,106 @@
+"""Added foreign key and filter indexes
+
+Revision ID: 9c3d5e81b6f2
+Revises: 4f1c9e27d0ab
+Create Date: 2026-10-17 11:48:09.302117
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9c3d5e81b6f2"
+down_revision = "4f1c9e27d0ab"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. A failed build
+    # leaves an INVALID index behind, which has to be dropped before retrying.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_comments_parent_comment_id_created_at_id",
+            "comments",
+            ["parent_comment_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_comments_top_level_blog_id_created_at_id",
+            "comments",
+            ["blog_id", "created_at", "id"],
+            unique=False,
+            postgresql_where=sa.text("parent_comment_id IS NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_comments_blog_id",
+            "comments",
+            ["blog_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_comment_likes_comment_id",
+            "comment_likes",
+            ["comment_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_likes_blog_id_created_at_id",
+            "likes",
+            ["blog_id", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_blogs_author_id",
+            "blogs",
+            ["author_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "uq_blogs_live_name",
+            "blogs",
+            ["name"],
+            unique=True,
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_blogs_live_name", table_name="blogs", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_blogs_author_id", table_name="blogs", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_likes_blog_id_created_at_id",
+            table_name="likes",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comment_likes_comment_id",
+            table_name="comment_likes",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comments_blog_id", table_name="comments", postgresql_concurrently=True
+        )
+        op.drop_index(
+            "ix_comments_top_level_blog_id_created_at_id",
+            table_name="comments",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_comments_parent_comment_id_created_at_id",
+            table_name="comments",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,39 @@
+"""Added blogs name prefix index
+
+Revision ID: b89ac32db929
+Revises: 7b6e1c827dd7
+Create Date: 2026-10-17 05:13:40.105277
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b89ac32db929"
+down_revision = "7b6e1c827dd7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block. A failed build
+    # leaves an INVALID index behind, which has to be dropped before retrying.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_blogs_live_lower_name",
+            "blogs",
+            [sa.text('lower(name) COLLATE "C"')],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_blogs_live_lower_name",
+            table_name="blogs",
+            postgresql_concurrently=True,
+        )
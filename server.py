@@ -1,12 +1,23 @@
-from fastapi import FastAPI, status
+import gc
+from typing import Annotated
+
+from fastapi import Depends, FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi_pagination import add_pagination
 
-from config.config import app_settings
+from config.config import app_settings, logging_settings
+from database.db import ReadYourWritesMiddleware
 from src import constants
 from src.api.handlers import start_exception_handlers
 from src.api.v1 import router as v1_router
+from src.core.basic_auth import basic_auth
+from src.core.lifespan import lifespan
+from src.core.metrics import MetricsMiddleware, metrics
+from src.core.utils import setup_logger
+from src.core.utils.logs import AccessLogMiddleware
+from src.core.utils.routing import FastJSONResponse
+from src.core.utils.timing import ServerTimingMiddleware
 
 
 def init_routers(_app: FastAPI) -> None:
@@ -34,9 +45,24 @@ def root_health_path(_app: FastAPI) -> None:
         )
 
 
-def init_middlewares(_app: FastAPI) -> None:
+def metrics_path(_app: FastAPI) -> None:
+    """
+    Metrics Endpoint, in the Prometheus text exposition format.
+    """
+
+    @_app.get("/metrics", include_in_schema=False)
+    async def get_metrics(_: Annotated[bool, Depends(basic_auth)]) -> PlainTextResponse:
+        return PlainTextResponse(
+            await metrics.render_async(), media_type="text/plain; version=0.0.4"
+        )
+
+
+def init_middlewares(_app: FastAPI, debug: bool = False) -> None:
     """
     Middleware initialization.
+
+    In debug mode, statements repeated too often within a request are reported.
+    With ``APP_ACCESS_LOG``, requests are written to a sampled access log.
     """
     _app.add_middleware(
         CORSMiddleware,
@@ -45,6 +71,21 @@ def init_middlewares(_app: FastAPI) -> None:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    _app.add_middleware(
+        ServerTimingMiddleware,
+        repeated_statement_threshold=(
+            app_settings.APP_REPEATED_QUERY_THRESHOLD if debug else None
+        ),
+    )
+    _app.add_middleware(MetricsMiddleware)
+    _app.add_middleware(ReadYourWritesMiddleware)
+    if app_settings.APP_ACCESS_LOG:
+        _app.add_middleware(
+            AccessLogMiddleware,
+            logger=setup_logger("access_logger"),
+            sample_rate=logging_settings.LOG_ACCESS_SAMPLE_RATE,
+            slow_seconds=logging_settings.LOG_ACCESS_SLOW_SECONDS,
+        )
 
 
 def create_app(debug: bool = False) -> FastAPI:
@@ -56,13 +97,32 @@ def create_app(debug: bool = False) -> FastAPI:
         version=app_settings.APP_VERSION,
         docs_url="/docs",
         redoc_url="/redoc" if debug else None,
+        default_response_class=FastJSONResponse,
+        lifespan=lifespan,
     )
     init_routers(_app)
     root_health_path(_app)
-    init_middlewares(_app)
+    metrics_path(_app)
+    init_middlewares(_app, debug=debug)
     start_exception_handlers(_app)
     add_pagination(_app)
     return _app
 
 
-debug_app = create_app(debug=True)
+def create_debug_app() -> FastAPI:
+    """
+    App factory used by the development server.
+    """
+    return create_app(debug=True)
+
+
+def create_production_app() -> FastAPI:
+    """
+    App factory used by the production server, called once in every worker.
+
+    Everything allocated while importing and building the app lives for the whole
+    process, so it is moved out of the garbage collector's tracked generations.
+    """
+    app = create_app(debug=False)
+    gc.freeze()
+    return app
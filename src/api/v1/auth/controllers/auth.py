@@ -4,11 +4,14 @@ from fastapi import APIRouter, Body, Depends, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from src.api.v1.auth.services.auth import AuthService
+from src.api.v1.user.models.user import UserModel
 from src.api.v1.user.schemas import LoginRequest, LoginResponse
 from src.api.v1.user.schemas.response import RefreshTokenResponse
+from src.core.auth import get_verified_user
+from src.core.utils.routing import SerializedRoute
 from src.core.utils.schema import BaseResponse
 
-router = APIRouter(prefix="/auth", tags=["Authentication"])
+router = APIRouter(prefix="/auth", tags=["Authentication"], route_class=SerializedRoute)
 
 security = HTTPBearer()
 
@@ -66,3 +69,28 @@ async def refresh_token(
     return BaseResponse(
         data=await service.refresh(credentials), code=status.HTTP_201_CREATED
     )
+
+
+@router.post(
+    "/logout",
+    status_code=status.HTTP_200_OK,
+    name="Logout",
+    description="Revoke all tokens of the user",
+    operation_id="logout_user",
+)
+async def logout(
+    user: Annotated[UserModel, Depends(get_verified_user)],
+    service: Annotated[AuthService, Depends()],
+) -> BaseResponse:
+    """
+    Revoke every access and refresh token issued to the authenticated user.
+
+    Args:
+        user (UserModel): The currently authenticated user.
+        service (AuthService): The authentication service instance provided via dependency injection.
+
+    Returns:
+        BaseResponse: The response indicating a successful logout.
+    """
+
+    return BaseResponse(data=await service.logout(user), code=status.HTTP_200_OK)
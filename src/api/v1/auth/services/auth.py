@@ -2,18 +2,23 @@ from typing import Annotated
 
 from fastapi import Depends
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import load_only
 
 from database.db import db_session
+from src import constants
 from src.api.enums import TokenTypeEnum
 from src.api.v1.auth.utils.hashing import verify_password
 from src.api.v1.user.exceptions import UserNotFound
+from src.api.v1.user.models import RoleModel
 from src.api.v1.user.models.user import UserModel
+from src.api.v1.user.registry import role_registry
 from src.api.v1.user.schemas import LoginResponse
 from src.api.v1.user.schemas.response import RefreshTokenResponse
 from src.core.auth import create_token, decode_token
+from src.core.cache import principal_cache
+from src.core.exceptions import InvalidJWTTokenException
 
 security = HTTPBearer()
 
@@ -53,7 +58,9 @@ class AuthService:
                 load_only(
                     UserModel.email,
                     UserModel.password,
-                )
+                    UserModel.token_version,
+                    UserModel.role_id,
+                ),
             )
             .where(UserModel.email == email)
         )
@@ -66,8 +73,9 @@ class AuthService:
         if not await verify_password(password, user.password):
             raise UserNotFound
 
-        access_token = create_token(email=user.email, token_type=TokenTypeEnum.ACCESS)
-        refresh_token = create_token(email=user.email, token_type=TokenTypeEnum.REFRESH)
+        role = await role_registry.get(self.session, user.role_id)
+        access_token = self._create_token(user, role, TokenTypeEnum.ACCESS)
+        refresh_token = self._create_token(user, role, TokenTypeEnum.REFRESH)
 
         return LoginResponse(access_token=access_token, refresh_token=refresh_token)
 
@@ -89,12 +97,66 @@ class AuthService:
 
         Raises:
             HTTPException: If the refresh token is invalid, expired, or of an incorrect type.
+            UserNotFound: If the user of the token no longer exists.
+            InvalidJWTTokenException: If the refresh token was revoked.
         """
 
         refresh_token = credentials.credentials
 
         payload = decode_token(refresh_token, expected_type=TokenTypeEnum.REFRESH)
 
-        new_access_token = create_token(payload["sub"], TokenTypeEnum.ACCESS)
+        user = await self.session.scalar(
+            select(UserModel)
+            .options(
+                load_only(UserModel.email, UserModel.token_version, UserModel.role_id),
+            )
+            .where(UserModel.email == payload["sub"])
+        )
+
+        if not user:
+            raise UserNotFound
+
+        # Tokens without a version cannot be revoked, so they are never accepted.
+        if payload.get("ver") != user.token_version:
+            raise InvalidJWTTokenException(constants.REVOKED_TOKEN)
+
+        role = await role_registry.get(self.session, user.role_id)
+        new_access_token = self._create_token(user, role, TokenTypeEnum.ACCESS)
 
         return RefreshTokenResponse(access_token=new_access_token)
+
+    async def logout(self, user: UserModel) -> dict[str, str]:
+        """
+        Revoke every access and refresh token issued to the user.
+
+        Bumps the user's token version, so tokens carrying an older version are rejected
+        wherever the user is confirmed against the database, on every worker once the
+        logout commits.
+
+        Args:
+            user (UserModel): The authenticated user.
+
+        Returns:
+            dict[str, str]: A success message.
+        """
+
+        await self.session.execute(
+            update(UserModel)
+            .where(UserModel.id == user.id)
+            .values(token_version=UserModel.token_version + 1)
+        )
+        await principal_cache.revoke_user(self.session, user.email)
+
+        return {"message": constants.LOGOUT_SUCCESS}
+
+    @staticmethod
+    def _create_token(
+        user: UserModel, role: RoleModel, token_type: TokenTypeEnum
+    ) -> str:
+        return create_token(
+            email=user.email,
+            token_type=token_type,
+            user_id=user.id,
+            role=role.name,
+            token_version=user.token_version,
+        )
@@ -1,8 +1,147 @@
+import asyncio
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
 from passlib.context import CryptContext
 
+from config.config import hashing_settings
+from src.api.v1.user.exceptions import HashingBusyException
+from src.core.metrics import MetricsRegistry, labels, metrics
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+class HashingEngine:
+    """
+    Runs bcrypt hashing and verification on a bounded executor instead of the event loop.
+
+    Calls beyond ``max_queue`` pending ones are rejected with :class:`HashingBusyException`
+    rather than piling up, and each operation keeps count and latency metrics.
+
+    Attributes:
+        pending (int): Number of calls currently queued or running.
+        rejected (int): Number of calls rejected because the queue was full.
+    """
+
+    def __init__(self, executor_type: str, workers: int, max_queue: int) -> None:
+        """
+        Initialize the engine. The executor itself is created on first use.
+
+        Args:
+            executor_type (str): Either ``"thread"`` or ``"process"``.
+            workers (int): Number of executor workers.
+            max_queue (int): Maximum number of pending calls.
+        """
+        if executor_type not in ("thread", "process"):
+            raise ValueError("Invalid hashing executor. Must be 'thread' or 'process'.")
+
+        self.executor_type = executor_type
+        self.workers = workers
+        self.max_queue = max_queue
+        self.pending = 0
+        self.rejected = 0
+        self._latency: dict[str, dict[str, float]] = {}
+        self._executor: Executor | None = None
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_type == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="hashing"
+                )
+        return self._executor
+
+    async def run(self, operation: str, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a hashing function on the executor and record its latency.
+
+        Args:
+            operation (str): Name under which the latency is recorded.
+            func (Callable[..., Any]): The blocking function to run.
+            *args (Any): Arguments passed to the function.
+
+        Raises:
+            HashingBusyException: If ``max_queue`` calls are already pending.
+
+        Returns:
+            Any: The function result.
+        """
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise HashingBusyException
+
+        self.pending += 1
+        start = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, func, *args
+            )
+        finally:
+            self.pending -= 1
+            self._record(operation, time.perf_counter() - start)
+
+    def _record(self, operation: str, elapsed: float) -> None:
+        latency = self._latency.setdefault(
+            operation, {"count": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+        )
+        latency["count"] += 1
+        latency["total_seconds"] += elapsed
+        latency["max_seconds"] = max(latency["max_seconds"], elapsed)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Snapshot of the queue depth and per-operation latency metrics.
+        """
+        return {
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "latency": {name: dict(values) for name, values in self._latency.items()},
+        }
+
+    def shutdown(self) -> None:
+        """
+        Stop the executor, waiting for running calls to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+hashing_engine = HashingEngine(
+    executor_type=hashing_settings.HASHING_EXECUTOR,
+    workers=hashing_settings.HASHING_WORKERS,
+    max_queue=hashing_settings.HASHING_MAX_QUEUE,
+)
+
+metrics.describe("hashing_pending", "gauge", "Hashing calls queued or running.")
+metrics.describe("hashing_rejected_total", "counter", "Hashing calls rejected.")
+metrics.describe("hashing_calls_total", "counter", "Completed hashing calls.")
+metrics.describe("hashing_seconds_total", "counter", "Time spent in hashing calls.")
+
+
+@metrics.collector
+def collect_hashing_metrics(registry: MetricsRegistry) -> None:
+    stats = hashing_engine.stats()
+    registry.set("hashing_pending", stats["pending"])
+    registry.set("hashing_rejected_total", stats["rejected"])
+    for operation, latency in stats["latency"].items():
+        label_values = labels(operation=operation)
+        registry.set("hashing_calls_total", latency["count"], label_values)
+        registry.set("hashing_seconds_total", latency["total_seconds"], label_values)
+
+
 async def hash_password(password: str) -> str:
     """
     Hash a password.
@@ -10,7 +149,7 @@ async def hash_password(password: str) -> str:
     :param password: Password to be hashed.
     :return: Hashed password.
     """
-    return pwd_context.hash(password)
+    return await hashing_engine.run("hash", _hash, password)
 
 
 async def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -21,4 +160,4 @@ async def verify_password(plain_password: str, hashed_password: str) -> bool:
     :param hashed_password: Hashed password.
     :return: True if password is valid else False.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return await hashing_engine.run("verify", _verify, plain_password, hashed_password)
@@ -0,0 +1,84 @@
+from typing import Iterable
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.config import cache_settings
+from src.core.broadcast import broadcast
+from src.core.cache import ReadThroughCache, metered_caches, response_cache
+
+BLOGS_CHANNEL = "blogs"
+
+# Tag of the cached responses listing blogs, which change when a blog is added or
+# removed.
+BLOG_LIST_TAG = "blogs"
+
+# Serialized BlogResponse of each blog, keyed by blog id.
+blog_cache = ReadThroughCache(
+    maxsize=cache_settings.BLOG_CACHE_MAXSIZE,
+    ttl=cache_settings.BLOG_CACHE_TTL,
+    negative_ttl=cache_settings.BLOG_CACHE_NEGATIVE_TTL,
+)
+metered_caches["blog"] = blog_cache
+
+
+def blog_tag(blog_id: UUID) -> str:
+    """
+    Tag of the cached responses showing a blog or its counters.
+
+    Args:
+        blog_id (UUID): The unique identifier of the blog.
+
+    Returns:
+        str: The tag.
+    """
+    return f"blog:{blog_id}"
+
+
+def comment_tag(comment_id: UUID) -> str:
+    """
+    Tag of the cached responses showing a comment, its counters or its replies.
+
+    Args:
+        comment_id (UUID): The unique identifier of the comment.
+
+    Returns:
+        str: The tag.
+    """
+    return f"comment:{comment_id}"
+
+
+async def evict(session: AsyncSession, *tags: str) -> None:
+    """
+    Evict the cached blog data a write changes.
+
+    Entries are evicted right away for this worker, and again on every worker once the
+    transaction of the session commits, in case a read cached them in between.
+
+    Args:
+        session (AsyncSession): The session of the write.
+        *tags (str): The tags of the changed rows.
+    """
+    _evict_locally(tags)
+    await broadcast.publish(session, BLOGS_CHANNEL, " ".join(tags))
+
+
+def _evict_locally(tags: Iterable[str]) -> None:
+    tags = list(tags)
+    response_cache.evict(tags)
+    for tag in tags:
+        kind, _, value = tag.partition(":")
+        if kind == "blog":
+            blog_cache.discard(UUID(value))
+
+
+def _on_blogs_changed(payload: str) -> None:
+    # An empty payload means messages may have been missed.
+    if payload:
+        _evict_locally(payload.split())
+    else:
+        blog_cache.clear()
+        response_cache.clear()
+
+
+broadcast.subscribe(BLOGS_CHANNEL, _on_blogs_changed)
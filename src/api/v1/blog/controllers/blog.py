@@ -1,22 +1,33 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Path, status
+from fastapi import APIRouter, Depends, Path, Query, status
 from fastapi_pagination import Page, Params
 
+from src.api.v1.blog.cache import BLOG_LIST_TAG, blog_tag
 from src.api.v1.blog.schemas import BlogResponse, CreateBlogRequest
 from src.api.v1.blog.schemas.request import CreateCommentRequest
-from src.api.v1.blog.schemas.response import BlogCommentResponse, CommentResponse, UserLikedResponse
+from src.api.v1.blog.schemas.response import (
+    BlogCommentResponse,
+    BlogContentResponse,
+    BlogPageResponse,
+    BlogSearchResponse,
+    BlogSuggestionResponse,
+    CommentResponse,
+    UserLikedResponse,
+)
 from src.api.v1.blog.services.blog import BlogService
 from src.api.v1.blog.services.comment import CommentService
 from src.api.v1.blog.services.like import LikeService
 from src.api.v1.user.enums import RoleEnum
 from src.api.v1.user.models.user import UserModel
-from src.core.auth import get_current_user, role_required
+from src.core.auth import get_current_user, get_verified_user, role_required
 from src.core.utils.mixins import Default100Page
+from src.core.utils.pagination import CursorPage, CursorParams
+from src.core.utils.routing import SerializedRoute, cache_response, conditional
 from src.core.utils.schema import BaseResponse
 
-router = APIRouter(prefix="/blogs", tags=["Blogs"])
+router = APIRouter(prefix="/blogs", tags=["Blogs"], route_class=SerializedRoute)
 
 
 @router.post(
@@ -27,7 +38,7 @@ router = APIRouter(prefix="/blogs", tags=["Blogs"])
     operation_id="create_blog",
 )
 async def create_blog(
-    user: Annotated[UserModel, Depends(get_current_user)],
+    user: Annotated[UserModel, Depends(get_verified_user)],
     request: CreateBlogRequest,
     service: Annotated[BlogService, Depends()],
 ) -> BaseResponse[BlogResponse]:
@@ -57,10 +68,17 @@ async def create_blog(
     operation_id="get_all_blogs",
     response_model=BaseResponse[Page[BlogResponse]],
 )
+@cache_response(
+    key=lambda values: (
+        (values["params"].size,) if values["params"].page == 1 else None
+    ),
+    tags=lambda _, page: [BLOG_LIST_TAG, *(blog_tag(blog.id) for blog in page.items)],
+)
+@conditional(lambda values: values["service"].get_all_validators())
 async def get_all(
     _: Annotated[bool, Depends(get_current_user)],
     service: Annotated[BlogService, Depends()],
-        params: Annotated[Params, Depends(Default100Page)],
+    params: Annotated[Params, Depends(Default100Page)],
 ) -> BaseResponse[Page[BlogResponse]]:
     """
     Retrieve a paginated list of all blogs.
@@ -79,6 +97,116 @@ async def get_all(
         code=status.HTTP_200_OK,
     )
 
+
+@router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    name="Get blogs by cursor",
+    description="Get blogs by cursor",
+    operation_id="get_blogs_by_cursor",
+    response_model=BaseResponse[CursorPage[BlogResponse]],
+)
+async def get_all_by_cursor(
+    _: Annotated[UserModel, Depends(get_current_user)],
+    service: Annotated[BlogService, Depends()],
+    params: Annotated[CursorParams, Depends()],
+) -> BaseResponse[CursorPage[BlogResponse]]:
+    """
+    Retrieve a cursor-paginated list of blogs, newest first.
+
+    Pass the `nextCursor` or `previousCursor` of a page as `cursor` to move between pages.
+
+    Args:
+        _ (UserModel): The authenticated user, used for access control.
+        service (BlogService): Service handling blog-related business logic.
+        params (CursorParams): Pagination parameters (cursor, size).
+
+    Returns:
+        BaseResponse[CursorPage[BlogResponse]]: A page of blogs with its cursors.
+    """
+
+    return BaseResponse(
+        data=await service.get_all_by_cursor(params=params),
+        code=status.HTTP_200_OK,
+    )
+
+
+@router.get(
+    "/search",
+    status_code=status.HTTP_200_OK,
+    name="Search blogs",
+    description="Search blogs",
+    operation_id="search_blogs",
+    response_model=BaseResponse[CursorPage[BlogSearchResponse]],
+)
+async def search(
+    _: Annotated[UserModel, Depends(get_current_user)],
+    service: Annotated[BlogService, Depends()],
+    q: Annotated[str, Query(min_length=1, max_length=256)],
+    params: Annotated[CursorParams, Depends()],
+) -> BaseResponse[CursorPage[BlogSearchResponse]]:
+    """
+    Full-text search of the blogs by name and content, most relevant first.
+
+    `q` accepts web search syntax: quoted phrases, `or` and `-` to exclude a word.
+    Pass the `nextCursor` or `previousCursor` of a page as `cursor` to move between pages.
+
+    Args:
+        _ (UserModel): The authenticated user, used for access control.
+        service (BlogService): Service handling blog-related business logic.
+        q (str): The search terms.
+        params (CursorParams): Pagination parameters (cursor, size).
+
+    Returns:
+        BaseResponse[CursorPage[BlogSearchResponse]]: A page of matching blogs with
+            their rank and a highlighted snippet.
+    """
+
+    return BaseResponse(
+        data=await service.search(query=q, params=params),
+        code=status.HTTP_200_OK,
+    )
+
+
+@router.get(
+    "/suggest",
+    status_code=status.HTTP_200_OK,
+    name="Suggest blogs",
+    description="Suggest blogs",
+    operation_id="suggest_blogs",
+    response_model=BaseResponse[list[BlogSuggestionResponse]],
+)
+@cache_response(
+    key=lambda values: (values["prefix"].lower(), values["limit"]),
+    tags=lambda *_: [BLOG_LIST_TAG],
+)
+async def suggest(
+    _: Annotated[UserModel, Depends(get_current_user)],
+    service: Annotated[BlogService, Depends()],
+    prefix: Annotated[str, Query(min_length=1, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> BaseResponse[list[BlogSuggestionResponse]]:
+    """
+    Suggest the titles of the blogs starting with a prefix, ignoring case.
+
+    Meant for autocomplete as the user types; suggestions are in alphabetical order.
+
+    Args:
+        _ (UserModel): The authenticated user, used for access control.
+        service (BlogService): Service handling blog-related business logic.
+        prefix (str): The beginning of the title.
+        limit (int): The maximum number of suggestions.
+
+    Returns:
+        BaseResponse[list[BlogSuggestionResponse]]: The matching blog titles.
+    """
+
+    return BaseResponse(
+        data=await service.suggest(prefix=prefix, limit=limit),
+        code=status.HTTP_200_OK,
+    )
+
+
 @router.get(
     "/{blog_id}",
     status_code=status.HTTP_200_OK,
@@ -86,6 +214,11 @@ async def get_all(
     description="Get blog by id",
     operation_id="get_blog_by_id",
 )
+@cache_response(
+    key=lambda values: values["blog_id"],
+    tags=lambda values, _: [blog_tag(values["blog_id"])],
+)
+@conditional(lambda values: values["service"].get_validators_by_id(values["blog_id"]))
 async def get_by_id(
     _: Annotated[bool, Depends(get_current_user)],
     blog_id: Annotated[UUID, Path()],
@@ -109,6 +242,74 @@ async def get_by_id(
     )
 
 
+@router.get(
+    "/{blog_id}/content",
+    status_code=status.HTTP_200_OK,
+    name="Get blog content by id",
+    description="Get blog content by id",
+    operation_id="get_blog_content_by_id",
+)
+async def get_content_by_id(
+    _: Annotated[UserModel, Depends(get_current_user)],
+    blog_id: Annotated[UUID, Path()],
+    service: Annotated[BlogService, Depends()],
+) -> BaseResponse[BlogContentResponse]:
+    """
+    Retrieve a specific blog by its ID including its content body.
+
+    Args:
+        _ (UserModel): The authenticated user, used for access control.
+        blog_id (UUID): The unique identifier of the blog.
+        service (BlogService): Service handling blog-related business logic.
+
+    Returns:
+        BaseResponse[BlogContentResponse]: The response containing blog details and content.
+    """
+
+    return BaseResponse(
+        data=await service.get_content_by_id(blog_id),
+        code=status.HTTP_200_OK,
+    )
+
+
+@router.get(
+    "/{blog_id}/full",
+    status_code=status.HTTP_200_OK,
+    name="Get blog page by id",
+    description="Get blog page by id",
+    operation_id="get_blog_page_by_id",
+)
+async def get_page_by_id(
+    user: Annotated[UserModel, Depends(get_current_user)],
+    blog_id: Annotated[UUID, Path()],
+    service: Annotated[BlogService, Depends()],
+    size: Annotated[
+        int, Query(ge=1, le=100, description="Page size of the comments")
+    ] = 100,
+) -> BaseResponse[BlogPageResponse]:
+    """
+    Retrieve everything a blog page shows in one request.
+
+    Returns the blog with its content, the first page of its top-level comments and
+    whether the current user liked it. Pass `comments.nextCursor` to
+    `GET /blogs/{blog_id}/comments` for the following pages.
+
+    Args:
+        user (UserModel): The currently authenticated user.
+        blog_id (UUID): The unique identifier of the blog.
+        service (BlogService): Service handling blog-related business logic.
+        size (int): Page size of the comments.
+
+    Returns:
+        BaseResponse[BlogPageResponse]: The blog, its comments and the like state of the user.
+    """
+
+    return BaseResponse(
+        data=await service.get_page(blog_id=blog_id, user_id=user.id, size=size),
+        code=status.HTTP_200_OK,
+    )
+
+
 @router.delete(
     "/{blog_id}",
     status_code=status.HTTP_200_OK,
@@ -117,7 +318,7 @@ async def get_by_id(
     operation_id="delete_blog_by_id",
 )
 async def delete_by_id(
-    _: Annotated[UserModel, role_required(RoleEnum.ADMIN)],
+    _: Annotated[UserModel, role_required(RoleEnum.ADMIN, verify=True)],
     blog_id: Annotated[UUID, Path()],
     service: Annotated[BlogService, Depends()],
 ) -> BaseResponse:
@@ -147,7 +348,7 @@ async def delete_by_id(
     operation_id="create_comment",
 )
 async def create_comment(
-    user: Annotated[UserModel, Depends(get_current_user)],
+    user: Annotated[UserModel, Depends(get_verified_user)],
     blog_id: Annotated[UUID, Path()],
     request: CreateCommentRequest,
     service: Annotated[CommentService, Depends()],
@@ -182,27 +383,33 @@ async def create_comment(
     description="Get top level comments",
     operation_id="get_top_level_comments",
 )
+@conditional(
+    lambda values: values["service"].get_parent_comments_validators(values["blog_id"])
+)
 async def get_parent_comments(
     _: Annotated[UserModel, Depends(get_current_user)],
     blog_id: Annotated[UUID, Path()],
     service: Annotated[CommentService, Depends()],
+    params: Annotated[CursorParams, Depends()],
 ) -> BaseResponse[BlogCommentResponse]:
     """
     Retrieve top-level comments for a blog.
 
-    This endpoint returns all first-level (parent) comments for the specified blog.
+    This endpoint returns the blog summary and a cursor-paginated list of first-level
+    (parent) comments for the specified blog, newest first.
     Nested replies are not included in this response.
 
     Args:
         _ (UserModel): The currently authenticated user (authorization only).
         blog_id (UUID): The unique identifier of the blog to retrieve comments for.
         service (CommentService): The comment service handling business logic.
+        params (CursorParams): Pagination parameters (cursor, size) of the comments.
 
     Returns:
-        BaseResponse[BlogCommentResponse]: A list of top-level comments wrapped in a standard API response.
+        BaseResponse[BlogCommentResponse]: A page of top-level comments wrapped in a standard API response.
     """
     return BaseResponse(
-        data=await service.get_parent_comments(blog_id=blog_id),
+        data=await service.get_parent_comments(blog_id=blog_id, params=params),
         code=status.HTTP_200_OK,
     )
 
@@ -215,7 +422,7 @@ async def get_parent_comments(
     operation_id="create_like",
 )
 async def create(
-    user: Annotated[UserModel, Depends(get_current_user)],
+    user: Annotated[UserModel, Depends(get_verified_user)],
     service: Annotated[LikeService, Depends()],
     blog_id: Annotated[UUID, Path()],
 ) -> BaseResponse:
@@ -250,22 +457,24 @@ async def get_likes(
     _: Annotated[UserModel, Depends(get_current_user)],
     service: Annotated[LikeService, Depends()],
     blog_id: Annotated[UUID, Path()],
+    params: Annotated[CursorParams, Depends()],
 ) -> BaseResponse[UserLikedResponse]:
     """
     Retrieve like information for a blog.
 
-    This endpoint returns information about the likes of a specific blog,
-    such as the total number of likes and whether the current user has liked the blog.
+    This endpoint returns the total number of likes of a specific blog along with
+    a cursor-paginated list of the users who liked it, most recent first.
 
     Args:
         _ (UserModel): The currently authenticated user (authorization only).
         service (LikeService): The service handling like retrieval logic.
         blog_id (UUID): The unique identifier of the blog to retrieve like information for.
+        params (CursorParams): Pagination parameters (cursor, size) of the users.
 
     Returns:
         BaseResponse[UserLikedResponse]: A response containing the like details for the blog.
     """
     return BaseResponse(
-        data=await service.get_likes(blog_id=blog_id),
+        data=await service.get_likes(blog_id=blog_id, params=params),
         code=status.HTTP_200_OK,
     )
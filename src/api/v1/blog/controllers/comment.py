@@ -3,13 +3,15 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, Path, status
 
+from src.api.v1.blog.cache import comment_tag
 from src.api.v1.blog.schemas.response import CommentLikeResponse, ReplyResponse
 from src.api.v1.blog.services.comment import CommentService
 from src.api.v1.user.models.user import UserModel
-from src.core.auth import get_current_user
+from src.core.auth import get_current_user, get_verified_user
+from src.core.utils.routing import SerializedRoute, cache_response, conditional
 from src.core.utils.schema import BaseResponse
 
-router = APIRouter(prefix="/comments", tags=["Comments"])
+router = APIRouter(prefix="/comments", tags=["Comments"], route_class=SerializedRoute)
 
 
 @router.get(
@@ -19,6 +21,16 @@ router = APIRouter(prefix="/comments", tags=["Comments"])
     description="Get replies",
     operation_id="get_replies",
 )
+@cache_response(
+    key=lambda values: values["comment_id"],
+    tags=lambda values, replies: [
+        comment_tag(values["comment_id"]),
+        *(comment_tag(reply.id) for reply in replies),
+    ],
+)
+@conditional(
+    lambda values: values["service"].get_replies_validators(values["comment_id"])
+)
 async def get_replies(
     _: Annotated[UserModel, Depends(get_current_user)],
     comment_id: Annotated[UUID, Path()],
@@ -52,7 +64,7 @@ async def get_replies(
     response_model=BaseResponse[CommentLikeResponse],
 )
 async def like_or_unlike_comment(
-    user: Annotated[UserModel, Depends(get_current_user)],
+    user: Annotated[UserModel, Depends(get_verified_user)],
     comment_id: Annotated[UUID, Path()],
     service: Annotated[CommentService, Depends()],
 ) -> BaseResponse[CommentLikeResponse]:
@@ -86,7 +98,7 @@ async def like_or_unlike_comment(
     response_model=BaseResponse,
 )
 async def remove_comment(
-    user: Annotated[UserModel, Depends(get_current_user)],
+    user: Annotated[UserModel, Depends(get_verified_user)],
     comment_id: Annotated[UUID, Path()],
     service: Annotated[CommentService, Depends()],
 ) -> BaseResponse:
@@ -3,12 +3,19 @@ from datetime import datetime
 from typing import Self
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import BigInteger, Computed, ForeignKey, Index, Sequence, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.db import Base
 from src.core.utils.mixins import TimeStampMixin
 
+# Text search configuration of the search vector. Queries must use the same one.
+SEARCH_CONFIG = "english"
+
+# Numbers the writes to the blogs, see BlogModel.version.
+BLOG_VERSION_SEQUENCE = Sequence("blogs_version_seq", metadata=Base.metadata)
+
 
 class BlogModel(Base, TimeStampMixin):
     """
@@ -20,19 +27,84 @@ class BlogModel(Base, TimeStampMixin):
         content (str): Content or body of the blog.
         author_id (UUID): Foreign key referencing the blog's author.
         author (UserModel): Relationship to the UserModel representing the author.
+        like_count (int): Denormalized number of likes on the blog.
+        comment_count (int): Denormalized number of comments on the blog, replies included.
+        search_vector (str): Generated full-text search vector of the name, weighted
+            above the content.
+        version (int): Number of the last write to the row, counters and soft deletes
+            included, drawn from a sequence shared by all the blogs.
     """
 
     __tablename__ = "blogs"
+    __table_args__ = (
+        Index(
+            "ix_blogs_live_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "uq_blogs_live_name",
+            "name",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index("ix_blogs_author_id", "author_id"),
+        Index("ix_blogs_version", "version"),
+        # Serves case-insensitive prefix searches of the names in name order. The "C"
+        # collation lets LIKE use it as a range whatever the database collation.
+        # Reflection loses the collation, so autogenerate would always see it changed.
+        Index(
+            "ix_blogs_live_lower_name",
+            text('lower(name) COLLATE "C"'),
+            postgresql_where=text("deleted_at IS NULL"),
+            info={"skip_autogenerate": True},
+        ),
+        Index(
+            "ix_blogs_live_search_vector",
+            "search_vector",
+            postgresql_using="gin",
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     name: Mapped[str] = mapped_column(nullable=False)
-    content: Mapped[str] = mapped_column(nullable=False)
+    # Potentially large body, only loaded when explicitly requested.
+    content: Mapped[str] = mapped_column(nullable=False, deferred=True)
 
     author_id: Mapped[UUID] = mapped_column(ForeignKey("users.id"), nullable=False)
     author: Mapped["UserModel"] = relationship("UserModel", back_populates="blogs")
 
     deleted_at: Mapped[datetime] = mapped_column(nullable=True)
 
+    like_count: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
+    comment_count: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
+
+    # Any insert or update of a blog, the Core updates of its counters included, moves
+    # the highest version, which makes a cheap validator of the blog lists.
+    version: Mapped[int] = mapped_column(
+        BigInteger,
+        BLOG_VERSION_SEQUENCE,
+        server_default=BLOG_VERSION_SEQUENCE.next_value(),
+        onupdate=BLOG_VERSION_SEQUENCE.next_value(),
+        nullable=False,
+    )
+
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', name), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}', content), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+
     likes: Mapped[list["LikeModel"]] = relationship(
         "LikeModel", back_populates="blog", cascade="all, delete-orphan"
     )
@@ -2,7 +2,7 @@ import uuid
 from typing import Self
 from uuid import UUID
 
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, Index, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.db import Base
@@ -20,9 +20,27 @@ class CommentModel(Base, TimeStampMixin):
         author_id (UUID): Foreign key referencing the user who wrote the comment.
         parent_comment_id (UUID, optional): Self-referencing foreign key for nested comments.
         likes (list[CommentLikeModel]): List of likes on the comment.
+        like_count (int): Denormalized number of likes on the comment.
+        reply_count (int): Denormalized number of replies to the comment.
     """
 
     __tablename__ = "comments"
+    __table_args__ = (
+        Index(
+            "ix_comments_parent_comment_id_created_at_id",
+            "parent_comment_id",
+            "created_at",
+            "id",
+        ),
+        Index(
+            "ix_comments_top_level_blog_id_created_at_id",
+            "blog_id",
+            "created_at",
+            "id",
+            postgresql_where=text("parent_comment_id IS NULL"),
+        ),
+        Index("ix_comments_blog_id", "blog_id"),
+    )
 
     id: Mapped[UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
     content: Mapped[str] = mapped_column(nullable=False)
@@ -38,6 +56,13 @@ class CommentModel(Base, TimeStampMixin):
         ForeignKey("comments.id", ondelete="CASCADE"), nullable=True
     )
 
+    like_count: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
+    reply_count: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
+
     # Relationships
     author: Mapped["UserModel"] = relationship("UserModel", back_populates="comments")
     blog: Mapped["BlogModel"] = relationship("BlogModel", back_populates="comments")
@@ -79,4 +104,6 @@ class CommentModel(Base, TimeStampMixin):
             author_id=author_id,
             blog_id=blog_id,
             parent_comment_id=parent_comment_id,
+            like_count=0,
+            reply_count=0,
         )
@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import Self
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, UniqueConstraint, func
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.db import Base
@@ -44,6 +44,7 @@ class CommentLikeModel(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "comment_id", name="unique_user_comment_like"),
+        Index("ix_comment_likes_comment_id", "comment_id"),
     )
 
     @classmethod
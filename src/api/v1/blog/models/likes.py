@@ -3,7 +3,7 @@ from datetime import datetime, timezone
 from typing import Self
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, UniqueConstraint, func
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.db import Base
@@ -39,6 +39,7 @@ class LikeModel(Base):
 
     __table_args__ = (
         UniqueConstraint("user_id", "blog_id", name="unique_user_blog_like"),
+        Index("ix_likes_blog_id_created_at_id", "blog_id", "created_at", "id"),
     )
 
     @classmethod
@@ -4,6 +4,7 @@ from uuid import UUID
 from pydantic import EmailStr
 
 from src.core.utils import CamelCaseModel
+from src.core.utils.pagination import CursorPage
 
 
 class BlogResponse(CamelCaseModel):
@@ -14,6 +15,8 @@ class BlogResponse(CamelCaseModel):
         id (UUID): Unique identifier of the blog post.
         name (str): Title or name of the blog post.
         author_id (UUID): Unique identifier of the author who created the blog post.
+        like_count (int): Number of likes on the blog post.
+        comment_count (int): Number of comments on the blog post, replies included.
         created_at (datetime): Timestamp when the blog post was created.
         updated_at (datetime): Timestamp when the blog post was last updated.
     """
@@ -21,10 +24,50 @@ class BlogResponse(CamelCaseModel):
     id: UUID
     name: str
     author_id: UUID
+    like_count: int = 0
+    comment_count: int = 0
     created_at: datetime
     updated_at: datetime
 
 
+class BlogContentResponse(BlogResponse):
+    """
+    Response schema representing a blog post along with its content.
+
+    Attributes:
+        content (str): Content or body of the blog post.
+    """
+
+    content: str
+
+
+class BlogSearchResponse(BlogResponse):
+    """
+    Response schema representing a blog post matching a search.
+
+    Attributes:
+        rank (float): Relevance of the blog post to the search, higher first.
+        snippet (str): Excerpts of the content with the matched words wrapped in
+            ``<mark>`` tags. The content itself is not HTML-escaped.
+    """
+
+    rank: float
+    snippet: str
+
+
+class BlogSuggestionResponse(CamelCaseModel):
+    """
+    Response schema representing a blog title suggested for a prefix.
+
+    Attributes:
+        id (UUID): Unique identifier of the blog post.
+        name (str): Title or name of the blog post.
+    """
+
+    id: UUID
+    name: str
+
+
 class UserResponse(CamelCaseModel):
     """
     Response schema representing a user's public information.
@@ -47,10 +90,12 @@ class LikeResponse(CamelCaseModel):
     Attributes:
         blog_id (UUID): The unique identifier of the blog post.
         like (bool): Indicates whether the post is liked (True) or unliked (False) after the action.
+        total_likes (int): Total number of likes on the blog after the action.
     """
 
     blog_id: UUID
     like: bool
+    total_likes: int
 
 
 class UserLikedResponse(CamelCaseModel):
@@ -59,12 +104,12 @@ class UserLikedResponse(CamelCaseModel):
 
     Attributes:
         blog_id (UUID): The unique identifier of the blog.
-        users (list[UserResponse]): List of users who liked the blog.
+        users (CursorPage[UserResponse]): Page of users who liked the blog, most recent first.
         total_likes (int): Total number of likes on the blog.
     """
 
     blog_id: UUID
-    user: list[UserResponse]
+    users: CursorPage[UserResponse]
     total_likes: int
 
 
@@ -76,11 +121,15 @@ class BaseCommentResponse(CamelCaseModel):
         id (UUID): Unique identifier of the comment.
         content (str): Text content of the comment.
         author_id (UUID): Unique identifier of the comment's author.
+        like_count (int): Number of likes on the comment.
+        reply_count (int): Number of replies to the comment.
     """
 
     id: UUID
     content: str
     author_id: UUID
+    like_count: int = 0
+    reply_count: int = 0
 
 
 class CommentResponse(BaseCommentResponse):
@@ -98,15 +147,33 @@ class CommentResponse(BaseCommentResponse):
     parent_comment_id: UUID | None = None
 
 
-class BlogCommentResponse(BlogResponse):
+class BlogCommentResponse(CamelCaseModel):
     """
-    Response model for a blog including its comments.
+    Response model for a blog including a page of its comments.
 
     Attributes:
-        comments (list[BaseCommentResponse]): List of top-level comments on the blog.
+        blog (BlogResponse): Summary of the blog.
+        comments (CursorPage[BaseCommentResponse]): Page of top-level comments on the blog, newest first.
     """
 
-    comments: list[BaseCommentResponse]
+    blog: BlogResponse
+    comments: CursorPage[BaseCommentResponse]
+
+
+class BlogPageResponse(CamelCaseModel):
+    """
+    Response model for everything a blog page shows.
+
+    Attributes:
+        blog (BlogContentResponse): The blog with its content. Its ``like_count`` is
+            the total number of likes.
+        comments (CursorPage[BaseCommentResponse]): First page of top-level comments on the blog, newest first.
+        liked (bool): Indicates if the current user has liked the blog.
+    """
+
+    blog: BlogContentResponse
+    comments: CursorPage[BaseCommentResponse]
+    liked: bool
 
 
 class ReplyResponse(CamelCaseModel):
@@ -117,11 +184,13 @@ class ReplyResponse(CamelCaseModel):
         id (UUID): Unique identifier of the reply.
         content (str): Text content of the reply.
         author_id (UUID): Unique identifier of the reply's author.
+        like_count (int): Number of likes on the reply.
     """
 
     id: UUID
     content: str
     author_id: UUID
+    like_count: int = 0
 
 
 class CommentLikeResponse(CamelCaseModel):
@@ -131,7 +200,9 @@ class CommentLikeResponse(CamelCaseModel):
     Attributes:
         comment_id (UUID): Unique identifier of the comment.
         like (bool): Indicates if the current user has liked the comment.
+        total_likes (int): Total number of likes on the comment after the action.
     """
 
     comment_id: UUID
     like: bool
+    total_likes: int
@@ -1,18 +1,93 @@
+import re
 from datetime import datetime, timezone
-from typing import Annotated
+from itertools import chain
+from typing import Annotated, Any, Sequence
 from uuid import UUID
 
 from fastapi import Depends
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Float,
+    Row,
+    Text,
+    case,
+    cast,
+    exists,
+    func,
+    null,
+    select,
+)
+from sqlalchemy.dialects.postgresql import (
+    aggregate_order_by,
+    ts_headline,
+    websearch_to_tsquery,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from database.db import db_session
+from database.db import db_read_session, db_session, primary_read_session
 from src import constants
+from src.api.v1.blog.cache import BLOG_LIST_TAG, blog_cache, blog_tag, evict
 from src.api.v1.blog.exceptions import BlogNotFoundException, DuplicateBlogException
-from src.api.v1.blog.models.blogs import BlogModel
+from src.api.v1.blog.models import CommentModel, LikeModel
+from src.api.v1.blog.models.blogs import SEARCH_CONFIG, BlogModel
+from src.api.v1.blog.schemas.response import (
+    BaseCommentResponse,
+    BlogContentResponse,
+    BlogPageResponse,
+    BlogResponse,
+    BlogSearchResponse,
+    BlogSuggestionResponse,
+)
 from src.api.v1.user.models.user import UserModel
+from src.core.utils.pagination import (
+    CursorPage,
+    CursorParams,
+    cursor_expression,
+    paginate_by_keyset,
+)
+from src.core.utils.routing import RawJSON
+from src.core.utils.schema import CamelCaseModel
+from src.core.utils.validators import Validators, make_validators
+
+# Columns served by BlogResponse. Reads project these into plain rows instead of
+# loading ORM identities, so the content body is never read for them.
+BLOG_SUMMARY_COLUMNS = (
+    BlogModel.id,
+    BlogModel.name,
+    BlogModel.author_id,
+    BlogModel.like_count,
+    BlogModel.comment_count,
+    BlogModel.created_at,
+    BlogModel.updated_at,
+)
+
+# Options of the search snippets: up to two excerpts of the content around matches.
+SEARCH_SNIPPET_OPTIONS = (
+    "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10"
+)
+
+
+def json_object(schema: type[CamelCaseModel], columns: Any) -> ColumnElement:
+    """
+    ``json_build_object`` of the fields of a response schema, keyed by their aliases.
+
+    Args:
+        schema (type[CamelCaseModel]): The response schema.
+        columns (Any): An object with a column per field name, e.g. a model or the
+            ``c`` collection of a subquery.
+
+    Returns:
+        ColumnElement: The JSON object.
+    """
+    return func.json_build_object(
+        *chain.from_iterable(
+            (field.alias or name, getattr(columns, name))
+            for name, field in schema.model_fields.items()
+        )
+    )
 
 
 class BlogService:
@@ -21,23 +96,32 @@ class BlogService:
 
     Attributes:
         session (AsyncSession): Asynchronous SQLAlchemy session injected via dependency.
+        read_session (AsyncSession): Read-only session used by the read methods.
     """
 
-    def __init__(self, session: Annotated[AsyncSession, Depends(db_session)]) -> None:
+    def __init__(
+        self,
+        session: Annotated[AsyncSession, Depends(db_session)],
+        read_session: Annotated[AsyncSession, Depends(db_read_session)],
+    ) -> None:
         """
         Initialize BlogService with an asynchronous database session.
 
         Args:
             session (AsyncSession): An asynchronous database session provided by dependency injection.
+            read_session (AsyncSession): A read-only session, bound to the read replica when one is usable.
         """
 
         self.session = session
+        self.read_session = read_session
 
     async def create_blog(self, name: str, content: str, user: UserModel) -> BlogModel:
         """
         Create a new blog post in the database.
 
-        Checks if a blog with the same name already exists. If found, raises a DuplicateBlogException.
+        Checks if a non-deleted blog with the same name already exists. If found, raises a
+        DuplicateBlogException. Names of deleted blogs can be reused. A concurrent insert of
+        the same name is caught by the ``uq_blogs_live_name`` partial unique index.
 
         Args:
             name (str): The unique name or title for the blog post.
@@ -45,25 +129,36 @@ class BlogService:
             user (UserModel): The user creating the blog post.
 
         Raises:
-            DuplicateBlogException: If a blog with the same name already exists.
+            DuplicateBlogException: If a non-deleted blog with the same name already exists.
 
         Returns:
             BlogModel: The newly created blog post instance.
         """
 
-        blog = await self.session.scalar(
-            select(BlogModel).where(BlogModel.name == name)
+        existing_id = await self.session.scalar(
+            select(BlogModel.id).where(
+                BlogModel.name == name, BlogModel.deleted_at.is_(None)
+            )
         )
 
-        if blog:
+        if existing_id:
             raise DuplicateBlogException
 
         blog = BlogModel.create(name=name, content=content, author_id=user.id)
         self.session.add(blog)
 
+        try:
+            await self.session.flush()
+        except IntegrityError as error:
+            if "uq_blogs_live_name" not in str(error.orig):
+                raise
+            raise DuplicateBlogException
+
+        await evict(self.session, BLOG_LIST_TAG)
+
         return blog
 
-    async def get_all(self, params: Params) -> Page[BlogModel]:
+    async def get_all(self, params: Params) -> Page[BlogResponse]:
         """
         Retrieve a paginated list of all blog posts.
 
@@ -71,14 +166,157 @@ class BlogService:
             params (Params): Pagination parameters provided by FastAPI pagination.
 
         Returns:
-            Page[BlogModel]: A paginated list of blog posts.
+            Page[BlogResponse]: A paginated list of blog post summaries.
+        """
+        stmt = select(*BLOG_SUMMARY_COLUMNS).where(BlogModel.deleted_at.is_(None))
+        return await paginate(
+            conn=self.read_session,
+            query=stmt,
+            params=params,
+            transformer=self._to_responses,
+        )
+
+    async def get_all_validators(self) -> Validators:
+        """
+        Compute the validators of the blog pages from the highest blog version.
+
+        Every write to a blog takes a new version, so the highest one is read from the
+        end of its index, whatever the number of blogs. Soft-deleted blogs count too,
+        as deleting one is a write. The pages have no ``Last-Modified``.
+
+        Versions are drawn when a write runs, not when it commits: a write committing
+        after a later-numbered one is only reflected by the next write.
+
+        Returns:
+            Validators: The validators, changing whenever a blog is added, removed or
+                has its counters updated.
+        """
+
+        version = await self.read_session.scalar(select(func.max(BlogModel.version)))
+
+        return make_validators(None, version)
+
+    async def get_all_by_cursor(self, params: CursorParams) -> CursorPage[BlogResponse]:
+        """
+        Retrieve a keyset-paginated list of blog posts, newest first.
+
+        Pages are ordered by ``(created_at, id)`` and served from the matching partial index,
+        so deep pages cost the same as the first one and no total count is computed.
+
+        Args:
+            params (CursorParams): The opaque cursor and page size.
+
+        Returns:
+            CursorPage[BlogResponse]: A page of blog post summaries with next and previous cursors.
         """
-        stmt = select(BlogModel).where(BlogModel.deleted_at.is_(None))
-        return await paginate(conn=self.session, query=stmt, params=params)
+        stmt = select(*BLOG_SUMMARY_COLUMNS).where(BlogModel.deleted_at.is_(None))
+        return await paginate_by_keyset(
+            session=self.read_session,
+            query=stmt,
+            keys=(BlogModel.created_at, BlogModel.id),
+            params=params,
+            transformer=self._to_responses,
+        )
 
-    async def get_by_id(self, blog_id: UUID) -> BlogModel:
+    async def search(
+        self, query: str, params: CursorParams
+    ) -> CursorPage[BlogSearchResponse]:
         """
-        Retrieve a blog post by its unique identifier.
+        Search the blog posts by name and content, most relevant first.
+
+        The query is parsed by ``websearch_to_tsquery``, so it accepts quoted phrases,
+        ``or`` and ``-`` exclusions. Matches are found through the GIN index of the live
+        blogs and ranked with ``ts_rank``, names weighing more than content. Pages are
+        keyset-paginated by ``(rank, id)``, and snippets are only built for the rows of
+        the page.
+
+        Args:
+            query (str): The search terms.
+            params (CursorParams): The opaque cursor and page size.
+
+        Raises:
+            InvalidCursorException: If the cursor is malformed.
+
+        Returns:
+            CursorPage[BlogSearchResponse]: A page of matching blog post summaries with
+                their rank and a highlighted snippet.
+        """
+        tsquery = websearch_to_tsquery(SEARCH_CONFIG, query)
+
+        # Ranked once per match in a subquery, so the sort key is not computed again
+        # for the keyset filter and ordering.
+        matches = (
+            select(
+                *BLOG_SUMMARY_COLUMNS,
+                BlogModel.content,
+                func.ts_rank(BlogModel.search_vector, tsquery, type_=Float).label(
+                    "rank"
+                ),
+            )
+            .where(
+                BlogModel.deleted_at.is_(None),
+                BlogModel.search_vector.bool_op("@@")(tsquery),
+            )
+            .subquery("matches")
+        )
+        snippet = ts_headline(
+            SEARCH_CONFIG, matches.c.content, tsquery, SEARCH_SNIPPET_OPTIONS
+        )
+
+        return await paginate_by_keyset(
+            session=self.read_session,
+            query=select(
+                *(matches.c[column.key] for column in BLOG_SUMMARY_COLUMNS),
+                matches.c.rank,
+                snippet.label("snippet"),
+            ),
+            keys=(matches.c.rank, matches.c.id),
+            params=params,
+            transformer=lambda rows: [
+                BlogSearchResponse.model_validate(row) for row in rows
+            ],
+        )
+
+    async def suggest(self, prefix: str, limit: int) -> list[BlogSuggestionResponse]:
+        """
+        Suggest the titles of the blog posts starting with a prefix, ignoring case.
+
+        Titles are matched and returned in ``lower(name)`` order straight from the
+        ``ix_blogs_live_lower_name`` index, so only ``limit`` index entries are read
+        whatever the number of matches.
+
+        Args:
+            prefix (str): The beginning of the title.
+            limit (int): The maximum number of suggestions.
+
+        Returns:
+            list[BlogSuggestionResponse]: The matching blog titles, in alphabetical order.
+        """
+        lower_name = func.lower(BlogModel.name).collate("C")
+        pattern = re.sub(r"([\\%_])", r"\\\1", prefix.lower()) + "%"
+
+        result = await self.read_session.execute(
+            select(BlogModel.id, BlogModel.name)
+            .where(
+                BlogModel.deleted_at.is_(None), lower_name.like(pattern, escape="\\")
+            )
+            .order_by(lower_name)
+            .limit(limit)
+        )
+
+        return [BlogSuggestionResponse.model_validate(row) for row in result]
+
+    @staticmethod
+    def _to_responses(rows: Sequence[Row]) -> list[BlogResponse]:
+        return [BlogResponse.model_validate(row) for row in rows]
+
+    async def get_by_id(self, blog_id: UUID) -> RawJSON:
+        """
+        Retrieve the metadata of a blog post by its unique identifier.
+
+        Summaries are served serialized from the blog cache, which is filled from the
+        primary. Concurrent misses for the same blog share one query, and unknown ids
+        are cached as missing for a while.
 
         Args:
             blog_id (UUID): The unique identifier of the blog post.
@@ -87,19 +325,183 @@ class BlogService:
             BlogNotFoundException: If no blog with the given ID exists.
 
         Returns:
-            BlogModel: The blog post instance.
+            RawJSON: The blog post summary, without its content, serialized as a
+                BlogResponse.
         """
 
-        blog = await self.session.scalar(
-            select(BlogModel).where(
+        blog = await blog_cache.get_or_load(blog_id, lambda: self._load_json(blog_id))
+
+        if blog is None:
+            raise BlogNotFoundException
+
+        return blog
+
+    async def get_validators_by_id(self, blog_id: UUID) -> Validators | None:
+        """
+        Compute the validators of a blog post summary.
+
+        Args:
+            blog_id (UUID): The unique identifier of the blog post.
+
+        Returns:
+            Validators | None: The validators, or None if the blog does not exist.
+        """
+
+        result = await self.read_session.execute(
+            select(
+                BlogModel.updated_at, BlogModel.like_count, BlogModel.comment_count
+            ).where(BlogModel.id == blog_id, BlogModel.deleted_at.is_(None))
+        )
+        blog = result.first()
+
+        return make_validators(*blog) if blog else None
+
+    async def find_by_id(
+        self, blog_id: UUID, session: AsyncSession | None = None
+    ) -> BlogResponse | None:
+        """
+        Read the metadata of a blog post from the database, bypassing the blog cache.
+
+        Args:
+            blog_id (UUID): The unique identifier of the blog post.
+            session (AsyncSession | None): The session to read with, the read session by
+                default.
+
+        Returns:
+            BlogResponse | None: The blog post summary, or None if it does not exist.
+        """
+
+        result = await (session or self.read_session).execute(
+            select(*BLOG_SUMMARY_COLUMNS).where(
                 BlogModel.id == blog_id, BlogModel.deleted_at.is_(None)
             )
         )
+        blog = result.first()
+
+        return BlogResponse.model_validate(blog) if blog else None
+
+    async def _load_json(self, blog_id: UUID) -> RawJSON | None:
+        # Every client is served the cached entry, so it must not come from a replica
+        # that has not caught up with the write that evicted the previous one.
+        async with primary_read_session() as session:
+            blog = await self.find_by_id(blog_id, session)
+        return RawJSON(blog.model_dump_json(by_alias=True).encode()) if blog else None
+
+    async def get_page(self, blog_id: UUID, user_id: UUID, size: int) -> RawJSON:
+        """
+        Retrieve everything a blog page shows in a single statement.
+
+        Postgres builds the whole JSON document: the blog with its content, the first
+        page of its top-level comments as :meth:`CommentService.get_parent_comments`
+        returns it, and whether the user liked the blog. The text is passed on as is,
+        without loading rows or response models.
+
+        Args:
+            blog_id (UUID): The unique identifier of the blog post.
+            user_id (UUID): The unique identifier of the current user.
+            size (int): The page size of the comments.
+
+        Raises:
+            BlogNotFoundException: If no blog with the given ID exists.
+
+        Returns:
+            RawJSON: The encoded BlogPageResponse.
+        """
+        keys = (CommentModel.created_at, CommentModel.id)
+        # One row more than the page tells whether a next page exists.
+        page = (
+            select(
+                CommentModel.id,
+                CommentModel.content,
+                CommentModel.author_id,
+                CommentModel.like_count,
+                CommentModel.reply_count,
+                cursor_expression(keys).label("cursor"),
+                func.row_number()
+                .over(order_by=[key.desc() for key in keys])
+                .label("position"),
+            )
+            .where(
+                CommentModel.blog_id == blog_id,
+                CommentModel.parent_comment_id.is_(None),
+            )
+            .order_by(*(key.desc() for key in keys))
+            .limit(size + 1)
+            .subquery("page")
+        )
+        in_page = page.c.position <= size
+        comments = select(
+            func.json_build_object(
+                "items",
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            json_object(BaseCommentResponse, page.c), page.c.position
+                        )
+                    ).filter(in_page),
+                    func.json_build_array(),
+                ),
+                "nextCursor",
+                case(
+                    (
+                        func.count() > size,
+                        func.max(page.c.cursor).filter(page.c.position == size),
+                    )
+                ),
+                "previousCursor",
+                null(),
+            )
+        ).scalar_subquery()
+        liked = exists().where(
+            LikeModel.blog_id == blog_id, LikeModel.user_id == user_id
+        )
+
+        document = await self.read_session.scalar(
+            select(
+                cast(
+                    func.json_build_object(
+                        "blog",
+                        json_object(BlogContentResponse, BlogModel),
+                        "comments",
+                        comments,
+                        "liked",
+                        liked,
+                    ),
+                    Text,
+                )
+            ).where(BlogModel.id == blog_id, BlogModel.deleted_at.is_(None))
+        )
+
+        if document is None:
+            raise BlogNotFoundException
+
+        return RawJSON(document.encode())
+
+    async def get_content_by_id(self, blog_id: UUID) -> BlogContentResponse:
+        """
+        Retrieve a blog post including its content body.
+
+        Args:
+            blog_id (UUID): The unique identifier of the blog post.
+
+        Raises:
+            BlogNotFoundException: If no blog with the given ID exists.
+
+        Returns:
+            BlogContentResponse: The blog post summary along with its content.
+        """
+
+        result = await self.read_session.execute(
+            select(*BLOG_SUMMARY_COLUMNS, BlogModel.content).where(
+                BlogModel.id == blog_id, BlogModel.deleted_at.is_(None)
+            )
+        )
+        blog = result.first()
 
         if not blog:
             raise BlogNotFoundException
 
-        return blog
+        return BlogContentResponse.model_validate(blog)
 
     async def delete_by_id(self, blog_id: UUID) -> dict[str, str]:
         """
@@ -126,4 +528,6 @@ class BlogService:
 
         blog.deleted_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
+        await evict(self.session, blog_tag(blog_id), BLOG_LIST_TAG)
+
         return {"message": constants.BLOG_DELETE_SUCCESS}
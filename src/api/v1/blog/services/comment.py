@@ -2,12 +2,12 @@ from typing import Annotated, Sequence
 from uuid import UUID
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from database.db import db_session
+from database.db import db_read_session, db_session
 from src import constants
+from src.api.v1.blog.cache import blog_tag, comment_tag, evict
 from src.api.v1.blog.exceptions import (
     BlogNotFoundException,
     CommentNotFoundException,
@@ -17,9 +17,18 @@ from src.api.v1.blog.exceptions import (
     ParentCommentNotFoundException,
 )
 from src.api.v1.blog.models import BlogModel, CommentLikeModel, CommentModel
-from src.api.v1.blog.schemas.response import CommentLikeResponse
+from src.api.v1.blog.schemas.response import (
+    BaseCommentResponse,
+    BlogCommentResponse,
+    BlogResponse,
+    CommentLikeResponse,
+)
+from src.api.v1.blog.services.blog import BLOG_SUMMARY_COLUMNS
 from src.api.v1.user.enums import RoleEnum
 from src.api.v1.user.models import UserModel
+from src.core.utils.pagination import CursorParams, paginate_by_keyset
+from src.core.utils.toggle import toggle_link
+from src.core.utils.validators import Validators, checksum, make_validators
 
 
 class CommentService:
@@ -28,17 +37,24 @@ class CommentService:
 
     Attributes:
         session (AsyncSession): Asynchronous SQLAlchemy session injected via dependency.
+        read_session (AsyncSession): Read-only session used by the read methods.
     """
 
-    def __init__(self, session: Annotated[AsyncSession, Depends(db_session)]) -> None:
+    def __init__(
+        self,
+        session: Annotated[AsyncSession, Depends(db_session)],
+        read_session: Annotated[AsyncSession, Depends(db_read_session)],
+    ) -> None:
         """
         Initialize BlogService with an asynchronous database session.
 
         Args:
             session (AsyncSession): An asynchronous database session provided by dependency injection.
+            read_session (AsyncSession): A read-only session, bound to the read replica when one is usable.
         """
 
         self.session = session
+        self.read_session = read_session
 
     async def create_comment(
         self,
@@ -50,6 +66,9 @@ class CommentService:
         """
         Create a new comment on a blog or as a reply to another comment.
 
+        The comment counter of the blog, and the reply counter of the parent comment for
+        replies, are incremented in the same transaction.
+
         Args:
             content (str): The text content of the comment.
             blog_id (UUID): The blog being commented on.
@@ -58,28 +77,47 @@ class CommentService:
 
         Returns:
             CommentModel: The newly created comment instance.
+
+        Raises:
+            BlogNotFoundException: If the blog does not exist or is deleted.
+            ParentCommentNotFoundException: If the parent comment does not exist.
+            InvalidParentCommentNestingException: If the parent comment is itself a reply.
+            InvalidParentCommentBlogException: If the parent comment belongs to another blog.
         """
 
-        blog = await self.session.scalar(
-            select(BlogModel).where(
-                BlogModel.id == blog_id, BlogModel.deleted_at.is_(None)
+        blog_found = await self.session.scalar(
+            update(BlogModel)
+            .where(BlogModel.id == blog_id, BlogModel.deleted_at.is_(None))
+            .values(
+                comment_count=BlogModel.comment_count + 1,
+                **BlogModel.preserve_updated_at(),
             )
+            .returning(BlogModel.id)
         )
 
-        if not blog:
+        if not blog_found:
             raise BlogNotFoundException
 
         if parent_comment_id:
             parent_comment = await self.session.scalar(
                 select(CommentModel).where(CommentModel.id == parent_comment_id)
             )
-            if parent_comment.parent_comment_id:
-                raise InvalidParentCommentNestingException
             if not parent_comment:
                 raise ParentCommentNotFoundException
+            if parent_comment.parent_comment_id:
+                raise InvalidParentCommentNestingException
             if parent_comment.blog_id != blog_id:
                 raise InvalidParentCommentBlogException
 
+            await self.session.execute(
+                update(CommentModel)
+                .where(CommentModel.id == parent_comment_id)
+                .values(
+                    reply_count=CommentModel.reply_count + 1,
+                    **CommentModel.preserve_updated_at(),
+                )
+            )
+
         comment = CommentModel.create(
             content=content,
             author_id=user.id,
@@ -88,31 +126,128 @@ class CommentService:
         )
 
         self.session.add(comment)
+
+        if parent_comment_id:
+            await evict(self.session, blog_tag(blog_id), comment_tag(parent_comment_id))
+        else:
+            await evict(self.session, blog_tag(blog_id))
+
         return comment
 
-    async def get_parent_comments(self, blog_id: UUID) -> BlogModel:
+    async def get_parent_comments(
+        self, blog_id: UUID, params: CursorParams
+    ) -> BlogCommentResponse:
         """
-        Retrieve a blog along with its top-level (parent) comments.
+        Retrieve a blog along with a page of its top-level (parent) comments.
+
+        The blog header is loaded on its own, and the comments are filtered on
+        ``parent_comment_id IS NULL`` and keyset-paginated by ``(created_at, id)``,
+        newest first.
 
         Args:
             blog_id (UUID): The unique identifier of the blog.
+            params (CursorParams): The opaque cursor and page size of the comments.
 
         Returns:
-            BlogModel: The blog instance including its parent comments.
+            BlogCommentResponse: The blog summary and a page of its parent comments.
 
         Raises:
             BlogNotFoundException: If the blog with the given ID does not exist or is deleted.
         """
-        blog = await self.session.scalar(
-            select(BlogModel)
-            .options(joinedload(BlogModel.comments))
-            .where(BlogModel.id == blog_id, BlogModel.deleted_at.is_(None))
+        result = await self.read_session.execute(
+            select(*BLOG_SUMMARY_COLUMNS).where(
+                BlogModel.id == blog_id, BlogModel.deleted_at.is_(None)
+            )
         )
+        blog = result.first()
 
         if not blog:
             raise BlogNotFoundException
 
-        return blog
+        comments = await paginate_by_keyset(
+            session=self.read_session,
+            query=select(
+                CommentModel.id,
+                CommentModel.content,
+                CommentModel.author_id,
+                CommentModel.like_count,
+                CommentModel.reply_count,
+            ).where(
+                CommentModel.blog_id == blog_id,
+                CommentModel.parent_comment_id.is_(None),
+            ),
+            keys=(CommentModel.created_at, CommentModel.id),
+            params=params,
+            transformer=lambda rows: [
+                BaseCommentResponse.model_validate(row) for row in rows
+            ],
+        )
+
+        return BlogCommentResponse(
+            blog=BlogResponse.model_validate(blog), comments=comments
+        )
+
+    async def get_parent_comments_validators(self, blog_id: UUID) -> Validators | None:
+        """
+        Compute the validators of the pages of a blog's top-level comments.
+
+        Args:
+            blog_id (UUID): The unique identifier of the blog.
+
+        Returns:
+            Validators | None: The validators, changing whenever the blog summary or
+                its top-level comments change, or None if the blog does not exist.
+        """
+        result = await self.read_session.execute(
+            select(
+                BlogModel.updated_at,
+                BlogModel.like_count,
+                BlogModel.comment_count,
+                func.max(CommentModel.updated_at),
+                func.count(CommentModel.id),
+                checksum(
+                    CommentModel.id, CommentModel.like_count, CommentModel.reply_count
+                ),
+            )
+            .outerjoin(
+                CommentModel,
+                (CommentModel.blog_id == BlogModel.id)
+                & CommentModel.parent_comment_id.is_(None),
+            )
+            .where(BlogModel.id == blog_id, BlogModel.deleted_at.is_(None))
+            .group_by(BlogModel.id)
+        )
+        row = result.first()
+
+        if not row:
+            return None
+
+        blog_updated_at, like_count, comment_count, comments_updated_at, *state = row
+        last_modified = max(filter(None, (blog_updated_at, comments_updated_at)))
+
+        return make_validators(last_modified, like_count, comment_count, *state)
+
+    async def get_replies_validators(self, comment_id: UUID) -> Validators:
+        """
+        Compute the validators of the replies to a comment.
+
+        Args:
+            comment_id (UUID): The unique identifier of the parent comment.
+
+        Returns:
+            Validators: The validators, changing whenever a reply is added, removed or
+                has its like counter updated.
+        """
+        result = await self.read_session.execute(
+            select(
+                func.max(CommentModel.updated_at),
+                func.count(),
+                checksum(CommentModel.id, CommentModel.like_count),
+            ).where(CommentModel.parent_comment_id == comment_id)
+        )
+        last_modified, *state = result.one()
+
+        return make_validators(last_modified, *state)
 
     async def get_replies(self, comment_id: UUID) -> Sequence[CommentModel]:
         """
@@ -125,8 +260,10 @@ class CommentService:
             Sequence[CommentModel]: A list of replies to the specified comment.
         """
 
-        comments = await self.session.scalars(
-            select(CommentModel).where(CommentModel.parent_comment_id == comment_id)
+        comments = await self.read_session.scalars(
+            select(CommentModel)
+            .where(CommentModel.parent_comment_id == comment_id)
+            .order_by(CommentModel.created_at, CommentModel.id)
         )
 
         return comments.all()
@@ -138,38 +275,45 @@ class CommentService:
         Toggle like status for a comment.
 
         If the user has already liked the comment, the like will be removed (unlike).
-        Otherwise, a new like will be added.
+        Otherwise, a new like will be added. The toggle runs as a single atomic statement.
 
         Args:
             comment_id (UUID): The unique identifier of the comment.
             user (UserModel): The currently authenticated user.
 
         Returns:
-            CommentLikeResponse: The updated like status of the comment.
+            CommentLikeResponse: The updated like status and like count of the comment.
+
+        Raises:
+            CommentNotFoundException: If the comment does not exist.
         """
 
-        existing_like = await self.session.scalar(
-            select(CommentLikeModel).where(
-                CommentLikeModel.user_id == user.id,
-                CommentLikeModel.comment_id == comment_id,
-            )
+        result = await toggle_link(
+            session=self.session,
+            target=CommentModel.id,
+            target_filter=CommentModel.id == comment_id,
+            counter=CommentModel.like_count,
+            link=CommentLikeModel.comment_id,
+            user=CommentLikeModel.user_id,
+            user_id=user.id,
+            constraint="unique_user_comment_like",
         )
 
-        if existing_like:
-            await self.session.delete(existing_like)
-
-            return CommentLikeResponse(comment_id=comment_id, like=False)
+        if not result.found:
+            raise CommentNotFoundException
 
-        like = CommentLikeModel.create(user_id=user.id, comment_id=comment_id)
+        await evict(self.session, comment_tag(comment_id))
 
-        self.session.add(like)
-        return CommentLikeResponse(comment_id=comment_id, like=True)
+        return CommentLikeResponse(
+            comment_id=comment_id, like=result.liked, total_likes=result.total
+        )
 
     async def remove_comment(self, user: UserModel, comment_id: UUID) -> dict[str, str]:
         """
         Delete a comment if the user is authorized.
 
-        Only the comment's author or an admin can delete the comment.
+        Only the comment's author or an admin can delete the comment. The blog's comment
+        counter and the parent's reply counter are decremented in the same transaction.
 
         Args:
             user (UserModel): The currently authenticated user.
@@ -182,8 +326,22 @@ class CommentService:
             CommentNotFoundException: If the comment does not exist.
             InvalidCredsException: If the user is not authorized to delete the comment.
         """
+        # Rows are locked in the order create_comment takes them, the blog first, so a
+        # reply added to the comment meanwhile cannot deadlock with the removal.
+        blog_id = await self.session.scalar(
+            select(BlogModel.id)
+            .join(CommentModel, CommentModel.blog_id == BlogModel.id)
+            .where(CommentModel.id == comment_id)
+            .with_for_update(of=BlogModel)
+        )
+
+        if not blog_id:
+            raise CommentNotFoundException
+
+        # Locking the comment serializes the removal with replies being added to it, so
+        # its reply counter is exact when subtracted from the blog counter.
         comment = await self.session.scalar(
-            select(CommentModel).where(CommentModel.id == comment_id)
+            select(CommentModel).where(CommentModel.id == comment_id).with_for_update()
         )
 
         if not comment:
@@ -192,5 +350,28 @@ class CommentService:
         if user.role.name != RoleEnum.ADMIN and comment.author_id != user.id:
             raise InvalidCredsException
 
+        await self.session.execute(
+            update(BlogModel)
+            .where(BlogModel.id == comment.blog_id)
+            .values(
+                comment_count=BlogModel.comment_count - 1 - comment.reply_count,
+                **BlogModel.preserve_updated_at(),
+            )
+        )
+
+        if comment.parent_comment_id:
+            await self.session.execute(
+                update(CommentModel)
+                .where(CommentModel.id == comment.parent_comment_id)
+                .values(
+                    reply_count=CommentModel.reply_count - 1,
+                    **CommentModel.preserve_updated_at(),
+                )
+            )
+
         await self.session.delete(comment)
+
+        # Cached replies lists are tagged with every reply they hold.
+        await evict(self.session, blog_tag(comment.blog_id), comment_tag(comment.id))
+
         return {"message": constants.COMMENT_DELETED_SUCCESSFULLY}
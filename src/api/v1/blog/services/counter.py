@@ -0,0 +1,107 @@
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, aliased
+
+from src.api.v1.blog.models import BlogModel, CommentLikeModel, CommentModel, LikeModel
+
+
+class CounterService:
+    """
+    Service class recomputing the denormalized like, comment and reply counters.
+
+    It commits its own batches, so it is given a plain session rather than the
+    request-scoped transaction.
+
+    Attributes:
+        session (AsyncSession): Asynchronous SQLAlchemy session.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize CounterService with an asynchronous database session.
+
+        Args:
+            session (AsyncSession): An asynchronous database session without an open transaction.
+        """
+
+        self.session = session
+
+    async def reconcile(self, batch_size: int) -> dict[str, int]:
+        """
+        Recompute every drifted counter, walking blogs and comments in primary key batches.
+
+        Each batch is committed on its own, so rows are only locked for one batch at a time.
+
+        Args:
+            batch_size (int): Number of rows checked per batch.
+
+        Returns:
+            dict[str, int]: Number of fixed rows per table.
+        """
+        replies = aliased(CommentModel)
+
+        blogs = await self._reconcile_table(
+            key=BlogModel.id,
+            counters={
+                BlogModel.like_count: select(func.count())
+                .where(LikeModel.blog_id == BlogModel.id)
+                .scalar_subquery(),
+                BlogModel.comment_count: select(func.count())
+                .where(CommentModel.blog_id == BlogModel.id)
+                .scalar_subquery(),
+            },
+            batch_size=batch_size,
+        )
+        comments = await self._reconcile_table(
+            key=CommentModel.id,
+            counters={
+                CommentModel.like_count: select(func.count())
+                .where(CommentLikeModel.comment_id == CommentModel.id)
+                .scalar_subquery(),
+                CommentModel.reply_count: select(func.count())
+                .where(replies.parent_comment_id == CommentModel.id)
+                .scalar_subquery(),
+            },
+            batch_size=batch_size,
+        )
+
+        return {"blogs": blogs, "comments": comments}
+
+    async def _reconcile_table(
+        self,
+        key: InstrumentedAttribute,
+        counters: dict[InstrumentedAttribute, Any],
+        batch_size: int,
+    ) -> int:
+        fixed = 0
+        last_key: UUID | None = None
+
+        while True:
+            # Locking the batch first makes the counts below see every committed
+            # change, while concurrent writers wait for the batch to be committed.
+            batch = select(key).order_by(key).limit(batch_size).with_for_update()
+            if last_key is not None:
+                batch = batch.where(key > last_key)
+
+            keys = (await self.session.scalars(batch)).all()
+            if not keys:
+                break
+
+            result = await self.session.scalars(
+                update(key.class_)
+                .where(
+                    key.in_(keys),
+                    or_(*(column != actual for column, actual in counters.items())),
+                )
+                .values({**counters, **key.class_.preserve_updated_at()})
+                .returning(key)
+            )
+            fixed += len(result.all())
+
+            await self.session.commit()
+            last_key = keys[-1]
+
+        return fixed
@@ -4,14 +4,16 @@ from uuid import UUID
 from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
-from database.db import db_session
+from database.db import db_read_session, db_session
+from src.api.v1.blog.cache import blog_tag, evict
 from src.api.v1.blog.exceptions import BlogNotFoundException
 from src.api.v1.blog.models.blogs import BlogModel
 from src.api.v1.blog.models.likes import LikeModel
 from src.api.v1.blog.schemas.response import LikeResponse, UserLikedResponse, UserResponse
 from src.api.v1.user.models.user import UserModel
+from src.core.utils.pagination import CursorParams, paginate_by_keyset
+from src.core.utils.toggle import toggle_link
 
 
 class LikeService:
@@ -20,77 +22,99 @@ class LikeService:
 
     Attributes:
         session (AsyncSession): Asynchronous SQLAlchemy session injected via dependency.
+        read_session (AsyncSession): Read-only session used by the read methods.
     """
 
-    def __init__(self, session: Annotated[AsyncSession, Depends(db_session)]) -> None:
+    def __init__(
+        self,
+        session: Annotated[AsyncSession, Depends(db_session)],
+        read_session: Annotated[AsyncSession, Depends(db_read_session)],
+    ) -> None:
         """
         Initialize BlogService with an asynchronous database session.
 
         Args:
             session (AsyncSession): An asynchronous database session provided by dependency injection.
+            read_session (AsyncSession): A read-only session, bound to the read replica when one is usable.
         """
 
         self.session = session
+        self.read_session = read_session
 
     async def create(self, user: UserModel, blog_id: UUID) -> LikeResponse:
         """
         Add or remove a like for a blog post by the given user.
 
         If the blog post exists and the user has already liked it, the like is removed (dislike).
-        If the user has not liked the blog post yet, a new like is added.
+        If the user has not liked the blog post yet, a new like is added. The toggle runs as a
+        single atomic statement, so concurrent requests never conflict on the unique constraint.
 
         Args:
             user (UserModel): The user performing the like or unlike action.
             blog_id (UUID): The unique identifier of the blog post to like or unlike.
 
         Returns:
-            LikeResponse: An object indicating the blog ID and the like status (True if liked, False if unliked).
+            LikeResponse: An object indicating the blog ID, the like status (True if liked, False if unliked)
+                and the current like count.
 
         Raises:
             BlogNotFoundException: If the blog post with the given ID does not exist.
         """
 
-        blog = await self.session.scalar(
-            select(BlogModel).where(BlogModel.id == blog_id)
+        result = await toggle_link(
+            session=self.session,
+            target=BlogModel.id,
+            target_filter=(BlogModel.id == blog_id) & BlogModel.deleted_at.is_(None),
+            counter=BlogModel.like_count,
+            link=LikeModel.blog_id,
+            user=LikeModel.user_id,
+            user_id=user.id,
+            constraint="unique_user_blog_like",
         )
 
-        if not blog:
+        if not result.found:
             raise BlogNotFoundException
 
-        existing_like = await self.session.scalar(
-            select(LikeModel).where(
-                LikeModel.user_id == user.id, LikeModel.blog_id == blog_id
-            )
-        )
-
-        if existing_like:
-            await self.session.delete(existing_like)
-
-            return LikeResponse(blog_id=blog_id, like=False)
+        await evict(self.session, blog_tag(blog_id))
 
-        like = LikeModel.create(user_id=user.id, blog_id=blog_id)
-
-        self.session.add(like)
-        return LikeResponse(blog_id=blog_id, like=True)
+        return LikeResponse(
+            blog_id=blog_id, like=result.liked, total_likes=result.total
+        )
 
-    async def get_likes(self, blog_id: UUID) -> UserLikedResponse:
+    async def get_likes(self, blog_id: UUID, params: CursorParams) -> UserLikedResponse:
         """
-        Retrieve the list of users who liked the specified blog and the total like count.
+        Retrieve a page of the users who liked the specified blog and the total like count.
+
+        Users are keyset-paginated by ``(likes.created_at, likes.id)``, most recent like
+        first, and only their public columns are selected. The total comes from the
+        blog's like counter.
 
         Args:
             blog_id (UUID): The unique identifier of the blog.
+            params (CursorParams): The opaque cursor and page size.
 
         Returns:
-            UserLikedResponse: The response containing the blog ID, list of users who liked the blog, and the total like count.
+            UserLikedResponse: The response containing the blog ID, a page of users who liked the blog, and the total like count.
+
+        Raises:
+            BlogNotFoundException: If the blog does not exist.
         """
 
-        result = await self.session.scalars(
-            select(LikeModel)
-            .options(joinedload(LikeModel.user))
-            .where(LikeModel.blog_id == blog_id)
+        total_likes = await self.read_session.scalar(
+            select(BlogModel.like_count).where(BlogModel.id == blog_id)
         )
-        likes = result.all()
 
-        users = [UserResponse.model_validate(like.user) for like in likes if like.user]
+        if total_likes is None:
+            raise BlogNotFoundException
+
+        users = await paginate_by_keyset(
+            session=self.read_session,
+            query=select(UserModel.id, UserModel.email)
+            .join(LikeModel, LikeModel.user_id == UserModel.id)
+            .where(LikeModel.blog_id == blog_id),
+            keys=(LikeModel.created_at, LikeModel.id),
+            params=params,
+            transformer=lambda rows: [UserResponse.model_validate(row) for row in rows],
+        )
 
-        return UserLikedResponse(blog_id=blog_id, user=users, total_likes=len(likes))
+        return UserLikedResponse(blog_id=blog_id, users=users, total_likes=total_likes)
@@ -9,9 +9,10 @@ from src.api.v1.user.schemas.response import RoleResponse
 from src.api.v1.user.services.roles import RoleService
 from src.core.auth import role_required
 from src.core.basic_auth import basic_auth
+from src.core.utils.routing import SerializedRoute
 from src.core.utils.schema import BaseResponse
 
-router = APIRouter(prefix="/roles", tags=["Roles"])
+router = APIRouter(prefix="/roles", tags=["Roles"], route_class=SerializedRoute)
 
 
 @router.post(
@@ -4,9 +4,10 @@ from fastapi import APIRouter, Body, Depends, status
 
 from src.api.v1.user.schemas import CreateUserRequest, UserResponse
 from src.api.v1.user.services import UserService
+from src.core.utils.routing import SerializedRoute
 from src.core.utils.schema import BaseResponse
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], route_class=SerializedRoute)
 
 
 @router.post(
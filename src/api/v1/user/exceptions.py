@@ -1,5 +1,10 @@
 from src import constants
-from src.core.exceptions import AlreadyExistsError, NotFoundError, UnauthorizedError
+from src.core.exceptions import (
+    AlreadyExistsError,
+    NotFoundError,
+    ServiceUnavailableError,
+    UnauthorizedError,
+)
 
 
 class InvalidCredsException(UnauthorizedError):
@@ -48,3 +53,11 @@ class UnauthorizedAccessException(UnauthorizedError):
     """
 
     message = constants.UNAUTHORIZEDACCESS
+
+
+class HashingBusyException(ServiceUnavailableError):
+    """
+    Raised when too many password hashing calls are already waiting for the hashing pool.
+    """
+
+    message = constants.HASHING_BUSY
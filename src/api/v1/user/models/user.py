@@ -3,7 +3,7 @@ from typing import Self
 from uuid import UUID
 
 from pydantic import EmailStr
-from sqlalchemy import ForeignKey
+from sqlalchemy import ForeignKey, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from database.db import Base
@@ -20,6 +20,7 @@ class UserModel(Base, TimeStampMixin):
         password (str): Hashed password for authentication.
         role_id (UUID): Foreign key referencing the user's role.
         role (RoleModel): Relationship to the user's role.
+        token_version (int): Version embedded in issued tokens; bumping it revokes them.
         blogs (list[BlogModel]): List of blogs authored by the user.
     """
 
@@ -31,6 +32,10 @@ class UserModel(Base, TimeStampMixin):
     role_id: Mapped[UUID] = mapped_column(ForeignKey("roles.id"), nullable=False)
     role: Mapped["RoleModel"] = relationship("RoleModel", back_populates="users")
 
+    token_version: Mapped[int] = mapped_column(
+        default=0, server_default=text("0"), nullable=False
+    )
+
     # foreign key for blog
     blogs: Mapped[list["BlogModel"]] = relationship(
         "BlogModel", back_populates="author"
@@ -0,0 +1,140 @@
+from typing import Sequence
+from uuid import UUID
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from src.api.v1.user.enums import RoleEnum
+from src.api.v1.user.models import RoleModel
+from src.api.v1.user.models.user import UserModel
+from src.core.broadcast import broadcast
+
+ROLES_CHANNEL = "roles"
+
+
+class RoleRegistry:
+    """
+    In-memory copy of the ``roles`` table.
+
+    The table holds a handful of rows that are almost never written, so every worker
+    keeps all of them and serves role reads without SQL. The copy is loaded at startup
+    and reloaded on first use after :meth:`clear`. The cached roles are detached from
+    any session.
+
+    Writes to the table call :meth:`invalidate`, which clears the copy of every worker
+    once the write commits.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initialize an empty, unloaded registry.
+        """
+        self._roles: dict[UUID, RoleModel] | None = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._roles is not None
+
+    async def load(self, session: AsyncSession) -> None:
+        """
+        Replace the cached roles with the ones in the database.
+
+        Args:
+            session (AsyncSession): The session to read the roles with.
+        """
+        roles = (await session.scalars(select(RoleModel))).all()
+        for role in roles:
+            if role in session:
+                session.expunge(role)
+        self._roles = {role.id: role for role in roles}
+
+    def clear(self) -> None:
+        """
+        Forget the cached roles, e.g. after a role was created.
+        """
+        self._roles = None
+
+    async def invalidate(self, session: AsyncSession) -> None:
+        """
+        Clear the cached roles of every worker once the transaction of a session commits.
+
+        Clearing earlier would let a concurrent read load the roles again before the
+        change is visible. The worker of the session clears its copy right away on
+        commit, the others when the broadcast reaches them.
+
+        Args:
+            session (AsyncSession): The session writing to the roles.
+        """
+        event.listen(
+            session.sync_session, "after_commit", lambda _: self.clear(), once=True
+        )
+        await broadcast.publish(session, ROLES_CHANNEL)
+
+    async def get_all(self, session: AsyncSession) -> Sequence[RoleModel]:
+        """
+        Return every role, loading them first if needed.
+
+        Args:
+            session (AsyncSession): The session to load the roles with.
+
+        Returns:
+            Sequence[RoleModel]: The roles.
+        """
+        if self._roles is None:
+            await self.load(session)
+        return list(self._roles.values())
+
+    async def get(self, session: AsyncSession, role_id: UUID) -> RoleModel | None:
+        """
+        Return a role by id.
+
+        Unknown ids reload the roles once, in case the role was created by another
+        worker since they were loaded.
+
+        Args:
+            session (AsyncSession): The session to load the roles with.
+            role_id (UUID): The unique identifier of the role.
+
+        Returns:
+            RoleModel | None: The role, or None if it does not exist.
+        """
+        if self._roles is None or role_id not in self._roles:
+            await self.load(session)
+        return self._roles.get(role_id)
+
+    async def get_by_name(
+        self, session: AsyncSession, name: RoleEnum
+    ) -> RoleModel | None:
+        """
+        Return a role by name, loading the roles first if needed.
+
+        Args:
+            session (AsyncSession): The session to load the roles with.
+            name (RoleEnum): The name of the role.
+
+        Returns:
+            RoleModel | None: The role, or None if it does not exist.
+        """
+        roles = await self.get_all(session)
+        return next((role for role in roles if role.name == name), None)
+
+    async def attach(self, session: AsyncSession, user: UserModel) -> UserModel:
+        """
+        Set the role of a user loaded without it, from the cached roles.
+
+        The user must be detached, so that the shared role is not added to the session.
+
+        Args:
+            session (AsyncSession): The session to load the roles with.
+            user (UserModel): The detached user.
+
+        Returns:
+            UserModel: The same user.
+        """
+        set_committed_value(user, "role", await self.get(session, user.role_id))
+        return user
+
+
+role_registry = RoleRegistry()
+broadcast.subscribe(ROLES_CHANNEL, lambda _: role_registry.clear())
@@ -1,14 +1,14 @@
 from typing import Annotated, Sequence
 
 from fastapi import Depends
-from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import load_only
 
-from database.db import db_session
+from database.db import db_read_session, db_session
 from src.api.v1.user.enums import RoleEnum
 from src.api.v1.user.exceptions import UserRoleAlreadyExists, UserRoleNotFound
 from src.api.v1.user.models import RoleModel
+from src.api.v1.user.registry import role_registry
 
 
 class RoleService:
@@ -17,14 +17,20 @@ class RoleService:
     and retrieving all available roles.
     """
 
-    def __init__(self, session: Annotated[AsyncSession, Depends(db_session)]) -> None:
+    def __init__(
+        self,
+        session: Annotated[AsyncSession, Depends(db_session)],
+        read_session: Annotated[AsyncSession, Depends(db_read_session)],
+    ) -> None:
         """
         Initialize the RoleService with a database session.
 
         Args:
             session (AsyncSession): An asynchronous SQLAlchemy session injected via dependency.
+            read_session (AsyncSession): A read-only session, bound to the read replica when one is usable.
         """
         self.session = session
+        self.read_session = read_session
 
     async def create(self, name: str) -> RoleModel:
         """
@@ -44,25 +50,27 @@ class RoleService:
         if name not in [r.value for r in RoleEnum]:
             raise UserRoleNotFound
 
-        role = await self.session.scalar(
-            select(RoleModel)
-            .options(load_only(RoleModel.id))
-            .where(RoleModel.name == name)
-        )
-        if role:
+        if await role_registry.get_by_name(self.session, name):
             raise UserRoleAlreadyExists
 
         role = RoleModel.create(name=name)
         self.session.add(role)
 
+        # The registry of this worker may not know yet a role just created by another.
+        try:
+            await self.session.flush()
+        except IntegrityError:
+            raise UserRoleAlreadyExists
+
+        await role_registry.invalidate(self.session)
+
         return role
 
     async def get_all(self) -> Sequence[RoleModel]:
         """
-        Retrieve all roles from the database.
+        Retrieve all roles, from the in-memory role registry.
 
         Returns:
             Sequence[RoleModel]: A list of all available role records.
         """
-        result = await self.session.scalars(select(RoleModel))
-        return result.all()
+        return await role_registry.get_all(self.read_session)
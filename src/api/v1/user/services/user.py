@@ -9,8 +9,9 @@ from sqlalchemy.orm import load_only
 from database.db import db_session
 from src.api.v1.auth.utils.hashing import hash_password
 from src.api.v1.user.exceptions import UserAlreadyExists, UserRoleNotFound
-from src.api.v1.user.models import RoleModel
 from src.api.v1.user.models.user import UserModel
+from src.api.v1.user.registry import role_registry
+from src.core.cache import principal_cache
 
 
 class UserService:
@@ -44,9 +45,7 @@ class UserService:
             UserModel: The newly created user instance.
         """
 
-        role = await self.session.scalar(
-            select(RoleModel).where(RoleModel.id == role_id)
-        )
+        role = await role_registry.get(self.session, role_id)
 
         if not role:
             raise UserRoleNotFound
@@ -62,7 +61,10 @@ class UserService:
         hashed_pwd = await hash_password(password)
 
         user = UserModel.create(email=email, password=hashed_pwd, role_id=role_id)
-        user.role = role
+        user.role = await self.session.merge(role, load=False)
 
         self.session.add(user)
+
+        # A principal cached for an earlier account with this email must not outlive it.
+        await principal_cache.revoke_user(self.session, email)
         return user
@@ -7,11 +7,15 @@ from src.constants.messages import (
     DUPLICATE_BLOG,
     ERROR,
     EXPIRED_TOKEN,
+    HASHING_BUSY,
     INVALID_CRED,
+    INVALID_CURSOR,
     INVALID_PARENT_COMMENT_BLOG,
     INVALID_PARENT_COMMENT_NESTING,
     INVALID_TOKEN,
+    LOGOUT_SUCCESS,
     PARENT_COMMENT_NOT_FOUND,
+    REVOKED_TOKEN,
     SOMETHING_WENT_WRONG,
     SUCCESS,
     UNAUTHORIZEDACCESS,
@@ -25,6 +29,7 @@ __all__ = [
     "INVALID_CRED",
     "EXPIRED_TOKEN",
     "INVALID_TOKEN",
+    "REVOKED_TOKEN",
     "SOMETHING_WENT_WRONG",
     "SUCCESS",
     "ERROR",
@@ -42,4 +47,7 @@ __all__ = [
     "INVALID_PARENT_COMMENT_NESTING",
     "COMMENT_DELETED_SUCCESSFULLY",
     "COMMENT_NOT_FOUND",
+    "HASHING_BUSY",
+    "LOGOUT_SUCCESS",
+    "INVALID_CURSOR",
 ]
@@ -6,6 +6,8 @@ INVALID_TOKEN = "Invalid Token!"
 
 EXPIRED_TOKEN = "Expired Token!"
 
+REVOKED_TOKEN = "Revoked Token!"
+
 ERROR = "Error"
 
 DUPLICATE_BLOG = "Blog already exists."
@@ -37,3 +39,9 @@ INVALID_PARENT_COMMENT_NESTING = "Only one level of child comments is allowed."
 COMMENT_DELETED_SUCCESSFULLY = "Comment deleted successfully."
 
 COMMENT_NOT_FOUND = "Comment not found"
+
+HASHING_BUSY = "Too many authentication requests, please try again."
+
+LOGOUT_SUCCESS = "Logged out successfully"
+
+INVALID_CURSOR = "Invalid pagination cursor."
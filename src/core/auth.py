@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Annotated
+from uuid import UUID
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -7,7 +9,6 @@ from jose import JWTError, jwt
 from jwt import DecodeError, ExpiredSignatureError
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 import src.constants.messages as constants
 from config.config import jwt_settings, app_settings
@@ -16,7 +17,10 @@ from src.api.enums import TokenTypeEnum
 from src.api.v1.user.enums import RoleEnum
 from src.api.v1.user.exceptions import UnauthorizedAccessException, UserNotFound
 from src.api.v1.user.models.user import UserModel
+from src.api.v1.user.registry import role_registry
+from src.core.cache import principal_cache
 from src.core.exceptions import InvalidJWTTokenException
+from src.core.utils.timing import timed
 
 SECRET_KEY = jwt_settings.JWT_SECRET_KEY
 ALGORITHM = jwt_settings.JWT_ALGORITHM
@@ -26,13 +30,50 @@ REFRESH_TOKEN_EXPIRE_DAYS = jwt_settings.REFRESH_TOKEN_EXP
 security = HTTPBearer()
 
 
-def create_token(email: str, token_type: str):
+@dataclass(frozen=True, slots=True)
+class PrincipalRole:
+    """
+    Role of a :class:`Principal`, shaped like ``RoleModel`` for the fields routes read.
+    """
+
+    name: RoleEnum
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    Lightweight authenticated user built from verified token claims, without any SQL.
+
+    Exposes the ``UserModel`` attributes that read-only routes rely on.
+    """
+
+    id: UUID
+    email: str
+    role: PrincipalRole
+    token_version: int
+
+
+def create_token(
+    email: str,
+    token_type: str,
+    user_id: UUID | None = None,
+    role: str | None = None,
+    token_version: int | None = None,
+):
     """
     Generate a JWT token (access or refresh) containing the user's email and token type.
 
+    The token version lets the user revoke the token later; tokens issued without one
+    are rejected wherever the user is confirmed against the database. When
+    ``JWT_CLAIMS_PRINCIPAL`` is enabled the token also carries the user id and role name,
+    so read routes can skip the user lookup.
+
     Args:
         email (str): The email of the user (subject of the token).
         token_type (str): The type of the token ('access' or 'refresh').
+        user_id (UUID | None): The unique identifier of the user.
+        role (str | None): The name of the user's role.
+        token_version (int | None): The user's current token version.
 
     Returns:
         str: The encoded JWT token as a string.
@@ -54,6 +95,12 @@ def create_token(email: str, token_type: str):
         "type": token_type,
     }
 
+    if token_version is not None:
+        claims["ver"] = token_version
+
+    if jwt_settings.JWT_CLAIMS_PRINCIPAL and user_id is not None:
+        claims.update({"uid": str(user_id), "role": role})
+
     encoded_jwt = jwt.encode(
         claims, key=jwt_settings.JWT_SECRET_KEY, algorithm=jwt_settings.JWT_ALGORITHM
     )
@@ -100,10 +147,110 @@ def decode_token(token: str, expected_type: str):
         )
 
 
+def get_claims_principal(payload: dict) -> Principal | None:
+    """
+    Build a principal straight from verified token claims.
+
+    Args:
+        payload (dict): The decoded and validated token payload.
+
+    Returns:
+        Principal | None: The principal, or None when claims mode is disabled or the token
+            was issued without the user claims.
+    """
+    if not jwt_settings.JWT_CLAIMS_PRINCIPAL:
+        return None
+
+    user_id = payload.get("uid")
+    role = payload.get("role")
+    token_version = payload.get("ver")
+
+    if user_id is None or role is None or token_version is None:
+        return None
+
+    return Principal(
+        id=UUID(user_id),
+        email=payload["sub"],
+        role=PrincipalRole(name=RoleEnum(role)),
+        token_version=token_version,
+    )
+
+
+async def get_user_for_token(
+    session: AsyncSession, token: str, payload: dict
+) -> UserModel:
+    """
+    Load the user a token was issued for and make sure the token was not revoked.
+
+    The user is served from the principal cache when the same token was seen recently,
+    so only the first request of a token hits the database.
+
+    Args:
+        session (AsyncSession): The asynchronous database session.
+        token (str): The raw token, used as cache key.
+        payload (dict): The decoded and validated token payload.
+
+    Returns:
+        UserModel: The user the token belongs to.
+
+    Raises:
+        UserNotFound: If the user is not found in the database.
+        InvalidJWTTokenException: If the token version is missing or not the user's.
+    """
+    user = principal_cache.lookup(token)
+
+    if not user:
+        user = await session.scalar(
+            select(UserModel).where(UserModel.email == payload.get("sub"))
+        )
+
+        if not user:
+            raise UserNotFound
+
+        # The cached instance outlives this session, so it is detached from it first;
+        # otherwise a rollback of the request would expire it for every later request.
+        # Its role comes from the role registry instead of a join.
+        session.expunge(user)
+        await role_registry.attach(session, user)
+        principal_cache[token] = user
+
+    # Tokens without a version cannot be revoked, so they are never accepted.
+    if payload.get("ver") != user.token_version:
+        raise InvalidJWTTokenException(constants.REVOKED_TOKEN)
+
+    return user
+
+
+async def has_role(
+    session: AsyncSession, user: UserModel | Principal, role: RoleEnum
+) -> bool:
+    """
+    Whether a user holds a role.
+
+    Users loaded from the database are checked by comparing their role id with the id
+    of the role in the role registry; principals built from token claims only carry
+    the role name.
+
+    Args:
+        session (AsyncSession): The session to load the roles with, if needed.
+        user (UserModel | Principal): The authenticated user.
+        role (RoleEnum): The role to check.
+
+    Returns:
+        bool: True if the user holds the role.
+    """
+    if isinstance(user, Principal):
+        return user.role.name == role
+
+    expected = await role_registry.get_by_name(session, role)
+    return expected is not None and user.role_id == expected.id
+
+
 async def get_authenticated_user(
     session: Annotated[AsyncSession, Depends(db_session)],
     credentials: HTTPAuthorizationCredentials = Depends(security),
     required_role: RoleEnum | None = None,
+    verify: bool = True,
 ):
     """
     Retrieve the currently authenticated user and optionally validate their role.
@@ -112,31 +259,30 @@ async def get_authenticated_user(
         session (AsyncSession): The asynchronous database session.
         credentials (HTTPAuthorizationCredentials): Authorization credentials (Bearer token).
         required_role (RoleEnum | None): Optional role to validate against the user's role.
+        verify (bool): Confirm the user against the database. When False, a principal is
+            built from the token claims if the token carries them.
 
     Returns:
-        UserModel: The authenticated user.
+        UserModel | Principal: The authenticated user.
 
     Raises:
         UserNotFound: If the user is not found in the database.
+        InvalidJWTTokenException: If the token was revoked.
         UnauthorizedAccessException: If the user's role does not match the required role.
     """
-    token = credentials.credentials
-    payload = decode_token(token, expected_type=TokenTypeEnum.ACCESS)
-    email = payload.get("sub")
+    with timed("auth_time"):
+        token = credentials.credentials
+        payload = decode_token(token, expected_type=TokenTypeEnum.ACCESS)
 
-    user = await session.scalar(
-        select(UserModel)
-        .options(joinedload(UserModel.role))
-        .where(UserModel.email == email)
-    )
+        user = None if verify else get_claims_principal(payload)
 
-    if not user:
-        raise UserNotFound
+        if not user:
+            user = await get_user_for_token(session, token, payload)
 
-    if required_role and user.role.name != required_role:
-        raise UnauthorizedAccessException
+        if required_role and not await has_role(session, user, required_role):
+            raise UnauthorizedAccessException
 
-    return user
+        return user
 
 
 async def get_current_user(
@@ -144,7 +290,29 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
 ):
     """
-    Dependency to retrieve the currently authenticated user.
+    Dependency to retrieve the currently authenticated user for read-only routes.
+
+    With claims-only tokens this returns a :class:`Principal` without touching the database.
+
+    Args:
+        session (AsyncSession): The asynchronous database session.
+        credentials (HTTPAuthorizationCredentials): Authorization credentials (Bearer token).
+
+    Returns:
+        UserModel | Principal: The authenticated user.
+    """
+
+    return await get_authenticated_user(session, credentials, verify=False)
+
+
+async def get_verified_user(
+    session: Annotated[AsyncSession, Depends(db_session)],
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+):
+    """
+    Dependency to retrieve the authenticated user confirmed against the database.
+
+    Used by write and revocation-sensitive routes.
 
     Args:
         session (AsyncSession): The asynchronous database session.
@@ -157,12 +325,13 @@ async def get_current_user(
     return await get_authenticated_user(session, credentials)
 
 
-def role_required(required_role: RoleEnum):
+def role_required(required_role: RoleEnum, verify: bool = False):
     """
     Dependency generator to restrict route access based on the user's role.
 
     Args:
         required_role (RoleEnum): The role required to access the route.
+        verify (bool): Confirm the user against the database instead of trusting token claims.
 
     Returns:
         Depends: A FastAPI dependency that validates the user's role and returns the authenticated user.
@@ -177,7 +346,7 @@ def role_required(required_role: RoleEnum):
         credentials: HTTPAuthorizationCredentials = Depends(security),
     ):
         return await get_authenticated_user(
-            session, credentials, required_role=required_role
+            session, credentials, required_role=required_role, verify=verify
         )
 
     return Depends(dependency)
@@ -0,0 +1,133 @@
+import asyncio
+from collections import defaultdict
+from contextlib import suppress
+from typing import Callable
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.config import database_settings
+from src.core.utils import core_logger
+
+Subscriber = Callable[[str], None]
+
+
+class Broadcast:
+    """
+    Cross-worker notifications over Postgres ``LISTEN``/``NOTIFY``.
+
+    Every worker keeps one dedicated connection listening to the channels it subscribed
+    to. Messages are published inside the writer's transaction, so they are only
+    delivered once it commits, and every worker, including the publishing one, receives
+    them.
+
+    When the listening connection is lost, it is opened again and every subscriber is
+    called with an empty payload, as messages may have been missed meanwhile.
+    """
+
+    def __init__(self, dsn: str, keepalive_interval: float = 30.0) -> None:
+        """
+        Initialize the broadcast. Nothing is received before :meth:`start`.
+
+        Args:
+            dsn (str): The libpq connection string of the primary database.
+            keepalive_interval (float): Seconds between two checks of the connection.
+        """
+        self.dsn = dsn
+        self.keepalive_interval = keepalive_interval
+        self.subscribers: dict[str, list[Subscriber]] = defaultdict(list)
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, channel: str, subscriber: Subscriber) -> None:
+        """
+        Call a function with the payload of every message sent on a channel.
+
+        Subscribers run on the event loop and must not block.
+
+        Args:
+            channel (str): The channel name.
+            subscriber (Subscriber): Called with the payload of each message.
+        """
+        self.subscribers[channel].append(subscriber)
+
+    @staticmethod
+    async def publish(session: AsyncSession, channel: str, payload: str = "") -> None:
+        """
+        Send a message to every worker once the transaction of a session commits.
+
+        Args:
+            session (AsyncSession): The session of the write the message is about.
+            channel (str): The channel name.
+            payload (str): The message.
+        """
+        await session.execute(select(func.pg_notify(channel, payload)))
+
+    async def start(self) -> None:
+        """
+        Start listening in the background.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        """
+        Stop listening and close the connection.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _listen(self) -> None:
+        delay = 1.0
+        reconnecting = False
+
+        while True:
+            try:
+                connection = await asyncpg.connect(self.dsn)
+            except (OSError, asyncpg.PostgresError) as error:
+                core_logger.warning("Broadcast connection failed: %s", error)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 30.0)
+                reconnecting = True
+                continue
+
+            delay = 1.0
+            try:
+                for channel in self.subscribers:
+                    await connection.add_listener(channel, self._dispatch)
+                if reconnecting:
+                    for channel in self.subscribers:
+                        self._notify(channel, "")
+
+                while True:
+                    await asyncio.sleep(self.keepalive_interval)
+                    await connection.execute("SELECT 1")
+            except (OSError, asyncpg.PostgresError, asyncpg.InterfaceError) as error:
+                core_logger.warning("Broadcast connection lost: %s", error)
+                reconnecting = True
+            finally:
+                with suppress(Exception):
+                    await connection.close(timeout=5)
+
+    def _dispatch(self, _connection, _pid: int, channel: str, payload: str) -> None:
+        self._notify(channel, payload)
+
+    def _notify(self, channel: str, payload: str) -> None:
+        for subscriber in self.subscribers[channel]:
+            try:
+                subscriber(payload)
+            except Exception as error:
+                core_logger.warning(
+                    "Broadcast subscriber of %s failed: %s", channel, error
+                )
+
+
+broadcast = Broadcast(
+    make_url(database_settings.DATABASE_URL)
+    .set(drivername="postgresql")
+    .render_as_string(hide_password=False)
+)
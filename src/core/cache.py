@@ -0,0 +1,402 @@
+import asyncio
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Hashable, Iterable, NamedTuple
+from uuid import UUID
+
+from cachetools import TTLCache
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from config.config import cache_settings
+from src.core.broadcast import broadcast
+from src.core.metrics import MetricsRegistry, labels, metrics
+
+PRINCIPALS_CHANNEL = "principals"
+
+
+class MeteredTTLCache(TTLCache):
+    """
+    A bounded TTL/LRU cache that keeps hit, miss and eviction counters.
+
+    The cache is not thread-safe; it is meant to be used from the event loop thread only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def lookup(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Fetch a value while recording a hit or a miss.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): The value returned when the key is absent or expired.
+
+        Returns:
+            Any: The cached value or the default.
+        """
+        try:
+            value = self[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return value
+
+    def popitem(self) -> tuple[Hashable, Any]:
+        """
+        Evict the least recently used item because the cache is full.
+        """
+        item = super().popitem()
+        self.evictions += 1
+        return item
+
+    def invalidate(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        """
+        Remove every entry matching the predicate.
+
+        Args:
+            predicate (Callable[[Hashable, Any], bool]): Called with each key and value.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        keys = [key for key, value in list(self.items()) if predicate(key, value)]
+        for key in keys:
+            self.pop(key, None)
+        return len(keys)
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Ratio of hits over all lookups, or 0.0 when nothing was looked up yet.
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """
+        Snapshot of the cache counters.
+        """
+        return {
+            "size": self.currsize,
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hit_ratio,
+        }
+
+
+class PrincipalCache(MeteredTTLCache):
+    """
+    Cache of authenticated users keyed by their access token.
+
+    Tokens are always decoded and validated before the cache is consulted, so an
+    expired token never reaches it. Entries only save the user lookup.
+    """
+
+    def invalidate_user(self, email: str) -> int:
+        """
+        Drop every cached principal of the given user.
+
+        Args:
+            email (str): The email of the user whose data changed.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        return self.invalidate(lambda _, user: user.email == email)
+
+    async def revoke_user(self, session: AsyncSession, email: str) -> None:
+        """
+        Drop the cached principals of a user on every worker.
+
+        They are dropped right away for this worker, and again on every worker once the
+        transaction of the session commits, in case a request cached them in between.
+
+        Args:
+            session (AsyncSession): The session of the write changing the user.
+            email (str): The email of the user.
+        """
+        self.invalidate_user(email)
+        await broadcast.publish(session, PRINCIPALS_CHANNEL, email)
+
+    def invalidate_role(self, role_id: UUID) -> int:
+        """
+        Drop every cached principal holding the given role.
+
+        Args:
+            role_id (UUID): The unique identifier of the role that changed.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        return self.invalidate(lambda _, user: user.role_id == role_id)
+
+
+class ReadThroughCache(MeteredTTLCache):
+    """
+    A bounded TTL/LRU cache filled by loading missing values on demand.
+
+    Concurrent lookups of the same missing key share a single load ("single-flight"),
+    so a burst of requests for one key runs one query. Keys the load found nothing for
+    are remembered for ``negative_ttl`` seconds, so unknown keys do not reach the
+    database on every lookup either.
+
+    The cache is not thread-safe; it is meant to be used from the event loop thread only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of cached values, and of cached misses.
+            ttl (float): Seconds a loaded value is served for.
+            negative_ttl (float): Seconds a key the load found nothing for is served as
+                missing for.
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.missing = TTLCache(maxsize=maxsize, ttl=negative_ttl)
+        self.loading: dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_load(
+        self, key: Hashable, load: Callable[[], Awaitable[Any | None]]
+    ) -> Any | None:
+        """
+        Return the cached value of a key, loading it first if needed.
+
+        Args:
+            key (Hashable): The cache key.
+            load (Callable[[], Awaitable[Any | None]]): Loads the value of the key, or
+                returns None when there is none.
+
+        Returns:
+            Any | None: The value, or None when the key has no value.
+        """
+        while True:
+            if key in self.missing:
+                self.hits += 1
+                return None
+            value = self.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+            pending = self.loading.get(key)
+            if pending is None:
+                break
+            # Waiting for another lookup's load costs no query, so it counts as a hit.
+            self.hits += 1
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                # The request loading the value was cancelled, not this one: load it
+                # again.
+                if not pending.cancelled():
+                    raise
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self.loading[key] = future
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as error:
+            future.set_exception(error)
+            # Mark the error as retrieved when no other lookup is waiting for it.
+            future.exception()
+            raise
+        finally:
+            # An invalidation during the load removes it, so its outdated result is
+            # not stored.
+            current = self.loading.get(key) is future
+            if current:
+                del self.loading[key]
+
+        if current:
+            if value is None:
+                self.missing[key] = True
+            else:
+                self[key] = value
+        future.set_result(value)
+        return value
+
+    def discard(self, key: Hashable) -> None:
+        """
+        Drop the cached value of a key, and the result of any load in progress.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        self.pop(key, None)
+        self.missing.pop(key, None)
+        self.loading.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drop every cached value and the results of every load in progress.
+        """
+        super().clear()
+        self.missing.clear()
+        self.loading.clear()
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    tags: frozenset[str]
+    headers: dict[str, str] | None = None
+
+
+class ResponseCache(MeteredTTLCache):
+    """
+    Cache of encoded response bodies, evicted by tag.
+
+    Each entry is tagged with the rows it was built from, e.g. ``blog:<id>``, and
+    writes evict the tags of the rows they change, which drops exactly the entries
+    built from them.
+
+    An eviction also cancels the storing of every response being built at the time,
+    as it may have been read before the write.
+
+    The cache is not thread-safe; it is meant to be used from the event loop thread only.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of cached responses.
+            ttl (float): Seconds a response is served for when nothing evicts it.
+        """
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.tagged: dict[str, set[Hashable]] = defaultdict(set)
+        self.generation = 0
+
+    def store(
+        self,
+        key: Hashable,
+        body: bytes,
+        tags: Iterable[str],
+        generation: int,
+        headers: dict[str, str] | None = None,
+    ) -> bool:
+        """
+        Cache a response body, unless an eviction happened since it started being built.
+
+        Args:
+            key (Hashable): The cache key.
+            body (bytes): The encoded response body.
+            tags (Iterable[str]): The tags of the rows the response was built from.
+            generation (int): The value of :attr:`generation` when the response started
+                being built.
+            headers (dict[str, str] | None): Headers sent along with the body.
+
+        Returns:
+            bool: True if the response was cached.
+        """
+        if generation != self.generation:
+            return False
+
+        entry = CachedResponse(body, frozenset(tags), headers)
+        self.pop(key, None)
+        self[key] = entry
+        for tag in entry.tags:
+            self.tagged[tag].add(key)
+        return True
+
+    def evict(self, tags: Iterable[str]) -> int:
+        """
+        Drop every response tagged with any of the tags.
+
+        Args:
+            tags (Iterable[str]): The tags of the changed rows.
+
+        Returns:
+            int: The number of removed entries.
+        """
+        self.generation += 1
+        removed = 0
+        for tag in tags:
+            for key in self.tagged.pop(tag, ()):
+                if self.pop(key, None) is not None:
+                    removed += 1
+        return removed
+
+    def __delitem__(self, key: Hashable) -> None:
+        entry = super().__getitem__(key)
+        super().__delitem__(key)
+        self._untag(key, entry)
+
+    def expire(self, time: float | None = None) -> list[tuple[Hashable, Any]]:
+        expired = super().expire(time)
+        for key, entry in expired:
+            self._untag(key, entry)
+        return expired
+
+    def clear(self) -> None:
+        """
+        Drop every cached response.
+        """
+        self.generation += 1
+        super().clear()
+        self.tagged.clear()
+
+    def _untag(self, key: Hashable, entry: CachedResponse) -> None:
+        for tag in entry.tags:
+            keys = self.tagged.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tagged[tag]
+
+
+principal_cache = PrincipalCache(
+    maxsize=cache_settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=cache_settings.PRINCIPAL_CACHE_TTL,
+)
+
+
+def _on_principals_changed(email: str) -> None:
+    # An empty payload means messages may have been missed.
+    if email:
+        principal_cache.invalidate_user(email)
+    else:
+        principal_cache.clear()
+
+
+broadcast.subscribe(PRINCIPALS_CHANNEL, _on_principals_changed)
+
+metrics.describe("cache_size", "gauge", "Entries held by the cache.")
+metrics.describe("cache_hits_total", "counter", "Cache lookups that found an entry.")
+metrics.describe("cache_misses_total", "counter", "Cache lookups that found nothing.")
+metrics.describe("cache_evictions_total", "counter", "Entries evicted when full.")
+
+
+response_cache = ResponseCache(
+    maxsize=cache_settings.RESPONSE_CACHE_MAXSIZE,
+    ttl=cache_settings.RESPONSE_CACHE_TTL,
+)
+
+# Caches reported in the metrics, by name.
+metered_caches: dict[str, MeteredTTLCache] = {
+    "principal": principal_cache,
+    "response": response_cache,
+}
+
+
+@metrics.collector
+def collect_cache_metrics(registry: MetricsRegistry) -> None:
+    for name, cache in metered_caches.items():
+        label_values = labels(cache=name)
+        registry.set("cache_size", cache.currsize, label_values)
+        registry.set("cache_hits_total", cache.hits, label_values)
+        registry.set("cache_misses_total", cache.misses, label_values)
+        registry.set("cache_evictions_total", cache.evictions, label_values)
@@ -67,6 +67,14 @@ class UnprocessableEntityError(CustomException):
     status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
 
 
+class ServiceUnavailableError(CustomException):
+    """
+    Custom exception for representing a Service Unavailable (HTTP 503) error.
+    """
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
 class InvalidJWTTokenException(CustomException):
     """
     Custom exception for representing an Unauthorized (HTTP 401) error due to an invalid JWT token.
@@ -75,6 +83,14 @@ class InvalidJWTTokenException(CustomException):
     status_code = status.HTTP_401_UNAUTHORIZED
 
 
+class InvalidCursorException(BadRequestError):
+    """
+    Custom exception for representing a Bad Request (HTTP 400) error due to a malformed pagination cursor.
+    """
+
+    message = constants.INVALID_CURSOR
+
+
 class UnexpectedResponse(Exception):
     """
     Exception raised for an unexpected HTTP response.
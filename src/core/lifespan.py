@@ -0,0 +1,133 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator
+from uuid import uuid4
+
+from fastapi import FastAPI
+from sqlalchemy import select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from config.config import database_settings, metrics_settings
+from database.db import engine, primary_read_session, replica_engine, warm_up_pool
+from src.api.v1.auth.utils.hashing import hashing_engine
+from src.api.v1.blog.models import BlogModel, CommentModel
+from src.api.v1.blog.services.blog import BlogService
+from src.api.v1.blog.services.comment import CommentService
+from src.api.v1.blog.services.like import LikeService
+from src.api.v1.user.registry import role_registry
+from src.core.auth import get_user_for_token
+from src.core.broadcast import broadcast
+from src.core.exceptions import CustomException
+from src.core.metrics import metrics
+from src.core.utils import core_logger
+from src.core.utils.logs import log_queue
+from src.core.utils.mixins import Default100Page
+from src.core.utils.pagination import CursorParams
+
+
+async def prime_connection(connection: AsyncConnection) -> None:
+    """
+    Run the hot read queries once on a connection.
+
+    asyncpg then has the types they use introspected and their statements prepared
+    for this connection, and SQLAlchemy has them compiled. Queries run against an
+    existing blog and comment when there is one, so that none stops at a not found
+    check.
+
+    Args:
+        connection (AsyncConnection): The connection to prime.
+    """
+    async with AsyncSession(bind=connection) as session:
+        blog_id = await session.scalar(
+            select(BlogModel.id).where(BlogModel.deleted_at.is_(None)).limit(1)
+        )
+        blog_id = blog_id or uuid4()
+        comment_id = await session.scalar(
+            select(CommentModel.id).where(CommentModel.blog_id == blog_id).limit(1)
+        )
+        comment_id = comment_id or uuid4()
+
+        blogs = BlogService(session=session, read_session=session)
+        comments = CommentService(session=session, read_session=session)
+        likes = LikeService(session=session, read_session=session)
+        queries = (
+            lambda: get_user_for_token(session, token="", payload={"sub": ""}),
+            lambda: blogs.get_all(Default100Page()),
+            lambda: blogs.get_all_by_cursor(CursorParams()),
+            lambda: blogs.find_by_id(blog_id),
+            lambda: blogs.get_content_by_id(blog_id),
+            lambda: comments.get_parent_comments(blog_id, CursorParams()),
+            lambda: comments.get_replies(comment_id),
+            lambda: likes.get_likes(blog_id, CursorParams()),
+        )
+        for query in queries:
+            with suppress(CustomException):
+                await query()
+
+
+async def warm_up() -> None:
+    """
+    Load the roles in memory and warm up the connection pools.
+
+    A database that cannot be reached does not prevent the worker from starting; the
+    roles and connections are then loaded on first use.
+    """
+    try:
+        async with primary_read_session() as session:
+            await role_registry.load(session)
+    except (OSError, SQLAlchemyError) as error:
+        core_logger.warning("Could not preload the roles: %s", error)
+
+    for bind in filter(None, (engine, replica_engine)):
+        warmed = await warm_up_pool(
+            bind, database_settings.DATABASE_POOL_WARMUP, prime_connection
+        )
+        core_logger.info(
+            "Warmed up %d connections of the %s pool", warmed, bind.pool.logging_name
+        )
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    """
+    Start the background tasks of a worker and release its resources on shutdown.
+
+    Args:
+        _app (FastAPI): The application.
+    """
+    log_queue.start()
+    await warm_up()
+    await broadcast.start()
+    flusher = (
+        asyncio.create_task(
+            metrics.flush_periodically(metrics_settings.METRICS_FLUSH_INTERVAL)
+        )
+        if metrics.directory
+        else None
+    )
+
+    try:
+        yield
+    finally:
+        # Stop the hashing pool here rather than at interpreter teardown, where its
+        # worker processes may outlive the worker. Waiting for the running calls
+        # blocks, so it happens in a thread while the rest shuts down.
+        hashing_shutdown = asyncio.create_task(
+            asyncio.to_thread(hashing_engine.shutdown)
+        )
+        if flusher:
+            flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await flusher
+        await broadcast.stop()
+        # Uvicorn waits for the requests in progress before shutting down, so every
+        # connection is back in the pool and gets closed.
+        await engine.dispose()
+        if replica_engine:
+            await replica_engine.dispose()
+        await hashing_shutdown
+        # Counters of a stopped worker keep counting in the merged metrics.
+        metrics.flush()
+        # Write the queued log records before the worker exits.
+        log_queue.stop()
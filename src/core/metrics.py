@@ -0,0 +1,360 @@
+import asyncio
+import json
+import os
+import time
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Callable
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from config.config import metrics_settings
+from src.core.utils import core_logger
+
+DEFAULT_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+Collector = Callable[["MetricsRegistry"], None]
+
+
+def labels(**values: Any) -> str:
+    """
+    Format label values the way they appear between braces in the exposition format.
+
+    Args:
+        **values (Any): Label names and values.
+
+    Returns:
+        str: The formatted labels, e.g. ``operation_id="get_all"``.
+    """
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in values.items())
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class MetricsRegistry:
+    """
+    In-process registry of counters, gauges and histograms, rendered in the Prometheus
+    text exposition format.
+
+    Metrics are only updated from the event loop thread, so no lock is taken. With
+    several workers, each one writes a snapshot of its metrics to ``directory`` and a
+    scrape of any worker merges all the snapshots: counters and histograms are summed
+    over every worker that ever ran, gauges over the workers that are still alive.
+
+    Gauges are usually set by collectors, called right before every snapshot.
+    """
+
+    def __init__(
+        self, directory: str | None = None, buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    ) -> None:
+        """
+        Initialize the registry.
+
+        Args:
+            directory (str | None): Shared directory of the worker snapshots, None to
+                only expose the metrics of the current process.
+            buckets (tuple[float, ...]): Upper bounds of the histogram buckets, in seconds.
+        """
+        self.directory = Path(directory) if directory else None
+        self.buckets = buckets
+        self.descriptions: dict[str, tuple[str, str]] = {}
+        self.samples: dict[str, dict[str, Any]] = {}
+        self.collectors: list[Collector] = []
+
+    def describe(self, name: str, kind: str, documentation: str) -> None:
+        """
+        Declare a metric.
+
+        Args:
+            name (str): The metric name.
+            kind (str): ``"counter"``, ``"gauge"`` or ``"histogram"``.
+            documentation (str): The help text of the metric.
+        """
+        self.descriptions[name] = (kind, documentation)
+        self.samples.setdefault(name, {})
+
+    def inc(self, name: str, amount: float = 1, label_values: str = "") -> None:
+        """
+        Increment a counter or a gauge.
+
+        Args:
+            name (str): The metric name.
+            amount (float): The increment, negative to decrement a gauge.
+            label_values (str): The labels of the sample, see :func:`labels`.
+        """
+        samples = self.samples[name]
+        samples[label_values] = samples.get(label_values, 0) + amount
+
+    def set(self, name: str, value: float, label_values: str = "") -> None:
+        """
+        Set the value of a gauge, or of a counter read from elsewhere.
+
+        Args:
+            name (str): The metric name.
+            value (float): The value.
+            label_values (str): The labels of the sample, see :func:`labels`.
+        """
+        self.samples[name][label_values] = value
+
+    def observe(self, name: str, value: float, label_values: str = "") -> None:
+        """
+        Record an observation in a histogram.
+
+        Args:
+            name (str): The metric name.
+            value (float): The observed value, in seconds.
+            label_values (str): The labels of the sample, see :func:`labels`.
+        """
+        samples = self.samples[name]
+        histogram = samples.get(label_values)
+        if histogram is None:
+            # One count per bucket plus the +Inf one, then the sum.
+            histogram = samples[label_values] = [0] * (len(self.buckets) + 1) + [0.0]
+        histogram[bisect_left(self.buckets, value)] += 1
+        histogram[-1] += value
+
+    def collector(self, func: Collector) -> Collector:
+        """
+        Register a function that updates metrics right before every snapshot.
+
+        Args:
+            func (Collector): Called with the registry.
+
+        Returns:
+            Collector: The function, so this can be used as a decorator.
+        """
+        self.collectors.append(func)
+        return func
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Run the collectors and copy the current samples.
+
+        Returns:
+            dict[str, Any]: The samples of every metric along with the process id.
+        """
+        for func in self.collectors:
+            try:
+                func(self)
+            except Exception as error:
+                core_logger.warning("Metrics collector %s failed: %s", func, error)
+
+        return {
+            "pid": os.getpid(),
+            "samples": {
+                name: {
+                    key: list(value) if isinstance(value, list) else value
+                    for key, value in samples.items()
+                }
+                for name, samples in self.samples.items()
+            },
+        }
+
+    def flush(self, snapshot: dict[str, Any] | None = None) -> None:
+        """
+        Write a snapshot of this worker to the shared directory.
+
+        The file is replaced atomically, so readers never see a partial snapshot.
+
+        Args:
+            snapshot (dict[str, Any] | None): The snapshot to write, taken now if None.
+        """
+        if self.directory is None:
+            return
+
+        snapshot = snapshot or self.snapshot()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"worker-{snapshot['pid']}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(snapshot))
+        os.replace(temporary, path)
+
+    async def flush_periodically(self, interval: float) -> None:
+        """
+        Flush this worker's snapshot every ``interval`` seconds, until cancelled.
+
+        Files are written off the event loop.
+
+        Args:
+            interval (float): Seconds between two flushes.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.to_thread(self.flush, self.snapshot())
+
+    def clear_directory(self) -> None:
+        """
+        Remove the snapshots of previous runs. Must be called before workers start.
+        """
+        if self.directory is None:
+            return
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        for path in self.directory.glob("worker-*.json"):
+            path.unlink(missing_ok=True)
+
+    def merged_samples(
+        self, snapshot: dict[str, Any] | None = None
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Merge the snapshot of this worker with the ones of the other workers.
+
+        Args:
+            snapshot (dict[str, Any] | None): This worker's snapshot, taken now if None.
+
+        Returns:
+            dict[str, dict[str, Any]]: The merged samples of every metric.
+        """
+        snapshot = snapshot or self.snapshot()
+        if self.directory is None:
+            return snapshot["samples"]
+
+        self.flush(snapshot)
+        merged: dict[str, dict[str, Any]] = {name: {} for name in self.descriptions}
+        for path in self.directory.glob("worker-*.json"):
+            try:
+                other = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+
+            alive = _is_alive(other["pid"])
+            for name, samples in other["samples"].items():
+                if name not in merged:
+                    continue
+                if self.descriptions[name][0] == "gauge" and not alive:
+                    continue
+                target = merged[name]
+                for key, value in samples.items():
+                    if isinstance(value, list):
+                        current = target.setdefault(key, [0] * len(value))
+                        target[key] = [a + b for a, b in zip(current, value)]
+                    else:
+                        target[key] = target.get(key, 0) + value
+
+        return merged
+
+    def render(self, snapshot: dict[str, Any] | None = None) -> str:
+        """
+        Render the metrics of every worker in the Prometheus text exposition format.
+
+        Reads the snapshots of the other workers, so from the event loop use
+        ``render_async`` instead.
+
+        Args:
+            snapshot (dict[str, Any] | None): This worker's snapshot, taken now if None.
+
+        Returns:
+            str: The exposition text.
+        """
+        lines: list[str] = []
+        for name, samples in self.merged_samples(snapshot).items():
+            kind, documentation = self.descriptions[name]
+            lines.append(f"# HELP {name} {documentation}")
+            lines.append(f"# TYPE {name} {kind}")
+            for key, value in sorted(samples.items()):
+                if kind == "histogram":
+                    lines.extend(self._render_histogram(name, key, value))
+                else:
+                    lines.append(
+                        f"{name}{{{key}}} {value}" if key else f"{name} {value}"
+                    )
+
+        return "\n".join(lines) + "\n"
+
+    async def render_async(self) -> str:
+        """
+        Render the metrics like ``render``, with the files read and written off the
+        event loop. The snapshot of this worker is still taken on the loop, which is
+        the only thread updating the metrics.
+
+        Returns:
+            str: The exposition text.
+        """
+        return await asyncio.to_thread(self.render, self.snapshot())
+
+    def _render_histogram(self, name: str, key: str, value: list) -> list[str]:
+        prefix = f"{key}," if key else ""
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), value):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound}"}} {cumulative}')
+        suffix = f"{{{key}}}" if key else ""
+        lines.append(f"{name}_sum{suffix} {value[-1]}")
+        lines.append(f"{name}_count{suffix} {cumulative}")
+        return lines
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+metrics = MetricsRegistry(directory=metrics_settings.METRICS_DIR)
+
+metrics.describe(
+    "http_request_duration_seconds", "histogram", "Request latency by operation."
+)
+metrics.describe("http_requests_in_flight", "gauge", "Requests being served.")
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording the in-flight requests and the latency of every request,
+    labelled with the ``operation_id`` of the matched route.
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = metrics) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            registry (MetricsRegistry): The registry to record to.
+        """
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        self.registry.inc("http_requests_in_flight")
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.registry.inc("http_requests_in_flight", -1)
+            # The router stores the matched route in the scope.
+            route = scope.get("route")
+            operation_id = (
+                getattr(route, "operation_id", None)
+                or getattr(route, "name", None)
+                or "unmatched"
+            )
+            self.registry.observe(
+                "http_request_duration_seconds",
+                time.perf_counter() - started,
+                labels(operation_id=operation_id),
+            )
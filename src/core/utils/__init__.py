@@ -1,5 +1,7 @@
 import logging
 
+from config.config import logging_settings
+from src.core.utils.logs import log_queue
 from src.core.utils.schema import BaseResponse, CamelCaseModel
 
 
@@ -7,10 +9,10 @@ def setup_logger(name: str) -> logging.Logger:
     """
     Set up and return a logger with the specified name.
 
-    This function configures a logger to output logs to the console with a
-    predefined format that includes the timestamp, log level, logger name,
-    and message. It ensures that multiple handlers are not added if the
-    logger is already configured.
+    Records of the logger go through the shared log queue: the calling thread only
+    enqueues them, and a background thread formats them, as text or JSON depending on
+    ``LOG_FORMAT``, and writes them to the console. Calling it again for the same name
+    returns the same logger without adding another handler.
 
     Args:
         name (str): The name of the logger.
@@ -20,17 +22,9 @@ def setup_logger(name: str) -> logging.Logger:
     """
 
     logger = logging.getLogger(name)
-    if not logger.handlers:  # Prevent duplicate handlers
-        logger.setLevel(logging.INFO)
-
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    )
-
-    # Console Handler
-    ch = logging.StreamHandler()
-    ch.setFormatter(formatter)
-    logger.addHandler(ch)
+    logger.setLevel(logging_settings.LOG_LEVEL)
+    logger.propagate = False
+    log_queue.attach(logger)
 
     return logger
 
@@ -0,0 +1,218 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+import random
+import sys
+import time
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from config.config import logging_settings
+
+# Attributes every LogRecord has; anything else was passed through ``extra``.
+RECORD_ATTRIBUTES = frozenset(
+    logging.makeLogRecord({}).__dict__.keys() | {"message", "asctime", "taskName"}
+)
+
+
+class JSONFormatter(logging.Formatter):
+    """
+    Formats records as one JSON object per line.
+
+    Values passed through ``extra`` are added as top-level keys.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update(
+            (key, value)
+            for key, value in record.__dict__.items()
+            if key not in RECORD_ATTRIBUTES
+        )
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack"] = self.formatStack(record.stack_info)
+
+        return json.dumps(entry, default=str)
+
+
+def create_formatter(log_format: str) -> logging.Formatter:
+    """
+    Create the formatter of the log output.
+
+    Args:
+        log_format (str): Either ``"text"`` or ``"json"``.
+
+    Returns:
+        logging.Formatter: The formatter.
+    """
+    if log_format == "json":
+        return JSONFormatter()
+    if log_format == "text":
+        return logging.Formatter("%(asctime)s | %(levelname)s | %(name)s | %(message)s")
+
+    raise ValueError("Invalid log format. Must be 'text' or 'json'.")
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Only merge the arguments, which may change once the call returns; formatting
+        # and the exception traceback are left to the listener thread.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+class LogQueue:
+    """
+    Moves the formatting and writing of log records off the calling thread.
+
+    Loggers get a ``QueueHandler`` that only enqueues records, and a ``QueueListener``
+    thread formats them and writes them to the output. The listener is started when
+    the first logger is attached, and stopping it writes every queued record first.
+    """
+
+    def __init__(self, handler: logging.Handler) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            handler (logging.Handler): The handler that formats and writes the records.
+        """
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.handler = _QueueHandler(self.queue)
+        self.listener = QueueListener(self.queue, handler, respect_handler_level=True)
+        self.running = False
+
+    def attach(self, logger: logging.Logger) -> None:
+        """
+        Send the records of a logger through the queue, once.
+
+        Args:
+            logger (logging.Logger): The logger.
+        """
+        if self.handler not in logger.handlers:
+            logger.addHandler(self.handler)
+        self.start()
+
+    def start(self) -> None:
+        """
+        Start the listener thread if it is not running.
+        """
+        if not self.running:
+            self.listener.start()
+            self.running = True
+
+    def stop(self) -> None:
+        """
+        Write the queued records and stop the listener thread.
+        """
+        if self.running:
+            self.listener.stop()
+            self.running = False
+
+
+_output = logging.StreamHandler(sys.stdout)
+_output.setFormatter(create_formatter(logging_settings.LOG_FORMAT))
+
+log_queue = LogQueue(_output)
+atexit.register(log_queue.stop)
+
+
+class AccessLogMiddleware:
+    """
+    ASGI middleware logging one line per request.
+
+    Successful GET and HEAD requests faster than ``slow_seconds`` are hot and
+    uninteresting one by one, so only a ``sample_rate`` fraction of them is logged.
+    Every other request is logged.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        logger: logging.Logger,
+        sample_rate: float = 1.0,
+        slow_seconds: float = 1.0,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            logger (logging.Logger): The logger to write to.
+            sample_rate (float): Fraction of the hot requests that is logged.
+            slow_seconds (float): Duration from which a request is always logged.
+        """
+        self.app = app
+        self.logger = logger
+        self.sample_rate = sample_rate
+        self.slow_seconds = slow_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = time.perf_counter() - started
+            if self.should_log(scope["method"], status_code, duration):
+                self.log(scope, status_code, duration)
+
+    def should_log(self, method: str, status_code: int, duration: float) -> bool:
+        """
+        Whether a request is logged.
+
+        Args:
+            method (str): The HTTP method.
+            status_code (int): The response status code.
+            duration (float): Seconds spent serving the request.
+
+        Returns:
+            bool: True to log the request.
+        """
+        if method in ("GET", "HEAD") and status_code < 400:
+            return duration >= self.slow_seconds or random.random() < self.sample_rate
+        return True
+
+    def log(self, scope: Scope, status_code: int, duration: float) -> None:
+        client = scope.get("client")
+        route = scope.get("route")
+        self.logger.info(
+            '%s "%s %s" %d %.2fms',
+            client[0] if client else "-",
+            scope["method"],
+            scope["path"],
+            status_code,
+            duration * 1000,
+            extra={
+                "client": client[0] if client else None,
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round(duration * 1000, 2),
+                "operation_id": getattr(route, "operation_id", None),
+            },
+        )
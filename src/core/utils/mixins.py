@@ -1,4 +1,5 @@
 from datetime import datetime, timezone
+from typing import Any
 
 from fastapi.params import Query
 from fastapi_pagination import Params
@@ -21,6 +22,14 @@ class TimeStampMixin:
         onupdate=lambda: datetime.now(timezone.utc).replace(tzinfo=None),
     )
 
+    @classmethod
+    def preserve_updated_at(cls) -> dict[str, Any]:
+        """
+        UPDATE values keeping ``updated_at`` as is, for writes that are not edits of the
+        row itself, such as denormalized counters.
+        """
+        return {"updated_at": cls.updated_at}
+
 
 class Default100Page(Params):
     page: int = Query(1, ge=1, description="Page number")
@@ -0,0 +1,186 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Generic, Sequence, TypeVar
+from uuid import UUID
+
+from fastapi.params import Query
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select, Text, cast, false, func, literal, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.exceptions import InvalidCursorException
+from src.core.utils.schema import CamelCaseModel
+
+CursorItem = TypeVar("CursorItem")
+
+
+class CursorParams(BaseModel):
+    cursor: str | None = Query(None, description="Opaque cursor of the page to fetch")
+    size: int = Query(100, ge=1, le=100, description="Page size")
+
+
+class CursorPage(CamelCaseModel, Generic[CursorItem]):
+    """
+    A page of keyset-paginated items.
+
+    Attributes:
+        items (list): Items of the page.
+        next_cursor (str | None): Cursor of the following page, if any.
+        previous_cursor (str | None): Cursor of the preceding page, if any.
+    """
+
+    items: list[CursorItem]
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], backwards: bool = False) -> str:
+    """
+    Encode the sort key of a row into an opaque cursor.
+
+    Args:
+        values (Sequence[Any]): The sort key values of the row.
+        backwards (bool): Whether the cursor points to the rows before the key.
+
+    Returns:
+        str: An URL-safe cursor string.
+    """
+    payload = {"k": [_to_json(value) for value in values], "r": backwards}
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def cursor_expression(keys: Sequence[ColumnElement]) -> ColumnElement:
+    """
+    SQL expression computing the forward cursor of a row, as :func:`encode_cursor` does.
+
+    Lets statements that build their JSON in the database return cursors that
+    :func:`decode_cursor` accepts.
+
+    Args:
+        keys (Sequence[ColumnElement]): The sort key columns of the row.
+
+    Returns:
+        ColumnElement: The URL-safe cursor string.
+    """
+    payload = cast(
+        func.json_build_object("k", func.json_build_array(*keys), "r", false()), Text
+    )
+    encoded = func.encode(func.convert_to(payload, "UTF8"), "base64")
+    # base64 output wraps lines; drop the newlines and padding, use the URL-safe alphabet.
+    return func.rtrim(func.translate(encoded, "+/\n", "-_"), "=")
+
+
+def decode_cursor(cursor: str, keys: Sequence[ColumnElement]) -> tuple[list[Any], bool]:
+    """
+    Decode a cursor produced by :func:`encode_cursor`.
+
+    Args:
+        cursor (str): The cursor string.
+        keys (Sequence[ColumnElement]): The sort key columns, used to restore value types.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed.
+
+    Returns:
+        tuple[list[Any], bool]: The sort key values and the backwards flag.
+    """
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+        raw_values, backwards = payload["k"], payload["r"]
+
+        if len(raw_values) != len(keys):
+            raise InvalidCursorException
+
+        values = []
+        for key, value in zip(keys, raw_values):
+            python_type = key.type.python_type
+            if python_type is datetime:
+                values.append(datetime.fromisoformat(value))
+            else:
+                values.append(python_type(value))
+
+        return values, bool(backwards)
+    except (ValueError, TypeError, KeyError, AttributeError, NotImplementedError):
+        raise InvalidCursorException
+
+
+async def paginate_by_keyset(
+    session: AsyncSession,
+    query: Select,
+    keys: Sequence[ColumnElement],
+    params: CursorParams,
+    transformer: Callable[[Sequence[Any]], Sequence[Any]] | None = None,
+) -> CursorPage:
+    """
+    Paginate a query by the given sort key instead of OFFSET/LIMIT.
+
+    Rows are returned in descending key order. Each page is a single index range scan of
+    ``size + 1`` rows, and no total count is computed.
+
+    Args:
+        session (AsyncSession): The asynchronous database session.
+        query (Select): The filtered query, without ordering or limit.
+        keys (Sequence[ColumnElement]): Columns forming a unique sort key, e.g. ``(created_at, id)``.
+        params (CursorParams): The cursor and page size.
+        transformer (Callable | None): Optional function mapping the page items, e.g. rows
+            to response schemas.
+
+    Raises:
+        InvalidCursorException: If the cursor is malformed.
+
+    Returns:
+        CursorPage: The page of items with its next and previous cursors.
+    """
+    values, backwards = (
+        decode_cursor(params.cursor, keys) if params.cursor else (None, False)
+    )
+    single_entity = len(query.column_descriptions) == 1
+
+    stmt = query.add_columns(
+        *(key.label(f"cursor_key_{index}") for index, key in enumerate(keys))
+    )
+
+    if values is not None:
+        bound = tuple_(*(literal(value, key.type) for key, value in zip(keys, values)))
+        stmt = stmt.where(tuple_(*keys) > bound if backwards else tuple_(*keys) < bound)
+
+    stmt = stmt.order_by(
+        *(key.asc() if backwards else key.desc() for key in keys)
+    ).limit(params.size + 1)
+
+    rows = (await session.execute(stmt)).all()
+    has_more = len(rows) > params.size
+    rows = rows[: params.size]
+
+    if backwards:
+        rows.reverse()
+
+    key_count = len(keys)
+    next_cursor = previous_cursor = None
+
+    # Walking backwards always leaves a page after this one; walking forwards always
+    # leaves one before it unless this is the first page.
+    if rows and (backwards or has_more):
+        next_cursor = encode_cursor(rows[-1][-key_count:])
+    if rows and (has_more if backwards else values is not None):
+        previous_cursor = encode_cursor(rows[0][-key_count:], backwards=True)
+
+    items = [row[0] if single_entity else row for row in rows]
+
+    return CursorPage(
+        items=transformer(items) if transformer else items,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
+    )
@@ -0,0 +1,259 @@
+import inspect
+from dataclasses import dataclass
+from functools import wraps
+from typing import Any, Awaitable, Callable, Hashable, Iterable
+
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+
+from database.db import read_from_primary, written_at
+from src.core.cache import ResponseCache, response_cache
+from src.core.utils.schema import BaseResponse
+from src.core.utils.timing import timed
+from src.core.utils.validators import Validators, etag_matches
+
+# Endpoint argument receiving the request of routes that need its headers.
+REQUEST_ARGUMENT = "__request"
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core's serializer instead of ``json.dumps``.
+
+    Content that is already encoded as bytes is sent as is.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return to_json(content)
+
+
+class RawJSON(bytes):
+    """
+    Response data that is already encoded as JSON, e.g. read from a cache.
+
+    :class:`ResponseSerializer` embeds it in the envelope as is.
+    """
+
+
+class ResponseSerializer:
+    """
+    Precompiled serializer of the :class:`BaseResponse` envelope of a route.
+
+    FastAPI would run the response through the response model, dump it to Python
+    objects and encode those with ``json.dumps``. The serializer instead dumps the data
+    straight to JSON bytes with the camelCase aliases, using a ``TypeAdapter`` of the
+    data type built once when the route is created. The data is validated first, with
+    ORM objects read by attribute as the response model does, so that attributes missing
+    from an instance's ``__dict__`` are loaded rather than omitted.
+    """
+
+    def __init__(self, response_model: type[BaseResponse]) -> None:
+        """
+        Initialize the serializer.
+
+        Args:
+            response_model (type[BaseResponse]): The response model of the route, e.g.
+                ``BaseResponse[Page[BlogResponse]]``.
+        """
+        args = response_model.__pydantic_generic_metadata__["args"]
+        self.adapter: TypeAdapter = TypeAdapter(args[0] | None if args else Any)
+
+    def __call__(self, response: BaseResponse) -> bytes:
+        """
+        Serialize a response.
+
+        Args:
+            response (BaseResponse): The response returned by the endpoint.
+
+        Returns:
+            bytes: The JSON encoded response.
+        """
+        data = response.data
+        if not isinstance(data, RawJSON):
+            data = self.adapter.dump_json(
+                self.adapter.validate_python(data, from_attributes=True), by_alias=True
+            )
+
+        return b'{"status":%b,"code":%d,"data":%b}' % (
+            to_json(response.status),
+            response.code,
+            data,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CachePolicy:
+    """
+    How the responses of a route are cached in a :class:`ResponseCache`.
+
+    Attributes:
+        key (Callable[[dict[str, Any]], Hashable | None]): Builds the cache key from the
+            endpoint arguments, or returns None for a request that is not cached.
+        tags (Callable[[dict[str, Any], Any], Iterable[str]]): Builds the tags of a
+            response from the endpoint arguments and the response data.
+    """
+
+    key: Callable[[dict[str, Any]], Hashable | None]
+    tags: Callable[[dict[str, Any], Any], Iterable[str]]
+
+
+def cache_response(
+    key: Callable[[dict[str, Any]], Hashable | None],
+    tags: Callable[[dict[str, Any], Any], Iterable[str]],
+) -> Callable[[Callable], Callable]:
+    """
+    Cache the encoded responses of an endpoint served by a :class:`SerializedRoute`.
+
+    Cached responses are sent without calling the endpoint, but after its dependencies
+    ran, so authentication still applies. Only successful responses are cached. They
+    are built from the primary, since every client is served them, and clients that
+    wrote recently are not served them, in case another worker has not evicted them
+    yet.
+
+    Args:
+        key (Callable[[dict[str, Any]], Hashable | None]): See :class:`CachePolicy`.
+        tags (Callable[[dict[str, Any], Any], Iterable[str]]): See :class:`CachePolicy`.
+
+    Returns:
+        Callable[[Callable], Callable]: Decorator marking the endpoint.
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.cache_policy = CachePolicy(key=key, tags=tags)
+        return endpoint
+
+    return decorator
+
+
+def conditional(
+    validate: Callable[[dict[str, Any]], Awaitable[Validators | None]],
+) -> Callable[[Callable], Callable]:
+    """
+    Answer conditional requests to an endpoint served by a :class:`SerializedRoute`.
+
+    Responses carry the validators, and requests whose ``If-None-Match`` matches the
+    current entity tag get a ``304`` without the endpoint being called.
+
+    Args:
+        validate (Callable[[dict[str, Any]], Awaitable[Validators | None]]): Computes
+            the current validators from the endpoint arguments, typically with an
+            aggregate query; returns None to let the endpoint answer, e.g. with a 404.
+
+    Returns:
+        Callable[[Callable], Callable]: Decorator marking the endpoint.
+    """
+
+    def decorator(endpoint: Callable) -> Callable:
+        endpoint.compute_validators = validate
+        return endpoint
+
+    return decorator
+
+
+def _not_modified(if_none_match: str | None, headers: dict[str, str] | None) -> bool:
+    return bool(
+        headers and if_none_match and etag_matches(if_none_match, headers["ETag"])
+    )
+
+
+class SerializedRoute(APIRoute):
+    """
+    Route that serializes the :class:`BaseResponse` of its endpoint with a
+    :class:`ResponseSerializer`, bypassing FastAPI's response validation.
+
+    Routes whose response model is not a ``BaseResponse``, and endpoints that are not
+    coroutines, are served the usual way. Endpoints decorated with
+    :func:`cache_response` are served from the response cache, and endpoints decorated
+    with :func:`conditional` answer ``If-None-Match``; cached responses keep their
+    validators.
+    """
+
+    cache: ResponseCache = response_cache
+
+    def get_route_handler(self) -> Callable:
+        if not (
+            isinstance(self.response_model, type)
+            and issubclass(self.response_model, BaseResponse)
+            and inspect.iscoroutinefunction(self.dependant.call)
+        ):
+            return super().get_route_handler()
+
+        self.dependant.call = self._serialized(self.dependant.call)
+        handler = super().get_route_handler()
+        if not hasattr(self.endpoint, "cache_policy"):
+            return handler
+
+        async def app(request: Request) -> Response:
+            # Before the dependencies open the read session.
+            read_from_primary(request)
+            return await handler(request)
+
+        return app
+
+    def _serialized(self, endpoint: Callable) -> Callable:
+        serialize = ResponseSerializer(self.response_model)
+        status_code = self.status_code or 200
+        policy: CachePolicy | None = getattr(endpoint, "cache_policy", None)
+        validate = getattr(endpoint, "compute_validators", None)
+        cache = self.cache
+
+        # FastAPI passes the request under this argument, added if the endpoint has none.
+        request_argument = self.dependant.request_param_name
+        added_argument = bool(validate or policy) and request_argument is None
+        if added_argument:
+            request_argument = self.dependant.request_param_name = REQUEST_ARGUMENT
+
+        @wraps(endpoint)
+        async def call(**values: Any) -> Any:
+            if_none_match = None
+            if validate or policy:
+                request: Request = (
+                    values.pop(request_argument)
+                    if added_argument
+                    else values[request_argument]
+                )
+                if_none_match = request.headers.get("if-none-match")
+
+            key = policy and policy.key(values)
+            if key is not None:
+                key = (self.unique_id, key)
+                cached = cache.lookup(key) if written_at(request) is None else None
+                if cached is not None:
+                    if _not_modified(if_none_match, cached.headers):
+                        return Response(status_code=304, headers=cached.headers)
+                    return FastJSONResponse(
+                        cached.body, status_code=status_code, headers=cached.headers
+                    )
+                generation = cache.generation
+
+            headers = None
+            if validate:
+                validators = await validate(values)
+                headers = validators.headers() if validators else None
+                if _not_modified(if_none_match, headers):
+                    return Response(status_code=304, headers=headers)
+
+            response = await endpoint(**values)
+            if not isinstance(response, BaseResponse):
+                return response
+
+            with timed("serialization_time"):
+                content = serialize(response)
+
+            if key is not None and response.code < 400:
+                cache.store(
+                    key,
+                    content,
+                    policy.tags(values, response.data),
+                    generation,
+                    headers,
+                )
+
+            return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+        return call
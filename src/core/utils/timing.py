@@ -0,0 +1,166 @@
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.utils import core_logger
+
+
+@dataclass(slots=True)
+class RequestTimings:
+    """
+    Time spent by a request in each of its phases.
+
+    Attributes:
+        db_count (int): Number of SQL statements executed.
+        db_time (float): Seconds spent executing SQL statements.
+        auth_time (float): Seconds spent authenticating the user.
+        serialization_time (float): Seconds spent serializing the response.
+        statements (Counter | None): Executions of each SQL statement, only counted
+            when repeated statements are reported.
+    """
+
+    db_count: int = 0
+    db_time: float = 0.0
+    auth_time: float = 0.0
+    serialization_time: float = 0.0
+    statements: Counter | None = None
+
+    def server_timing(self, total: float) -> str:
+        """
+        Format the timings as a ``Server-Timing`` header value, in milliseconds.
+
+        Args:
+            total (float): Seconds spent by the whole request.
+
+        Returns:
+            str: The header value.
+        """
+        return (
+            f'db;desc="{self.db_count} queries";dur={self.db_time * 1000:.2f}, '
+            f"auth;dur={self.auth_time * 1000:.2f}, "
+            f"serialize;dur={self.serialization_time * 1000:.2f}, "
+            f"total;dur={total * 1000:.2f}"
+        )
+
+
+request_timings: ContextVar[RequestTimings | None] = ContextVar(
+    "request_timings", default=None
+)
+
+
+@contextmanager
+def timed(phase: str) -> Iterator[None]:
+    """
+    Add the time spent in the block to a phase of the current request's timings.
+
+    Does nothing outside of a request.
+
+    Args:
+        phase (str): Name of the :class:`RequestTimings` attribute, e.g. ``"auth_time"``.
+    """
+    timings = request_timings.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if timings is not None:
+            elapsed = time.perf_counter() - started
+            setattr(timings, phase, getattr(timings, phase) + elapsed)
+
+
+def before_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    """
+    SQLAlchemy ``before_cursor_execute`` listener starting the clock of a statement.
+    """
+    if request_timings.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def after_cursor_execute(conn: Any, cursor: Any, statement: str, *args: Any) -> None:
+    """
+    SQLAlchemy ``after_cursor_execute`` listener adding a statement to the timings.
+    """
+    timings = request_timings.get()
+    if timings is None or not conn.info.get("query_started"):
+        return
+
+    timings.db_count += 1
+    timings.db_time += time.perf_counter() - conn.info["query_started"].pop()
+    if timings.statements is not None:
+        timings.statements[statement] += 1
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI middleware collecting the :class:`RequestTimings` of every request.
+
+    The timings are sent back in a ``Server-Timing`` header. When
+    ``repeated_statement_threshold`` is set, a warning is logged for every statement
+    that ran more times than that in a single request, which usually means related
+    rows are loaded one parent at a time (N+1 queries).
+    """
+
+    def __init__(
+        self, app: ASGIApp, repeated_statement_threshold: int | None = None
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            repeated_statement_threshold (int | None): Executions of one statement in a
+                request beyond which a warning is logged, None to disable the check.
+        """
+        self.app = app
+        self.repeated_statement_threshold = repeated_statement_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings(
+            statements=Counter() if self.repeated_statement_threshold else None
+        )
+        token = request_timings.set(timings)
+        started = time.perf_counter()
+
+        async def send_with_timings(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    timings.server_timing(time.perf_counter() - started),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timings)
+        finally:
+            request_timings.reset(token)
+            if timings.statements:
+                self.report_repeated_statements(scope, timings.statements)
+
+    def report_repeated_statements(self, scope: Scope, statements: Counter) -> None:
+        """
+        Log the statements of a request that ran more than the threshold.
+
+        Args:
+            scope (Scope): The ASGI scope of the request.
+            statements (Counter): Executions of each statement of the request.
+        """
+        for statement, count in statements.items():
+            if count > self.repeated_statement_threshold:
+                core_logger.warning(
+                    "Possible N+1 queries: statement ran %d times in %s %s: %s",
+                    count,
+                    scope["method"],
+                    scope["path"],
+                    " ".join(statement.split()),
+                )
@@ -0,0 +1,96 @@
+import uuid
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Row, case, delete, exists, literal, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+async def toggle_link(
+    session: AsyncSession,
+    target: InstrumentedAttribute,
+    target_filter: Any,
+    counter: InstrumentedAttribute,
+    link: InstrumentedAttribute,
+    user: InstrumentedAttribute,
+    user_id: UUID,
+    constraint: str,
+) -> Row:
+    """
+    Toggle a user's link row (e.g. a like) to a target in a single atomic statement.
+
+    The statement chains data-modifying CTEs: the target row is looked up, an existing
+    link is deleted, and only when nothing was deleted a new one is inserted with
+    ``ON CONFLICT DO NOTHING``. The denormalized counter of the target is then adjusted
+    by the rows actually deleted or inserted. Concurrent toggles from the same user
+    therefore never trip the unique constraint, and the counter update serializes them
+    on the target row.
+
+    Args:
+        session (AsyncSession): The asynchronous database session.
+        target (InstrumentedAttribute): Primary key of the target, e.g. ``BlogModel.id``.
+        target_filter (Any): Criteria the target row must match.
+        counter (InstrumentedAttribute): Counter column of the target, e.g. ``BlogModel.like_count``.
+            Its model must use :class:`TimeStampMixin`.
+        link (InstrumentedAttribute): Foreign key of the link row to the target,
+            e.g. ``LikeModel.blog_id``.
+        user (InstrumentedAttribute): User foreign key of the link row, e.g. ``LikeModel.user_id``.
+        user_id (UUID): The unique identifier of the user toggling the link.
+        constraint (str): Name of the unique constraint on ``(user, link)``.
+
+    Returns:
+        Row: ``found`` (whether the target exists), ``liked`` (the new state) and
+        ``total`` (the counter value after the toggle).
+    """
+    table = link.class_
+
+    targets = select(target.label("id")).where(target_filter).cte("targets")
+    removed = (
+        delete(table)
+        .where(user == user_id, link.in_(select(targets.c.id)))
+        .returning(table.id)
+        .cte("removed")
+    )
+    added = (
+        insert(table)
+        .from_select(
+            [table.id, user, link, table.created_at],
+            select(
+                literal(uuid.uuid4()),
+                literal(user_id),
+                targets.c.id,
+                literal(datetime.now(timezone.utc).replace(tzinfo=None)),
+            ).where(~exists(select(removed.c.id))),
+        )
+        .on_conflict_do_nothing(constraint=constraint)
+        .returning(table.id)
+        .cte("added")
+    )
+
+    # When a concurrent toggle wins the unique constraint, nothing is deleted nor
+    # inserted here and the counter is left to that toggle.
+    delta = case(
+        (exists(select(added.c.id)), 1),
+        (exists(select(removed.c.id)), -1),
+        else_=0,
+    )
+    model = counter.class_
+    counted = (
+        update(model)
+        .where(target.in_(select(targets.c.id)))
+        .values({counter.key: counter + delta, **model.preserve_updated_at()})
+        .returning(counter.label("total"))
+        .cte("counted")
+    )
+
+    result = await session.execute(
+        select(
+            exists(select(targets.c.id)).label("found"),
+            (~exists(select(removed.c.id))).label("liked"),
+            select(counted.c.total).scalar_subquery().label("total"),
+        )
+    )
+    return result.one()
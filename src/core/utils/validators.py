@@ -0,0 +1,91 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any, NamedTuple
+
+from sqlalchemy import ColumnElement, func
+
+
+class Validators(NamedTuple):
+    """
+    HTTP validators of a representation.
+
+    Attributes:
+        etag (str): The weak entity tag.
+        last_modified (datetime | None): The last edit of the rows, naive UTC.
+    """
+
+    etag: str
+    last_modified: datetime | None = None
+
+    def headers(self) -> dict[str, str]:
+        """
+        Response headers advertising the validators.
+
+        Clients must revalidate before reusing a response: counters change without
+        moving ``Last-Modified``, so only ``If-None-Match`` is used to answer ``304``.
+
+        Returns:
+            dict[str, str]: The ``ETag``, ``Last-Modified`` and ``Cache-Control`` headers.
+        """
+        headers = {"ETag": self.etag, "Cache-Control": "private, no-cache"}
+        if self.last_modified:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.replace(tzinfo=timezone.utc), usegmt=True
+            )
+        return headers
+
+
+def make_validators(last_modified: datetime | None, *state: Any) -> Validators:
+    """
+    Build the validators of a representation from the state it depends on.
+
+    Args:
+        last_modified (datetime | None): The last edit of the rows, naive UTC.
+        *state (Any): Values that change whenever the representation does, e.g. a row
+            count and a :func:`checksum`.
+
+    Returns:
+        Validators: The validators.
+    """
+    digest = hashlib.blake2b(
+        repr((last_modified, state)).encode(), digest_size=12
+    ).hexdigest()
+    return Validators(etag=f'W/"{digest}"', last_modified=last_modified)
+
+
+def checksum(*columns: ColumnElement) -> ColumnElement:
+    """
+    Aggregate summing a hash of some columns over the selected rows.
+
+    Cheaper than reading the rows, and any change of the values, or of the set of
+    rows when an id column is included, changes it.
+
+    Args:
+        *columns (ColumnElement): The columns the representation shows.
+
+    Returns:
+        ColumnElement: The aggregate, NULL when no row is selected.
+    """
+    return func.sum(func.hashtext(func.concat_ws(":", *columns)))
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """
+    Weak comparison of an entity tag with an ``If-None-Match`` header.
+
+    Args:
+        if_none_match (str): The header value, a list of entity tags or ``*``.
+        etag (str): The current entity tag.
+
+    Returns:
+        bool: True if the client already has the current representation.
+    """
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
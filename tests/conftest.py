@@ -0,0 +1,83 @@
+import uuid
+from typing import AsyncIterator
+
+import pytest
+from sqlalchemy import delete, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from database.db import async_session, engine
+from src.api.v1.blog.models import BlogModel
+from src.api.v1.user.enums import RoleEnum
+from src.api.v1.user.models import RoleModel, UserModel
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+@pytest.fixture
+async def database() -> AsyncIterator[None]:
+    """
+    Skip the test unless the configured database can be reached.
+
+    Pooled connections belong to the event loop of the test, so the pool is emptied
+    afterwards.
+    """
+    try:
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+    except (OSError, SQLAlchemyError) as error:
+        pytest.skip(f"Database unavailable: {error}")
+
+    yield
+    await engine.dispose()
+
+
+@pytest.fixture
+async def users(database) -> AsyncIterator[list[UserModel]]:
+    """
+    Twenty throwaway users, deleted with everything they own afterwards.
+    """
+    async with async_session() as session:
+        role = await session.scalar(select(RoleModel).limit(1))
+        if role is None:
+            role = RoleModel.create(name=RoleEnum.USER)
+            session.add(role)
+            await session.flush()
+
+        created = [
+            UserModel.create(
+                email=f"test-{uuid.uuid4().hex}@example.com",
+                password="not-a-hash",
+                role_id=role.id,
+            )
+            for _ in range(20)
+        ]
+        session.add_all(created)
+        await session.commit()
+
+    yield created
+
+    async with async_session() as session:
+        ids = [user.id for user in created]
+        await session.execute(delete(BlogModel).where(BlogModel.author_id.in_(ids)))
+        await session.execute(delete(UserModel).where(UserModel.id.in_(ids)))
+        await session.commit()
+
+
+@pytest.fixture
+async def blog(users) -> BlogModel:
+    """
+    A live blog written by the first user.
+    """
+    async with async_session() as session:
+        blog = BlogModel(
+            id=uuid.uuid4(),
+            name=f"Test {uuid.uuid4().hex}",
+            content="Body",
+            author_id=users[0].id,
+        )
+        session.add(blog)
+        await session.commit()
+    return blog
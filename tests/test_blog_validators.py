@@ -0,0 +1,52 @@
+import pytest
+from sqlalchemy.orm import joinedload
+
+from database.db import async_session
+from src.api.v1.blog.services.blog import BlogService
+from src.api.v1.blog.services.comment import CommentService
+from src.api.v1.blog.services.like import LikeService
+from src.api.v1.user.models import UserModel
+
+pytestmark = pytest.mark.anyio
+
+
+async def list_etag() -> str:
+    async with async_session() as session:
+        service = BlogService(session=session, read_session=session)
+        return (await service.get_all_validators()).etag
+
+
+async def write(service_class, method: str, user_id, **kwargs) -> None:
+    # One session and transaction per write, as for a request.
+    async with async_session() as session:
+        user = await session.get(
+            UserModel, user_id, options=[joinedload(UserModel.role)]
+        )
+        service = service_class(session=session, read_session=session)
+        await getattr(service, method)(user=user, **kwargs)
+        await session.commit()
+
+
+async def test_every_write_to_a_blog_changes_the_list_etag(users, blog):
+    author = users[0].id
+    etags = [await list_etag()]
+    assert await list_etag() == etags[0]
+
+    await write(LikeService, "create", author, blog_id=blog.id)
+    etags.append(await list_etag())
+
+    await write(CommentService, "create_comment", author, content="Hi", blog_id=blog.id)
+    etags.append(await list_etag())
+
+    await write(
+        BlogService, "create_blog", author, name=f"Test {blog.id}", content="Body"
+    )
+    etags.append(await list_etag())
+
+    async with async_session() as session:
+        service = BlogService(session=session, read_session=session)
+        await service.delete_by_id(blog.id)
+        await session.commit()
+    etags.append(await list_etag())
+
+    assert len(set(etags)) == len(etags)
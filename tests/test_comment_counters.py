@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import joinedload
+
+from database.db import async_session
+from src.api.v1.blog.exceptions import ParentCommentNotFoundException
+from src.api.v1.blog.models import BlogModel, CommentModel
+from src.api.v1.blog.services.comment import CommentService
+from src.api.v1.user.models import UserModel
+
+pytestmark = pytest.mark.anyio
+
+
+async def run(method: str, user_id, **kwargs):
+    # One session and transaction per call, as for a request.
+    async with async_session() as session:
+        user = await session.scalar(
+            select(UserModel)
+            .options(joinedload(UserModel.role))
+            .where(UserModel.id == user_id)
+        )
+        service = CommentService(session=session, read_session=session)
+        result = await getattr(service, method)(user=user, **kwargs)
+        await session.commit()
+    return result
+
+
+async def comment_state(blog_id) -> tuple[int, int]:
+    async with async_session() as session:
+        counter = await session.scalar(
+            select(BlogModel.comment_count).where(BlogModel.id == blog_id)
+        )
+        rows = await session.scalar(
+            select(func.count()).where(CommentModel.blog_id == blog_id)
+        )
+    return counter, rows
+
+
+async def test_replies_racing_the_removal_of_their_parent(users, blog):
+    author = users[0].id
+
+    for _ in range(20):
+        parent = await run("create_comment", author, content="Parent", blog_id=blog.id)
+
+        results = await asyncio.gather(
+            *(
+                run(
+                    "create_comment",
+                    user.id,
+                    content="Reply",
+                    blog_id=blog.id,
+                    parent_comment_id=parent.id,
+                )
+                for user in users[1:4]
+            ),
+            run("remove_comment", author, comment_id=parent.id),
+            return_exceptions=True,
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                assert isinstance(result, ParentCommentNotFoundException)
+
+    counter, rows = await comment_state(blog.id)
+    assert rows == 0
+    assert counter == rows
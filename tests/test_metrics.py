@@ -0,0 +1,40 @@
+import threading
+
+import pytest
+
+from src.core.metrics import MetricsRegistry
+
+pytestmark = pytest.mark.anyio
+
+
+class Registry(MetricsRegistry):
+    """
+    Registry recording the threads that take and write its snapshots.
+    """
+
+    def __init__(self, directory: str) -> None:
+        super().__init__(directory=directory)
+        self.snapshot_threads: list[threading.Thread] = []
+        self.flush_threads: list[threading.Thread] = []
+
+    def snapshot(self):
+        self.snapshot_threads.append(threading.current_thread())
+        return super().snapshot()
+
+    def flush(self, snapshot=None) -> None:
+        self.flush_threads.append(threading.current_thread())
+        super().flush(snapshot)
+
+
+async def test_render_async_only_snapshots_on_the_loop(tmp_path):
+    registry = Registry(directory=str(tmp_path))
+    registry.describe("requests_total", "counter", "Requests.")
+    registry.inc("requests_total", 3)
+
+    text = await registry.render_async()
+
+    loop_thread = threading.current_thread()
+    assert registry.snapshot_threads == [loop_thread]
+    assert registry.flush_threads and loop_thread not in registry.flush_threads
+    assert "requests_total 3" in text
+    assert text == registry.render()
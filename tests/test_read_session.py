@@ -0,0 +1,32 @@
+import pytest
+from sqlalchemy import select
+
+from database.db import engine, primary_read_session
+from src.api.v1.blog.models import BlogModel
+
+pytestmark = pytest.mark.anyio
+
+QUERY = select(BlogModel.id).limit(1)
+
+
+@pytest.mark.parametrize("method", ["execute", "scalar", "scalars"])
+async def test_reads_release_the_connection(database, method):
+    async with primary_read_session() as session:
+        await getattr(session, method)(QUERY)
+
+        assert engine.pool.checkedout() == 0
+
+
+async def test_get_releases_the_connection(blog):
+    async with primary_read_session() as session:
+        found = await session.get(BlogModel, blog.id)
+
+        assert engine.pool.checkedout() == 0
+        assert found.name == blog.name
+
+
+@pytest.mark.parametrize("method", ["stream", "stream_scalars"])
+async def test_streaming_is_refused(database, method):
+    async with primary_read_session() as session:
+        with pytest.raises(NotImplementedError):
+            await getattr(session, method)(QUERY)
@@ -0,0 +1,116 @@
+import asyncio
+
+import pytest
+
+from src.core.cache import ReadThroughCache
+
+pytestmark = pytest.mark.anyio
+
+
+class Loader:
+    """
+    Load function that blocks until released and counts its calls.
+    """
+
+    def __init__(self, value="value") -> None:
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+async def settled(awaitable):
+    # A broken cache leaves lookups waiting forever; fail instead.
+    return await asyncio.wait_for(awaitable, timeout=1)
+
+
+def make_cache(negative_ttl: float = 60) -> ReadThroughCache:
+    return ReadThroughCache(maxsize=10, ttl=60, negative_ttl=negative_ttl)
+
+
+async def test_concurrent_misses_share_one_load():
+    cache, load = make_cache(), Loader()
+
+    lookups = asyncio.gather(*(cache.get_or_load("key", load) for _ in range(10)))
+    await asyncio.sleep(0)
+    load.release.set()
+
+    assert await settled(lookups) == ["value"] * 10
+    assert load.calls == 1
+    assert (cache.misses, cache.hits) == (1, 9)
+    assert await settled(cache.get_or_load("key", load)) == "value"
+    assert load.calls == 1
+
+
+async def test_missing_keys_are_cached_for_the_negative_ttl():
+    cache, load = make_cache(negative_ttl=0.05), Loader(value=None)
+    load.release.set()
+
+    assert await settled(cache.get_or_load("key", load)) is None
+    assert await settled(cache.get_or_load("key", load)) is None
+    assert load.calls == 1
+
+    await asyncio.sleep(0.1)
+    assert await settled(cache.get_or_load("key", load)) is None
+    assert load.calls == 2
+
+
+async def test_waiters_load_again_when_the_loading_lookup_is_cancelled():
+    cache, load = make_cache(), Loader()
+
+    first = asyncio.ensure_future(cache.get_or_load("key", load))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(cache.get_or_load("key", load))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    load.release.set()
+
+    assert await settled(second) == "value"
+    assert first.cancelled()
+    assert load.calls == 2
+    assert cache["key"] == "value"
+    assert not cache.loading
+
+
+async def test_discard_during_a_load_drops_its_result():
+    cache, load = make_cache(), Loader(value="outdated")
+
+    lookup = asyncio.ensure_future(cache.get_or_load("key", load))
+    await asyncio.sleep(0)
+    cache.discard("key")
+    load.release.set()
+
+    assert await settled(lookup) == "outdated"
+    assert "key" not in cache
+    assert not cache.loading
+
+    load.value = "fresh"
+    assert await settled(cache.get_or_load("key", load)) == "fresh"
+    assert load.calls == 2
+
+
+async def test_a_failed_load_is_shared_and_not_cached():
+    cache, load = make_cache(), Loader(value=RuntimeError("database down"))
+
+    lookups = asyncio.gather(
+        *(cache.get_or_load("key", load) for _ in range(3)), return_exceptions=True
+    )
+    await asyncio.sleep(0)
+    load.release.set()
+
+    errors = await settled(lookups)
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert load.calls == 1
+    assert not cache.loading
+    assert "key" not in cache and "key" not in cache.missing
+
+    load.value = "value"
+    assert await settled(cache.get_or_load("key", load)) == "value"
+    assert load.calls == 2
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+from starlette.requests import Request
+
+from database.db import (
+    READ_YOUR_WRITES_COOKIE,
+    ReadYourWritesMiddleware,
+    ReplicaRouter,
+    written_at,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class Router(ReplicaRouter):
+    def __init__(self, lag: float | None) -> None:
+        super().__init__(
+            engine=object(), max_lag=5, lag_check_interval=1, read_your_writes_seconds=2
+        )
+        self.lag = lag
+
+    async def replica_lag(self) -> float | None:
+        return self.lag
+
+
+def request(cookie: str | None = None) -> Request:
+    headers = [(b"cookie", cookie.encode())] if cookie else []
+    return Request({"type": "http", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "lag, written, expected",
+    [
+        (0.1, None, True),
+        (None, None, False),
+        (6.0, None, False),
+        (0.1, 1.0, False),
+        (0.1, 2.5, True),
+        (3.0, 2.5, False),
+        (3.0, 3.5, True),
+    ],
+)
+async def test_use_replica(lag, written, expected):
+    written_at_value = None if written is None else time.time() - written
+
+    assert await Router(lag).use_replica(written_at_value) is expected
+
+
+async def test_reads_use_the_primary_without_replica():
+    router = ReplicaRouter(
+        engine=None, max_lag=5, lag_check_interval=1, read_your_writes_seconds=2
+    )
+
+    assert not await router.use_replica(None)
+
+
+@pytest.mark.parametrize(
+    "cookie, expected",
+    [
+        (None, None),
+        (f"{READ_YOUR_WRITES_COOKIE}=1792214956.5", 1792214956.5),
+        (f"{READ_YOUR_WRITES_COOKIE}=soon", None),
+        ("other=1", None),
+    ],
+)
+def test_written_at(cookie, expected):
+    assert written_at(request(cookie)) == expected
+
+
+@pytest.mark.parametrize("wrote", [False, True])
+async def test_middleware_sets_the_cookie_after_writes(wrote):
+    async def app(scope, receive, send):
+        if wrote:
+            scope.setdefault("state", {})["written_at"] = 1792214956.5
+        await send({"type": "http.response.start", "status": 201, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    messages = []
+
+    async def send(message):
+        messages.append(message)
+
+    await ReadYourWritesMiddleware(app)({"type": "http"}, None, send)
+
+    cookies = [value for name, value in messages[0]["headers"] if name == b"set-cookie"]
+    if wrote:
+        assert cookies[0].startswith(f"{READ_YOUR_WRITES_COOKIE}=1792214956.5".encode())
+    else:
+        assert not cookies
@@ -0,0 +1,72 @@
+from src.core.cache import ResponseCache
+
+
+def make_cache(maxsize: int = 100) -> ResponseCache:
+    return ResponseCache(maxsize=maxsize, ttl=60)
+
+
+def test_evict_drops_only_the_tagged_responses():
+    cache = make_cache()
+    cache.store("list", b"[]", ["blogs", "blog:1", "blog:2"], cache.generation)
+    cache.store("one", b"{}", ["blog:1"], cache.generation)
+    cache.store("two", b"{}", ["blog:2"], cache.generation)
+
+    assert cache.evict(["blog:1"]) == 2
+
+    assert cache.lookup("list") is None
+    assert cache.lookup("one") is None
+    assert cache.lookup("two").body == b"{}"
+    assert "blog:1" not in cache.tagged
+
+
+def test_evict_of_unknown_tags_keeps_everything():
+    cache = make_cache()
+    cache.store("one", b"{}", ["blog:1"], cache.generation)
+
+    assert cache.evict(["blog:3"]) == 0
+    assert cache.lookup("one") is not None
+
+
+def test_responses_built_before_an_eviction_are_not_stored():
+    cache = make_cache()
+    generation = cache.generation
+
+    cache.evict(["blog:1"])
+
+    assert not cache.store("one", b"{}", ["blog:2"], generation)
+    assert cache.lookup("one") is None
+
+
+def test_storing_again_replaces_the_tags():
+    cache = make_cache()
+    cache.store("one", b"old", ["blog:1"], cache.generation)
+    cache.store("one", b"new", ["blog:2"], cache.generation)
+
+    cache.evict(["blog:1"])
+
+    assert cache.lookup("one").body == b"new"
+
+
+def test_entries_dropped_when_full_or_expired_are_untagged():
+    cache = make_cache(maxsize=1)
+    cache.store("one", b"{}", ["blog:1"], cache.generation)
+    cache.store("two", b"{}", ["blog:2"], cache.generation)
+
+    assert "blog:1" not in cache.tagged
+
+    cache.expire(cache.timer() + 3600)
+
+    assert len(cache) == 0
+    assert not cache.tagged
+
+
+def test_clear_drops_everything_and_cancels_stores_in_progress():
+    cache = make_cache()
+    generation = cache.generation
+    cache.store("one", b"{}", ["blog:1"], generation)
+
+    cache.clear()
+
+    assert len(cache) == 0
+    assert not cache.tagged
+    assert not cache.store("two", b"{}", ["blog:2"], generation)
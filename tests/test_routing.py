@@ -0,0 +1,137 @@
+import json
+import uuid
+from datetime import datetime
+from typing import Annotated
+
+import httpx
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, Request
+
+from database.db import READ_YOUR_WRITES_COOKIE
+from src.api.v1.blog.models.blogs import BlogModel
+from src.api.v1.blog.schemas.response import BlogResponse
+from src.core.cache import ResponseCache
+from src.core.utils.routing import (
+    RawJSON,
+    ResponseSerializer,
+    SerializedRoute,
+    cache_response,
+)
+from src.core.utils.schema import BaseResponse
+
+NOW = datetime(2026, 10, 17, 5, 6, 7)
+
+
+def blog_fields() -> dict:
+    return dict(
+        id=uuid.uuid4(),
+        name="Blog",
+        author_id=uuid.uuid4(),
+        like_count=2,
+        comment_count=3,
+        created_at=NOW,
+        updated_at=NOW,
+    )
+
+
+def test_orm_objects_serialize_like_the_response_model():
+    fields = blog_fields()
+    serialize = ResponseSerializer(BaseResponse[BlogResponse])
+
+    assert serialize(BaseResponse(data=BlogModel(**fields))) == serialize(
+        BaseResponse(data=BlogResponse(**fields))
+    )
+
+
+def test_attributes_missing_from_the_instance_dict_are_read():
+    fields = blog_fields()
+
+    class Counted:
+        """Object whose counters are computed, as loaded ORM attributes may be."""
+
+        def __init__(self) -> None:
+            for name in ("id", "name", "author_id", "created_at", "updated_at"):
+                setattr(self, name, fields[name])
+
+        like_count = property(lambda self: fields["like_count"])
+        comment_count = property(lambda self: fields["comment_count"])
+
+    body = json.loads(
+        ResponseSerializer(BaseResponse[BlogResponse])(BaseResponse(data=Counted()))
+    )
+
+    assert body["data"]["likeCount"] == 2
+    assert body["data"]["commentCount"] == 3
+
+
+def test_envelope_and_raw_json():
+    serialize = ResponseSerializer(BaseResponse[list[BlogResponse]])
+
+    assert json.loads(serialize(BaseResponse(data=RawJSON(b"[]"), code=201))) == {
+        "status": "SUCCESS",
+        "code": 201,
+        "data": [],
+    }
+    assert json.loads(serialize(BaseResponse(data=None))) == {
+        "status": "SUCCESS",
+        "code": 200,
+        "data": None,
+    }
+
+
+def reads_from_primary(request: Request) -> bool:
+    return getattr(request.state, "read_from_primary", False)
+
+
+def cached_app() -> tuple[FastAPI, list[bool]]:
+    """
+    App with a cached and an uncached route, recording where each call would read.
+    """
+    calls: list[bool] = []
+
+    class Route(SerializedRoute):
+        cache = ResponseCache(maxsize=10, ttl=60)
+
+    router = APIRouter(route_class=Route)
+
+    @router.get("/cached")
+    @cache_response(key=lambda _: "key", tags=lambda *_: ["tag"])
+    async def cached(
+        primary: Annotated[bool, Depends(reads_from_primary)],
+    ) -> BaseResponse[bool]:
+        calls.append(primary)
+        return BaseResponse(data=primary)
+
+    @router.get("/uncached")
+    async def uncached(
+        primary: Annotated[bool, Depends(reads_from_primary)],
+    ) -> BaseResponse[bool]:
+        calls.append(primary)
+        return BaseResponse(data=primary)
+
+    app = FastAPI()
+    app.include_router(router)
+    return app, calls
+
+
+@pytest.mark.anyio
+async def test_cached_responses_are_built_from_the_primary():
+    app, calls = cached_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        await client.get("/cached")
+        await client.get("/uncached")
+
+    assert calls == [True, False]
+
+
+@pytest.mark.anyio
+async def test_clients_that_wrote_recently_are_not_served_cached_responses():
+    app, calls = cached_app()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        await client.get("/cached")
+        await client.get("/cached")
+        await client.get("/cached", cookies={READ_YOUR_WRITES_COOKIE: "1.0"})
+
+    assert len(calls) == 2
@@ -0,0 +1,55 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from database.db import async_session
+from src.api.v1.blog.models import BlogModel, LikeModel
+from src.api.v1.blog.services.like import LikeService
+
+pytestmark = pytest.mark.anyio
+
+
+async def toggle(user, blog_id) -> None:
+    # One session and transaction per toggle, as for a request.
+    async with async_session() as session:
+        await LikeService(session=session, read_session=session).create(
+            user=user, blog_id=blog_id
+        )
+        await session.commit()
+
+
+async def like_state(blog_id) -> tuple[int, int]:
+    async with async_session() as session:
+        counter = await session.scalar(
+            select(BlogModel.like_count).where(BlogModel.id == blog_id)
+        )
+        rows = await session.scalar(
+            select(func.count()).where(LikeModel.blog_id == blog_id)
+        )
+    return counter, rows
+
+
+async def test_concurrent_toggles_of_different_users(users, blog):
+    await asyncio.gather(*(toggle(user, blog.id) for user in users))
+
+    assert await like_state(blog.id) == (len(users), len(users))
+
+
+async def test_concurrent_toggles_of_the_same_user(users, blog):
+    await asyncio.gather(*(toggle(users[0], blog.id) for _ in range(25)))
+
+    counter, rows = await like_state(blog.id)
+    assert rows in (0, 1)
+    assert counter == rows
+
+
+async def test_concurrent_mixed_toggles(users, blog):
+    await asyncio.gather(
+        *(toggle(user, blog.id) for user in users[:10] for _ in range(5)),
+        *(toggle(user, blog.id) for user in users[10:]),
+    )
+
+    counter, rows = await like_state(blog.id)
+    assert rows >= len(users[10:])
+    assert counter == rows
@@ -0,0 +1,52 @@
+from datetime import datetime
+
+import pytest
+
+from src.core.utils.validators import etag_matches, make_validators
+
+EDITED = datetime(2026, 10, 17, 5, 6, 7)
+
+
+def test_validators_are_weak_and_stable():
+    validators = make_validators(EDITED, 3, 42)
+
+    assert validators.etag.startswith('W/"')
+    assert validators == make_validators(EDITED, 3, 42)
+
+
+@pytest.mark.parametrize(
+    "other",
+    [
+        (EDITED, 4, 42),
+        (EDITED, 3, 43),
+        (datetime(2026, 10, 17, 5, 6, 8), 3, 42),
+        (None, 3, 42),
+    ],
+)
+def test_any_change_of_state_changes_the_etag(other):
+    assert make_validators(*other).etag != make_validators(EDITED, 3, 42).etag
+
+
+def test_headers():
+    headers = make_validators(EDITED, 1).headers()
+
+    assert headers["Last-Modified"] == "Sat, 17 Oct 2026 05:06:07 GMT"
+    assert headers["Cache-Control"] == "private, no-cache"
+    assert "Last-Modified" not in make_validators(None, 1).headers()
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        ('W/"abc"', True),
+        ('"abc"', True),
+        ('W/"other", W/"abc"', True),
+        ('  W/"abc"  ', True),
+        ("*", True),
+        ('W/"other"', False),
+        ('W/"ab"', False),
+        ("", False),
+    ],
+)
+def test_etag_matches_uses_weak_comparison(if_none_match, expected):
+    assert etag_matches(if_none_match, 'W/"abc"') is expected